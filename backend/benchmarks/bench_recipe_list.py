@@ -0,0 +1,78 @@
+"""Throughput de uma lista de 1.000 receitas: response_model (Pydantic) x caminho rápido (orjson).
+
+Roda o app em processo (sem rede nem banco): o repositório é trocado por um falso
+que devolve sempre as mesmas receitas, então só a serialização muda entre os modos.
+
+    PYTHONPATH=. python benchmarks/bench_recipe_list.py [--requests 200]
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+
+from httpx import ASGITransport, AsyncClient
+
+from petfit.api import deps
+from petfit.api.main import app
+from petfit.api.routes import recipe_route
+from petfit.api.settings import settings
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.entities.user import User
+from petfit.domain.value_objects.email_vo import Email
+from petfit.domain.value_objects.password import Password
+
+RECIPES = [
+    Recipe(
+        str(uuid.uuid4()),
+        f"Receita {i}",
+        ["frango", "arroz", "cenoura", "azeite", "sal"],
+        ["Corte os ingredientes", "Cozinhe por 20 minutos", "Sirva"],
+        True,
+        datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    for i in range(1000)
+]
+USER = User("bench", "Bench", Email("bench@example.com"), Password("$2b$12$hash", hashed=True))
+
+
+class FixedRecipeRepository:
+    async def get_user_favorite_recipes(self, user, fields=None):
+        return RECIPES
+
+
+async def fixed_recipe_repository(db):
+    return FixedRecipeRepository()
+
+
+async def run(client: AsyncClient, requests: int) -> float:
+    headers = {"Authorization": "Bearer bench"}
+    await client.get("/recipes/users/me/favorites/recipes", headers=headers) # aquecimento
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get("/recipes/users/me/favorites/recipes", headers=headers)
+        assert response.status_code == 200 and len(response.json()) == len(RECIPES)
+    return requests / (time.perf_counter() - start)
+
+
+async def main(requests: int) -> None:
+    recipe_route.get_recipe_repository = fixed_recipe_repository
+    app.dependency_overrides[deps.get_db_session] = lambda: None
+    app.dependency_overrides[deps.get_current_user] = lambda: USER
+    # Sem compressão: o middleware de gzip/brotli não entra na medida, só a serialização
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench", headers={"Accept-Encoding": "identity"}
+    ) as client:
+        results = {}
+        for fast in (False, True):
+            settings.FAST_JSON_ENABLED = fast
+            results[fast] = await run(client, requests)
+    print(f"response_model (Pydantic): {results[False]:8.1f} req/s")
+    print(f"caminho rápido (orjson):   {results[True]:8.1f} req/s  ({results[True] / results[False]:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    asyncio.run(main(parser.parse_args().requests))
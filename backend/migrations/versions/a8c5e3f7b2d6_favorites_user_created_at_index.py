@@ -0,0 +1,31 @@
+"""favorites user created_at index
+
+Revision ID: a8c5e3f7b2d6
+Revises: f3b7d1e9a2c4
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c5e3f7b2d6'
+down_revision: Union[str, Sequence[str], None] = 'f3b7d1e9a2c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_user_favorite_recipes_user_created_at', 'user_favorite_recipes',
+        ['user_id', 'created_at', 'recipe_id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_favorite_recipes_user_created_at', table_name='user_favorite_recipes')
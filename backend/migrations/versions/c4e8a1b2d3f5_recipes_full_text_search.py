@@ -0,0 +1,54 @@
+"""recipes full text search
+
+Revision ID: c4e8a1b2d3f5
+Revises: b7d2e9f0a1c3
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1b2d3f5'
+down_revision: Union[str, Sequence[str], None] = 'b7d2e9f0a1c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Copiados do modelo no momento da migração (não importar o modelo aqui)
+ARRAY_TO_TEXT_FUNCTION_DDL = """
+CREATE OR REPLACE FUNCTION petfit_array_to_text(character varying[]) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE
+AS $$ SELECT coalesce(array_to_string($1, ' '), '') $$
+"""
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('portuguese', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('portuguese', petfit_array_to_text(ingredients)), 'B') || "
+    "setweight(to_tsvector('portuguese', petfit_array_to_text(instructions)), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(ARRAY_TO_TEXT_FUNCTION_DDL)
+    op.add_column(
+        'recipes',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index('ix_recipes_search_vector', 'recipes', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_recipes_search_vector', table_name='recipes', postgresql_using='gin')
+    op.drop_column('recipes', 'search_vector')
+    op.execute('DROP FUNCTION IF EXISTS petfit_array_to_text(character varying[])')
@@ -0,0 +1,51 @@
+"""recipes normalized ingredients
+
+Revision ID: d9b3f6a7c8e1
+Revises: c4e8a1b2d3f5
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9b3f6a7c8e1'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a1b2d3f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Copiado do modelo no momento da migração (não importar o modelo aqui)
+NORMALIZE_INGREDIENTS_FUNCTION_DDL = """
+CREATE OR REPLACE FUNCTION petfit_normalize_ingredients(character varying[]) RETURNS text[]
+LANGUAGE sql IMMUTABLE PARALLEL SAFE
+AS $$ SELECT coalesce(ARRAY(SELECT lower(btrim(item)) FROM unnest($1) AS item), '{}') $$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(NORMALIZE_INGREDIENTS_FUNCTION_DDL)
+    op.add_column(
+        'recipes',
+        sa.Column(
+            'ingredients_normalized',
+            postgresql.ARRAY(sa.Text()),
+            sa.Computed('petfit_normalize_ingredients(ingredients)', persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_recipes_ingredients_normalized', 'recipes', ['ingredients_normalized'],
+        unique=False, postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_recipes_ingredients_normalized', table_name='recipes', postgresql_using='gin')
+    op.drop_column('recipes', 'ingredients_normalized')
+    op.execute('DROP FUNCTION IF EXISTS petfit_normalize_ingredients(character varying[])')
@@ -0,0 +1,50 @@
+"""recipes favorite count
+
+Revision ID: e6a4c2d8f1b9
+Revises: d9b3f6a7c8e1
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a4c2d8f1b9'
+down_revision: Union[str, Sequence[str], None] = 'd9b3f6a7c8e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('recipes', sa.Column('favorite_count', sa.Integer(), server_default='0', nullable=False))
+    op.create_table(
+        'recipe_favorite_count_shards',
+        sa.Column('recipe_id', sa.String(), nullable=False),
+        sa.Column('shard', sa.SmallInteger(), nullable=False),
+        sa.Column('delta', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['recipe_id'], ['recipes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('recipe_id', 'shard'),
+    )
+    # Parte dos favoritos já existentes
+    op.execute(
+        """
+        UPDATE recipes SET favorite_count = counts.total
+        FROM (SELECT recipe_id, count(*) AS total FROM user_favorite_recipes GROUP BY recipe_id) AS counts
+        WHERE recipes.id = counts.recipe_id
+        """
+    )
+    op.create_index(
+        'ix_recipes_public_favorite_count_id', 'recipes', ['favorite_count', 'id'],
+        unique=False, postgresql_where=sa.text('is_public'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_recipes_public_favorite_count_id', table_name='recipes', postgresql_where=sa.text('is_public'))
+    op.drop_table('recipe_favorite_count_shards')
+    op.drop_column('recipes', 'favorite_count')
@@ -0,0 +1,51 @@
+"""favorites created_at and trending scores
+
+Revision ID: f3b7d1e9a2c4
+Revises: e6a4c2d8f1b9
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b7d1e9a2c4'
+down_revision: Union[str, Sequence[str], None] = 'e6a4c2d8f1b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Favoritos antigos não têm data: ficam com a da migração (e não entram nas tendências)
+    op.add_column(
+        'user_favorite_recipes',
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    )
+    op.create_table(
+        'recipe_favorite_events',
+        sa.Column('id', sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column('recipe_id', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['recipe_id'], ['recipes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_table(
+        'recipe_trending_scores',
+        sa.Column('recipe_id', sa.String(), nullable=False),
+        sa.Column('log_score', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['recipe_id'], ['recipes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('recipe_id'),
+    )
+    op.create_index('ix_recipe_trending_scores_log_score', 'recipe_trending_scores', ['log_score'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_recipe_trending_scores_log_score', table_name='recipe_trending_scores')
+    op.drop_table('recipe_trending_scores')
+    op.drop_table('recipe_favorite_events')
+    op.drop_column('user_favorite_recipes', 'created_at')
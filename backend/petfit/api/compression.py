@@ -0,0 +1,178 @@
+# petfit/api/compression.py
+
+import gzip
+import zlib
+from typing import Hashable, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from petfit.api.content_encoding import choose_encoding
+from petfit.api.http_cache import encoded_etag
+from petfit.infra.cache.lru_ttl_cache import LRUTTLCache
+
+try: # brotli é opcional: sem ele, só gzip é negociado
+    import brotli
+except ImportError: # pragma: no cover
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+def available_encodings() -> List[str]:
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def compress(body: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 5) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class StreamCompressor:
+    """Compressão incremental: cada pedaço sai comprimido e com flush, sem esperar o fim do stream."""
+
+    def __init__(self, encoding: str, gzip_level: int = 6, brotli_quality: int = 5):
+        if encoding == "br":
+            brotli_compressor = brotli.Compressor(quality=brotli_quality)
+            self._process = lambda chunk: brotli_compressor.process(chunk) + brotli_compressor.flush()
+            self._finish = brotli_compressor.finish
+        else:
+            zlib_compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31) # wbits=31: formato gzip
+            self._process = lambda chunk: zlib_compressor.compress(chunk) + zlib_compressor.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = lambda: zlib_compressor.flush(zlib.Z_FINISH)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._process(chunk)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+class CompressionMiddleware:
+    """Comprime respostas JSON/NDJSON/texto com gzip ou brotli, conforme o Accept-Encoding.
+
+    - Respostas completas abaixo de `minimum_size` bytes saem como estão.
+    - Respostas em streaming (NDJSON/CSV) são comprimidas pedaço a pedaço.
+    - Respostas com ETag têm o corpo comprimido guardado em `cache`, pela chave
+      (codificação, caminho, query, ETag): o mesmo payload não é comprimido duas vezes.
+    - O ETag de uma resposta comprimida ganha o sufixo da codificação (ver encoded_etag).
+    - Respostas que já têm Content-Encoding (ex: snapshot do feed) não são tocadas.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        cache: Optional[LRUTTLCache[Hashable, bytes]] = None,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache = cache
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"), available_encodings())
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(self, scope, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    def __init__(self, middleware: CompressionMiddleware, scope: Scope, encoding: str, send: Send):
+        self.middleware = middleware
+        self.scope = scope
+        self.encoding = encoding
+        self._send = send
+        self._start: Message = {} # o http.response.start sempre chega antes do corpo
+        self._mode = "pending" # pending -> passthrough | stream (com _compressor)
+        self._compressor: Optional[StreamCompressor] = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            if (
+                "content-encoding" in headers
+                or message["status"] < 200
+                or message["status"] in (204, 304)
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            ):
+                self._mode = "passthrough"
+                await self._send(message)
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self._mode == "passthrough":
+            await self._send(message)
+        elif self._compressor is not None:
+            await self._send_stream_chunk(self._compressor, message)
+        elif message.get("more_body", False):
+            # Primeiro pedaço de um stream: tamanho final desconhecido, comprime incrementalmente
+            self._mode = "stream"
+            self._compressor = StreamCompressor(
+                self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality
+            )
+            headers = MutableHeaders(scope=self._start)
+            del headers["content-length"]
+            self._set_encoding_headers(headers)
+            await self._send(self._start)
+            await self._send_stream_chunk(self._compressor, message)
+        else:
+            await self._send_complete(message.get("body", b""))
+
+    async def _send_stream_chunk(self, compressor: StreamCompressor, message: Message) -> None:
+        more_body = message.get("more_body", False)
+        body = compressor.compress(message.get("body", b""))
+        if not more_body:
+            body += compressor.finish()
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _send_complete(self, body: bytes) -> None:
+        headers = MutableHeaders(scope=self._start)
+        if len(body) < self.middleware.minimum_size:
+            _add_vary(headers)
+            await self._send(self._start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        compressed = self._compressed(body, headers.get("etag"))
+        headers["content-length"] = str(len(compressed))
+        self._set_encoding_headers(headers)
+        await self._send(self._start)
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    def _compressed(self, body: bytes, etag: Optional[str]) -> bytes:
+        cache = self.middleware.cache
+        if cache is None or etag is None:
+            return compress(body, self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+        key = (self.encoding, self.scope["path"], self.scope.get("query_string", b""), etag)
+        compressed = cache.get(key)
+        if compressed is None:
+            compressed = compress(body, self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+            cache.set(key, compressed)
+        return compressed
+
+    def _set_encoding_headers(self, headers: MutableHeaders) -> None:
+        headers["content-encoding"] = self.encoding
+        if "etag" in headers:
+            headers["etag"] = encoded_etag(headers["etag"], self.encoding)
+        _add_vary(headers)
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    # O snapshot do feed já declara Vary: Accept-Encoding; não repete o valor
+    if "accept-encoding" not in headers.get("vary", "").lower():
+        headers.add_vary_header("Accept-Encoding")
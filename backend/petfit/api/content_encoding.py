@@ -0,0 +1,34 @@
+# petfit/api/content_encoding.py
+
+from typing import Dict, Iterable, Optional
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """Lê o Accept-Encoding como {codificação: q}; `q=0` significa recusada."""
+    encodings: Dict[str, float] = {}
+    for item in (accept_encoding or "").split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        encodings[name] = q
+    return encodings
+
+
+def choose_encoding(accept_encoding: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """A codificação disponível com maior q aceita pelo cliente (na ordem de `available` no empate)."""
+    encodings = accepted_encodings(accept_encoding)
+    best, best_q = None, 0.0
+    for name in available:
+        q = encodings.get(name, encodings.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
@@ -6,6 +6,7 @@ from fastapi.security import OAuth2PasswordBearer, HTTPBearer, HTTPAuthorization
 from jose import JWTError, jwt
 from petfit.api.settings import settings
 from petfit.domain.repositories.user_repository import UserRepository
+from petfit.domain.repositories.recipe_repository import RecipeRepository
 from petfit.infra.repositories.sqlalchemy.sqlachemy_user_repository import (
     SQLAlchemyUserRepository,
 )
@@ -15,33 +16,179 @@ from petfit.infra.repositories.sqlalchemy.sqlalchemy_recipe_repository import (
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from petfit.infra.database import async_session
+from petfit.infra.unit_of_work import SQLAlchemyUnitOfWork
 from petfit.domain.entities.user import User
-from collections.abc import AsyncGenerator
+from petfit.domain.services.password_hasher import PasswordHasher
+from petfit.infra.password_hasher import ThreadPoolPasswordHasher
+from petfit.infra.cache.principal_cache import PrincipalCache
+from petfit.infra.cache.lru_ttl_cache import LRUTTLCache
+from petfit.infra.repositories.cached.caching_recipe_repository import CachingRecipeRepository
+from petfit.infra.repositories.cached.coalescing_recipe_repository import CoalescingRecipeRepository
+from petfit.infra.cache.single_flight import SingleFlight
+from petfit.infra.cache.ingredient_index import IngredientIndex
+from petfit.infra.cache.trending_ranking import TrendingRanking
+from petfit.domain.services.trending import TrendingDecay
+from petfit.infra.repositories.cached.indexing_recipe_repository import IngredientIndexingRecipeRepository
+from petfit.infra.repositories.cached.notifying_recipe_repository import PublicChangeNotifyingRecipeRepository
+from petfit.api.feed_snapshot import (
+    PUBLIC_FEED_LIMIT,
+    FeedSnapshotPublisher,
+    FeedSnapshotReader,
+    render_feed,
+    write_snapshot,
+)
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 
 
-# Dependência para obter a sessão do banco de dados
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+# Sessão do banco da requisição: fica aberta até a resposta terminar de ser enviada
+# (as respostas em streaming continuam lendo dela depois que o endpoint retorna)
+async def open_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         yield session
 
 
+# Dependência para obter a sessão do banco de dados, dentro da unidade de trabalho da requisição:
+# os repositórios só fazem flush e o COMMIT é um só, ao fim do endpoint (rollback se ele falhar).
+# Use sempre com scope="function", para o commit acontecer antes de a resposta ser enviada.
+async def get_db_session(
+    session: AsyncSession = Depends(open_db_session),
+) -> AsyncGenerator[AsyncSession, None]:
+    async with SQLAlchemyUnitOfWork(session):
+        yield session
+
+
+# Cache em processo do usuário autenticado (por id + iat do token)
+principal_cache = PrincipalCache(
+    max_size=settings.AUTH_CACHE_MAX_SIZE,
+    ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS,
+)
+
+
 # Dependência para obter a instância do repositório de usuários
 async def get_user_repository(
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
 ) -> SQLAlchemyUserRepository:
-    return SQLAlchemyUserRepository(db)
+    return SQLAlchemyUserRepository(
+        db, principal_cache=principal_cache, unit_of_work=SQLAlchemyUnitOfWork.of(db)
+    )
+
+
+# Cache de leituras de receitas compartilhado entre as requisições deste worker
+recipe_cache: LRUTTLCache = LRUTTLCache(
+    max_size=settings.RECIPE_CACHE_MAX_SIZE,
+    ttl_seconds=settings.RECIPE_CACHE_TTL_SECONDS,
+)
+
+# Corpos já comprimidos (gzip/brotli) das respostas com ETag, usados pelo CompressionMiddleware
+compressed_body_cache: LRUTTLCache = LRUTTLCache(
+    max_size=settings.COMPRESSION_CACHE_MAX_SIZE,
+    ttl_seconds=settings.COMPRESSION_CACHE_TTL_SECONDS,
+)
+
+# Leituras idênticas em andamento neste worker compartilham uma única consulta
+recipe_single_flight = SingleFlight()
+
+
+@asynccontextmanager
+async def open_flight_recipe_repository() -> AsyncIterator[RecipeRepository]:
+    """Repositório da consulta compartilhada pelo single-flight, numa sessão só dela.
+
+    A sessão da requisição que disparou a consulta pode fechar (cliente desconectou)
+    enquanto as outras ainda aguardam o resultado.
+    """
+    async with async_session() as session:
+        yield SQLAlchemyRecipeRepository(session)
+
+
+# Índice de prefixos dos ingredientes (autocomplete), atualizado pelas escritas de receitas
+ingredient_index = IngredientIndex()
+
+
+async def rebuild_ingredient_index() -> None:
+    """Reconstrói o índice de ingredientes a partir das receitas públicas do banco."""
+    async with async_session() as session:
+        repository = SQLAlchemyRecipeRepository(session)
+        await ingredient_index.rebuild(
+            repository.stream_recipes(is_public=True, batch_size=settings.RECIPES_EXPORT_BATCH_SIZE)
+        )
+
+
+async def fold_favorite_counts() -> int:
+    """Consolida os deltas do contador de favoritos (GET /recipes/popular lê o valor consolidado)."""
+    async with async_session() as session, SQLAlchemyUnitOfWork(session):
+        return await SQLAlchemyRecipeRepository(session).fold_favorite_counts()
+
+
+# Tendências: decaimento dos favoritos e o top-K pré-calculado servido por GET /recipes/trending
+trending_decay = TrendingDecay(settings.TRENDING_HALF_LIFE_HOURS * 3600)
+trending_ranking = TrendingRanking(settings.TRENDING_TOP_K)
+
+
+async def refresh_trending_ranking() -> None:
+    """Consome o log de favoritos nos escores e recarrega o top-K deste worker."""
+    async with async_session() as session:
+        repository = SQLAlchemyRecipeRepository(session)
+        unit_of_work = SQLAlchemyUnitOfWork(session)
+        batch_size = settings.TRENDING_AGGREGATE_BATCH_SIZE
+        consumed = batch_size
+        while consumed == batch_size: # um commit por lote: os eventos consumidos não ficam travados
+            async with unit_of_work:
+                consumed = await repository.aggregate_favorite_events(trending_decay, batch_size)
+        trending_ranking.replace(await repository.get_trending_scores(trending_ranking.capacity))
+
+
+async def build_feed_snapshot() -> None:
+    """Renderiza a primeira página do feed público e publica o snapshot para todos os workers."""
+    async with async_session() as session:
+        page = await SQLAlchemyRecipeRepository(session).get_public_recipes_page(PUBLIC_FEED_LIMIT)
+    etag, variants = render_feed(page)
+    write_snapshot(settings.FEED_SNAPSHOT_PATH, etag, variants)
+
+
+# Snapshot do feed público: leitura via mmap e reconstrução (com debounce) após escritas
+feed_snapshot = FeedSnapshotReader(settings.FEED_SNAPSHOT_PATH, settings.FEED_SNAPSHOT_MAX_AGE_SECONDS)
+feed_publisher = FeedSnapshotPublisher(build_feed_snapshot, settings.FEED_SNAPSHOT_DEBOUNCE_SECONDS)
 
 
 # Dependência para obter a instância do repositório de receitas
+# (cache -> coalescência de leituras simultâneas -> índice de ingredientes/snapshot do feed -> banco)
 async def get_recipe_repository( 
-    db: AsyncSession = Depends(get_db_session),
-) -> SQLAlchemyRecipeRepository:
-    return SQLAlchemyRecipeRepository(db)
+    db: AsyncSession = Depends(get_db_session, scope="function"),
+) -> RecipeRepository:
+    # Os efeitos fora do banco (índice, snapshot, cache) esperam o commit da requisição
+    unit_of_work = SQLAlchemyUnitOfWork.of(db)
+    repository: RecipeRepository = IngredientIndexingRecipeRepository(
+        SQLAlchemyRecipeRepository(db), ingredient_index, unit_of_work
+    )
+    if settings.FEED_SNAPSHOT_ENABLED:
+        repository = PublicChangeNotifyingRecipeRepository(repository, feed_publisher.request_rebuild, unit_of_work)
+    if settings.RECIPE_SINGLE_FLIGHT_ENABLED:
+        repository = CoalescingRecipeRepository(
+            repository, recipe_single_flight, open_flight_recipe_repository, unit_of_work
+        )
+    if settings.RECIPE_CACHE_ENABLED:
+        repository = CachingRecipeRepository(repository, recipe_cache, unit_of_work)
+    return repository
+
+
+# Instância única por processo: o pool de threads do bcrypt é compartilhado entre requisições
+password_hasher = ThreadPoolPasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+# Dependência para obter o serviço de hash de senhas
+def get_password_hasher() -> PasswordHasher:
+    return password_hasher
 
 
 # Esquemas de segurança
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/users/login")
 security_bearer = HTTPBearer() # <-- DEFINIÇÃO CENTRALIZADA AQUI
+# Para rotas públicas que só usam o usuário em opções (ex: with_favorites): sem token, None
+optional_security_bearer = HTTPBearer(auto_error=False)
 
 
 # Dependência para obter o usuário atualmente autenticado
@@ -70,15 +217,21 @@ async def get_current_user(
             print("DEBUG: get_current_user - user_id is None or empty. Raising credentials_exception.")
             raise credentials_exception
 
-        # Busca o usuário no banco de dados usando o ID do token
-        user = await user_repo.get_by_id(user_id)
+        # Usa o cache de principal antes de ir ao banco (invalidado em update/delete do usuário)
+        issued_at = payload.get("iat")
+        user = principal_cache.get(user_id, issued_at)
         if user is None:
-            print(f"DEBUG: get_current_user - User not found in DB for ID: {user_id}. Raising credentials_exception.")
-            raise credentials_exception
+            user = await user_repo.get_by_id(user_id)
+            if user is None:
+                print(f"DEBUG: get_current_user - User not found in DB for ID: {user_id}. Raising credentials_exception.")
+                raise credentials_exception
+            principal_cache.set(user_id, issued_at, user)
         
         print(f"DEBUG: get_current_user - User successfully resolved: {user.id}")
         return user 
 
+    except HTTPException:
+        raise
     except JWTError as e:
         print(f"DEBUG: get_current_user - JWTError detected: {e}. Raising credentials_exception.")
         raise credentials_exception
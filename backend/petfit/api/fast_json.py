@@ -0,0 +1,22 @@
+# petfit/api/fast_json.py
+
+from typing import Any, Optional
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse codificada com orjson a partir de dicts/listas simples.
+
+    Usada quando a rota devolve a resposta pronta: o FastAPI pula a validação e a
+    serialização pelo `response_model` (que continua só documentando o schema).
+    OPT_UTC_Z mantém datas UTC no mesmo formato do Pydantic (`...Z`).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+def fast_json_response(content: Any, status_code: int = 200, headers: Optional[dict] = None) -> FastJSONResponse:
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
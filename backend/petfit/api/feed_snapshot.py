@@ -0,0 +1,186 @@
+# petfit/api/feed_snapshot.py
+
+import asyncio
+import gzip
+import mmap
+import os
+import struct
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import orjson
+from fastapi import Response
+
+from petfit.api.content_encoding import choose_encoding
+from petfit.api.fast_json import FastJSONResponse
+from petfit.api.http_cache import cache_headers, encoded_etag, etag_matches, not_modified, page_etag
+from petfit.api.schemas.recipe_schema import project_recipe
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.value_objects.page import Page
+
+# Tamanho da página padrão de GET /recipes: é essa página que vira snapshot
+PUBLIC_FEED_LIMIT = 20
+
+# Formato do arquivo: MAGIC | tamanho do cabeçalho (uint32) | cabeçalho JSON | corpos
+MAGIC = b"PFSNAP1\n"
+_HEADER_SIZE = struct.Struct(">I")
+
+
+class FeedSnapshot:
+    """Primeira página do feed público já serializada, com suas variantes comprimidas."""
+
+    def __init__(self, etag: str, built_at: float, variants: Dict[str, memoryview]):
+        self.etag = etag
+        self.built_at = built_at
+        self.variants = variants
+
+    def body_for(self, accept_encoding: Optional[str]) -> Tuple[memoryview, Optional[str]]:
+        encoding = choose_encoding(accept_encoding, [name for name in self.variants if name != "identity"])
+        if encoding is None:
+            return self.variants["identity"], None
+        return self.variants[encoding], encoding
+
+
+def render_feed(page: Page[Recipe]) -> Tuple[str, Dict[str, bytes]]:
+    """Serializa a página como o caminho rápido de GET /recipes, mais a variante gzip."""
+    content = {"items": [project_recipe(r) for r in page.items], "next_cursor": page.next_cursor}
+    body = bytes(FastJSONResponse(content).body)
+    return page_etag(page), {"identity": body, "gzip": gzip.compress(body, mtime=0)}
+
+
+def write_snapshot(path: str, etag: str, variants: Dict[str, bytes], built_at: Optional[float] = None) -> None:
+    """Grava o snapshot de forma atômica (arquivo temporário + rename): leitores nunca veem meio arquivo."""
+    offset = 0
+    index = {}
+    for name, body in variants.items():
+        index[name] = [offset, len(body)]
+        offset += len(body)
+    header = orjson.dumps({"etag": etag, "built_at": built_at if built_at is not None else time.time(), "variants": index})
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER_SIZE.pack(len(header)))
+        f.write(header)
+        for body in variants.values():
+            f.write(body)
+    os.replace(tmp_path, path)
+
+
+class FeedSnapshotReader:
+    """Lê o snapshot publicado por qualquer worker via mmap.
+
+    Cada requisição faz só um stat no arquivo; quando ele é trocado, o novo é
+    mapeado. O mapeamento antigo é liberado quando a última resposta que usa
+    seus bytes termina. Snapshots mais velhos que `max_age_seconds` são ignorados.
+    """
+
+    def __init__(self, path: str, max_age_seconds: float, clock: Callable[[], float] = time.time):
+        self._path = path
+        self._max_age = max_age_seconds
+        self._clock = clock
+        self._identity: Optional[tuple] = None
+        self._snapshot: Optional[FeedSnapshot] = None
+
+    def current(self) -> Optional[FeedSnapshot]:
+        try:
+            st = os.stat(self._path)
+        except FileNotFoundError:
+            self._identity, self._snapshot = None, None
+            return None
+        if (st.st_ino, st.st_mtime_ns, st.st_size) != self._identity:
+            self._load()
+        snapshot = self._snapshot
+        if snapshot is None or self._clock() - snapshot.built_at > self._max_age:
+            return None
+        return snapshot
+
+    def _load(self) -> None:
+        self._identity, self._snapshot = None, None
+        try:
+            with open(self._path, "rb") as f:
+                st = os.fstat(f.fileno())
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError): # sumiu ou está vazio
+            return
+        try:
+            etag, built_at, index, bodies = self._parse_header(mapped)
+        except (struct.error, orjson.JSONDecodeError, ValueError, KeyError, TypeError):
+            # Truncado ou corrompido (ex: escritor que caiu no meio): como se não houvesse snapshot,
+            # sem remapear o mesmo arquivo a cada requisição
+            mapped.close()
+            self._identity = (st.st_ino, st.st_mtime_ns, st.st_size)
+            return
+        view = memoryview(mapped)
+        variants = {
+            name: view[bodies + offset : bodies + offset + length] for name, (offset, length) in index.items()
+        }
+        self._identity = (st.st_ino, st.st_mtime_ns, st.st_size)
+        self._snapshot = FeedSnapshot(etag, built_at, variants)
+
+    @staticmethod
+    def _parse_header(mapped: mmap.mmap) -> Tuple[str, float, Dict[str, List[int]], int]:
+        """(etag, built_at, variantes, início dos corpos); levanta se o arquivo não está inteiro."""
+        if mapped[: len(MAGIC)] != MAGIC:
+            raise ValueError("Not a feed snapshot.")
+        (header_size,) = _HEADER_SIZE.unpack_from(mapped, len(MAGIC))
+        start = len(MAGIC) + _HEADER_SIZE.size
+        header = orjson.loads(mapped[start : start + header_size])
+        bodies = start + header_size
+        for offset, length in header["variants"].values():
+            if bodies + offset + length > len(mapped):
+                raise ValueError("Feed snapshot body is truncated.")
+        return header["etag"], header["built_at"], header["variants"], bodies
+
+
+def snapshot_response(
+    snapshot: FeedSnapshot,
+    if_none_match: Optional[str],
+    accept_encoding: Optional[str],
+    max_age: int,
+) -> Response:
+    """Responde GET /recipes direto dos bytes mapeados (ou 304), sem consulta nem serialização."""
+    headers = cache_headers(snapshot.etag, max_age)
+    if etag_matches(if_none_match, snapshot.etag):
+        return not_modified(headers)
+    body, encoding = snapshot.body_for(accept_encoding)
+    headers["Vary"] = "Accept-Encoding"
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+        headers["ETag"] = encoded_etag(snapshot.etag, encoding)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class FeedSnapshotPublisher:
+    """Reconstrói o snapshot depois das escritas, agrupando rajadas (debounce).
+
+    `request_rebuild` só marca o snapshot como sujo: a reconstrução roda
+    `debounce_seconds` depois, uma vez para todas as escritas do intervalo. Escritas
+    que chegam durante a reconstrução disparam mais uma rodada em seguida.
+    """
+
+    def __init__(self, build: Callable[[], Awaitable[None]], debounce_seconds: float):
+        self._build = build
+        self._debounce = debounce_seconds
+        self._dirty = False
+        self._task: Optional["asyncio.Task[None]"] = None
+        self.requests = 0
+        self.builds = 0
+
+    def request_rebuild(self) -> None:
+        self.requests += 1
+        self._dirty = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self) -> None:
+        while self._dirty:
+            await asyncio.sleep(self._debounce)
+            self._dirty = False
+            try:
+                await self._build()
+                self.builds += 1
+            except Exception as e:
+                print(f"Erro ao reconstruir o snapshot do feed público: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return {"requests": self.requests, "builds": self.builds}
@@ -0,0 +1,90 @@
+# petfit/api/http_cache.py
+
+import hashlib
+from typing import Any, List, Optional
+
+from fastapi import Response, status
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.value_objects.page import Page
+from petfit.domain.value_objects.recipe_popularity import RecipePopularity
+
+# Mude quando o formato do RecipeOutput mudar: invalida os ETags já emitidos
+REPRESENTATION_VERSION = "1"
+
+
+def _digest(*parts: Any) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(REPRESENTATION_VERSION.encode())
+    for part in parts:
+        h.update(b"\x1f")
+        h.update(str(part).encode("utf-8"))
+    return f'"{h.hexdigest()}"'
+
+
+def _recipe_version(recipe: Recipe) -> Any:
+    # updated_at sozinho não basta: vem do now() da transação, então duas escritas na mesma
+    # transação (ou criar e editar) o repetem. O conteúdo entra junto; campos fora de uma
+    # projeção vêm None e não pesam.
+    updated_at = recipe.updated_at.isoformat() if recipe.updated_at is not None else None
+    return (updated_at, recipe.title, recipe.ingredients, recipe.instructions, recipe.is_public, recipe.created_at)
+
+
+def recipe_etag(recipe: Recipe) -> str:
+    return _digest(recipe.id, _recipe_version(recipe))
+
+
+def page_etag(page: Page[Recipe], variant: Any = None) -> str:
+    # variant: o que muda a representação sem mudar as receitas (ex: a projeção `fields=`)
+    parts = [p for r in page.items for p in (r.id, _recipe_version(r))]
+    return _digest(*parts, page.next_cursor, variant)
+
+
+def popularity_etag(ranking: List[RecipePopularity]) -> str:
+    # A contagem faz parte da resposta, mas não da versão da receita: entra no ETag à parte
+    parts = [p for item in ranking for p in (item.recipe.id, _recipe_version(item.recipe), item.favorite_count)]
+    return _digest("popular", *parts)
+
+
+# Sufixos dos ETags das representações comprimidas (ver encoded_etag)
+ENCODING_SUFFIXES = ("-gzip", "-br")
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """ETag da representação comprimida com `encoding`.
+
+    Um validador forte identifica bytes exatos: o corpo gzip/br não pode sair com
+    o mesmo ETag do corpo sem compressão. Ganha o sufixo da codificação
+    (`"abc"` -> `"abc-gzip"`); ETags fracos ficam como estão.
+    """
+    if etag.startswith("W/"):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _without_encoding(etag: str) -> str:
+    for suffix in ENCODING_SUFFIXES:
+        if etag.endswith(f'{suffix}"'):
+            return f'{etag[: -len(suffix) - 1]}"'
+    return etag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    # If-None-Match usa comparação fraca: ignora o prefixo W/ e a codificação
+    # (o cliente pode ter guardado a versão comprimida, com ETag sufixado)
+    etag = _without_encoding(etag.removeprefix("W/"))
+    return any(_without_encoding(c.removeprefix("W/")) == etag for c in candidates)
+
+
+def cache_headers(etag: str, max_age: int, public: bool = True) -> dict:
+    scope = "public" if public else "private"
+    return {"ETag": etag, "Cache-Control": f"{scope}, max-age={max_age}, must-revalidate"}
+
+
+def not_modified(headers: dict) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -1,12 +1,77 @@
 # petfit/main.py
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 # REMOVER ESTA LINHA: from fastapi.security import HTTPBearer # <--- ESTA LINHA CAUSA O PROBLEMA
-from petfit.api.routes import recipe_route, user_route
+from petfit.api.routes import ingredient_route, metrics_route, recipe_route, user_route
 from petfit.api.openapi_tags import openapi_tags
+from petfit.api.compression import CompressionMiddleware
+from petfit.api.deps import (
+    compressed_body_cache,
+    feed_publisher,
+    fold_favorite_counts,
+    rebuild_ingredient_index,
+    refresh_trending_ranking,
+)
+from petfit.api.settings import settings
 from fastapi.middleware.cors import CORSMiddleware
 
 
+async def refresh_ingredient_index(interval_seconds: int) -> None:
+    # Reconstrói o índice ao subir e depois a cada intervalo; falhas só adiam a próxima tentativa
+    while True:
+        try:
+            await rebuild_ingredient_index()
+        except Exception as e:
+            print(f"Erro ao reconstruir o índice de ingredientes: {e}")
+        await asyncio.sleep(interval_seconds)
+
+
+async def refresh_feed_snapshot(interval_seconds: int) -> None:
+    # Publica o snapshot ao subir e depois a cada intervalo (além das escritas feitas por esta API)
+    while True:
+        feed_publisher.request_rebuild()
+        await asyncio.sleep(interval_seconds)
+
+
+async def refresh_favorite_counts(interval_seconds: int) -> None:
+    # Consolida os shards do contador de favoritos; falhas só adiam a próxima rodada
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await fold_favorite_counts()
+        except Exception as e:
+            print(f"Erro ao consolidar os contadores de favoritos: {e}")
+
+
+async def refresh_trending(interval_seconds: int) -> None:
+    # Agrega os favoritos novos e recarrega o top-K ao subir e depois a cada intervalo
+    while True:
+        try:
+            await refresh_trending_ranking()
+        except Exception as e:
+            print(f"Erro ao atualizar as receitas em alta: {e}")
+        await asyncio.sleep(interval_seconds)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    refreshers = []
+    if settings.INGREDIENT_INDEX_REFRESH_SECONDS > 0:
+        refreshers.append(asyncio.create_task(refresh_ingredient_index(settings.INGREDIENT_INDEX_REFRESH_SECONDS)))
+    if settings.FEED_SNAPSHOT_ENABLED and settings.FEED_SNAPSHOT_REFRESH_SECONDS > 0:
+        refreshers.append(asyncio.create_task(refresh_feed_snapshot(settings.FEED_SNAPSHOT_REFRESH_SECONDS)))
+    if settings.FAVORITE_COUNT_FOLD_SECONDS > 0:
+        refreshers.append(asyncio.create_task(refresh_favorite_counts(settings.FAVORITE_COUNT_FOLD_SECONDS)))
+    if settings.TRENDING_REFRESH_SECONDS > 0:
+        refreshers.append(asyncio.create_task(refresh_trending(settings.TRENDING_REFRESH_SECONDS)))
+    yield
+    for refresher in refreshers:
+        refresher.cancel()
+
+
 app = FastAPI(
     title="Petfit API",
     description="API backend do Petfit com FastAPI e PostgreSQL",
@@ -15,6 +80,7 @@ app = FastAPI(
     license_info={"name": "MIT", "url": "https://opensource.org/licenses/MIT"},
     openapi_tags=openapi_tags,
     redirect_slashes=True,
+    lifespan=lifespan,
 )
 
 origins = [
@@ -30,6 +96,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        cache=compressed_body_cache,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
 
 @app.get("/")
 def ola():
@@ -37,4 +112,6 @@ def ola():
 
 
 app.include_router(user_route.router, prefix="/users", tags=["Users"])
-app.include_router(recipe_route.router, prefix="/recipes", tags=["Recipes"])
\ No newline at end of file
+app.include_router(recipe_route.router, prefix="/recipes", tags=["Recipes"])
+app.include_router(ingredient_route.router, prefix="/ingredients", tags=["Ingredients"])
+app.include_router(metrics_route.router, prefix="/metrics", tags=["Metrics"])
\ No newline at end of file
@@ -7,5 +7,13 @@ openapi_tags = [
         "name": "Posts",
         "description": "Criação, listagem, edição e remoção de posts.",
     },
+    {
+        "name": "Ingredients",
+        "description": "Autocomplete de ingredientes servido de um índice em memória.",
+    },
+    {
+        "name": "Metrics",
+        "description": "Contadores internos dos caches e otimizações de leitura.",
+    },
 
 ]
\ No newline at end of file
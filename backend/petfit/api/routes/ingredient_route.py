@@ -0,0 +1,29 @@
+# petfit/api/routes/ingredient_route.py
+
+from fastapi import APIRouter, Query
+
+from petfit.api.deps import ingredient_index
+from petfit.api.schemas.ingredient_schema import IngredientSuggestion, IngredientSuggestOutput
+
+router = APIRouter()
+
+# ----------------------
+# Ingredient Autocomplete
+# ----------------------
+@router.get(
+    "/suggest",
+    response_model=IngredientSuggestOutput,
+    summary="Sugerir ingredientes",
+    description=(
+        "Retorna os ingredientes mais frequentes nas receitas públicas que começam com "
+        "`prefix`. Servido de um índice em memória (sem consulta ao banco), atualizado "
+        "a cada escrita de receita e reconstruído periodicamente."
+    ),
+)
+async def suggest_ingredients(
+    prefix: str = Query(..., min_length=1, max_length=100, description="Início do nome do ingrediente"),
+    limit: int = Query(10, ge=1, le=50, description="Quantidade máxima de sugestões"),
+):
+    return IngredientSuggestOutput(
+        items=[IngredientSuggestion(name=name, count=count) for name, count in ingredient_index.suggest(prefix, limit)]
+    )
@@ -0,0 +1,40 @@
+# petfit/api/routes/metrics_route.py
+
+from fastapi import APIRouter
+from typing import Dict
+
+from petfit.api.deps import (
+    compressed_body_cache,
+    feed_publisher,
+    ingredient_index,
+    principal_cache,
+    recipe_cache,
+    recipe_single_flight,
+    trending_ranking,
+)
+
+router = APIRouter()
+
+# ----------------------
+# Cache Metrics
+# ----------------------
+@router.get(
+    "/cache",
+    summary="Métricas dos caches em processo",
+    description=(
+        "Retorna tamanho, acertos, falhas e despejos dos caches deste worker e "
+        "quantas leituras de receitas foram coalescidas pelo single-flight, além do "
+        "tamanho do índice de autocomplete de ingredientes, as reconstruções do snapshot do feed, "
+        "o cache de corpos comprimidos e o top-K das receitas em alta."
+    ),
+)
+async def get_cache_metrics() -> Dict[str, Dict[str, int]]:
+    return {
+        "auth_principal": principal_cache.stats(),
+        "recipes": recipe_cache.stats(),
+        "recipes_single_flight": recipe_single_flight.stats(),
+        "ingredient_index": ingredient_index.stats(),
+        "feed_snapshot": feed_publisher.stats(),
+        "compressed_bodies": compressed_body_cache.stats(),
+        "trending": trending_ranking.stats(),
+    }
@@ -1,37 +1,111 @@
 # petfit/api/routes/recipe_route.py
 
-from fastapi import APIRouter, HTTPException, Depends, status, Path, Body
+from fastapi import APIRouter, HTTPException, Depends, status, Path, Body, Query, Request, Response, Header
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional, Sequence, Set
 
 from petfit.domain.entities.user import User
 from petfit.domain.entities.recipe import Recipe 
 # Importe get_current_user e security_bearer do deps.py
-from petfit.api.deps import get_db_session, get_recipe_repository, get_current_user, security_bearer # <-- ADICIONADO security_bearer
+from petfit.api.deps import feed_snapshot, trending_decay, trending_ranking, get_db_session, get_recipe_repository, get_current_user, security_bearer # <-- ADICIONADO security_bearer
+from petfit.api.deps import get_user_repository, optional_security_bearer
 from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.repositories.user_repository import UserRepository
+from petfit.domain.value_objects.recipe_sort import RecipeSort
+from petfit.domain.value_objects.recipe_fields import RECIPE_FIELDS, parse_recipe_fields
 
 from petfit.api.schemas.recipe_schema import (
     RecipeInput,
     RecipeOutput,
-    RecipeFavoriteResponse
+    RecipePageOutput,
+    RecipePageResponse,
+    RecipeListResponse,
+    RecipeSearchPageOutput,
+    RecipeSearchPageResponse,
+    RecipeIngredientMatchPageOutput,
+    RecipePopularListOutput,
+    RecipeTrendingListOutput,
+    MAX_INGREDIENTS_QUERY,
+    RecipeBatchGetInput,
+    RecipeBatchGetOutput,
+    RecipeBatchGetResponse,
+    RecipeImportError,
+    RecipeImportOutput,
+    RecipeFavoriteResponse,
+    RecipeFavoritesBulkInput,
+    RecipeFavoritesBulkOutput,
+    annotate_favorites,
+    ingredient_match_payload,
+    popularity_payload,
+    trend_payload,
+    project_recipe,
+    search_hit_payload,
 )
 from petfit.api.schemas.message_schema import MessageOutput 
+from petfit.api.settings import settings
+from petfit.api.streaming import CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE, csv_response, iter_ndjson_lines, ndjson_response, wants_ndjson
+from petfit.api.streaming import PayloadTooLargeError, read_body
+from petfit.api.fast_json import fast_json_response
+from petfit.api.feed_snapshot import PUBLIC_FEED_LIMIT, snapshot_response
+from petfit.api.http_cache import cache_headers, etag_matches, not_modified, page_etag, popularity_etag, recipe_etag
 from fastapi.security import HTTPAuthorizationCredentials # <-- ADICIONADO para tipagem
 
 # Use cases
 from petfit.usecases.recipe.create_recipe import CreateRecipeUseCase
-from petfit.usecases.recipe.get_all_recipes import GetAllRecipesUseCase
+from petfit.usecases.recipe.list_public_recipes import ListPublicRecipesUseCase
+from petfit.usecases.recipe.stream_public_recipes import StreamPublicRecipesUseCase
+from petfit.usecases.recipe.search_recipes import SearchRecipesUseCase
+from petfit.usecases.recipe.find_recipes_by_ingredients import FindRecipesByIngredientsUseCase
+from petfit.usecases.recipe.get_popular_recipes import GetPopularRecipesUseCase
+from petfit.usecases.recipe.get_trending_recipes import GetTrendingRecipesUseCase
 from petfit.usecases.recipe.get_recipe_by_id import GetRecipeByIdUseCase
+from petfit.usecases.recipe.get_recipes_by_ids import GetRecipesByIdsUseCase
+from petfit.usecases.recipe.import_recipes import ImportRecipesUseCase
+from petfit.usecases.recipe.export_recipes import ExportRecipesUseCase
 from petfit.usecases.recipe.add_favorite_recipe import AddFavoriteRecipeUseCase
 from petfit.usecases.recipe.remove_favorite_recipe import RemoveFavoriteRecipeUseCase
+from petfit.usecases.recipe.update_favorite_recipes import UpdateFavoriteRecipesUseCase
 from petfit.usecases.recipe.get_user_favorite_recipes import GetUserFavoriteRecipesUseCase
+from petfit.usecases.recipe.get_favorite_recipe_ids import GetFavoriteRecipeIdsUseCase
+from petfit.usecases.recipe.list_user_favorite_recipes import ListUserFavoriteRecipesUseCase
 from petfit.usecases.recipe.update_recipe import UpdateRecipeUseCase
 from petfit.usecases.recipe.delete_recipe import DeleteRecipeUseCase
 
+import json
 import uuid 
+from pydantic import ValidationError
+from typing import Any, AsyncIterator, Literal, Tuple
 
 router = APIRouter()
 
+FIELDS_DESCRIPTION = (
+    "Campos a retornar, separados por vírgula (ex: `title,created_at`); o `id` sempre vem. "
+    f"Disponíveis: {', '.join(RECIPE_FIELDS)}. Sem o parâmetro, a receita vem inteira."
+)
+
+WITH_FAVORITES_DESCRIPTION = (
+    "Inclui `is_favorite` em cada receita, conforme os favoritos do usuário autenticado "
+    "(requer o token Bearer). A página inteira é marcada com uma única consulta."
+)
+
+
+async def _favorite_ids(
+    recipe_repo: RecipeRepository,
+    credentials: Optional[HTTPAuthorizationCredentials],
+    user_repo: UserRepository,
+    recipe_ids: Sequence[str],
+) -> Set[str]:
+    """Favoritos do usuário autenticado dentre as receitas listadas (para o `with_favorites`)."""
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication is required for with_favorites.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    user = await get_current_user(credentials, user_repo)
+    return await GetFavoriteRecipeIdsUseCase(recipe_repo).execute(user, recipe_ids)
+
+
 # ----------------------
 # Create Recipe (Pode ser público ou privado inicialmente)
 # ----------------------
@@ -45,7 +119,7 @@ router = APIRouter()
 )
 async def create_recipe(
     recipe_input: RecipeInput, 
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
 ):
     try:
         recipe_repo = await get_recipe_repository(db)
@@ -60,6 +134,8 @@ async def create_recipe(
         )
         
         created_recipe = await usecase.execute(recipe_entity)
+        if settings.FAST_JSON_ENABLED:
+            return fast_json_response(project_recipe(created_recipe), status_code=status.HTTP_201_CREATED)
         return RecipeOutput.from_entity(created_recipe)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -68,27 +144,417 @@ async def create_recipe(
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 # ----------------------
-# Get All Public Recipes
+# Bulk Import Recipes (AUTHENTICATED)
+# ----------------------
+def _describe_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}" for err in error.errors()
+    )
+
+
+async def _raw_import_rows(request: Request) -> AsyncIterator[Tuple[int, Any]]:
+    try:
+        if request.headers.get("content-type", "").startswith(NDJSON_MEDIA_TYPE):
+            # NDJSON: lê e valida linha a linha conforme o corpo chega
+            index = 0
+            async for line in iter_ndjson_lines(request.stream(), settings.RECIPES_IMPORT_MAX_LINE_BYTES):
+                yield index, line
+                index += 1
+            return
+        body = await read_body(request, settings.RECIPES_IMPORT_MAX_BODY_BYTES)
+    except PayloadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    try:
+        items = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON.")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON.")
+    for index, item in enumerate(items):
+        yield index, item
+
+
+async def _valid_import_rows(request: Request, errors: List[Tuple[int, str]]) -> AsyncIterator[Tuple[int, Recipe]]:
+    async for index, raw in _raw_import_rows(request):
+        try:
+            if isinstance(raw, bytes):
+                data = RecipeInput.model_validate_json(raw)
+            else:
+                data = RecipeInput.model_validate(raw)
+        except ValidationError as e:
+            errors.append((index, _describe_validation_error(e)))
+            continue
+        yield index, Recipe(
+            id=str(uuid.uuid4()),
+            title=data.title,
+            ingredients=data.ingredients,
+            instructions=data.instructions,
+            is_public=data.is_public,
+        )
+
+
+@router.post(
+    "/recipes/import",
+    response_model=RecipeImportOutput,
+    summary="Importar receitas em massa",
+    description=(
+        "Importa um array JSON de receitas (`application/json`) ou um corpo NDJSON "
+        "(`application/x-ndjson`, uma receita por linha, lido em streaming). Linhas inválidas "
+        "são reportadas em `errors` sem interromper a importação. Corpos (array JSON) ou linhas "
+        "(NDJSON) acima do limite respondem `413`, sem importar nada. Requer autenticação."
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": "#/components/schemas/RecipeInput"}}
+                },
+                NDJSON_MEDIA_TYPE: {"schema": {"$ref": "#/components/schemas/RecipeInput"}},
+            },
+        }
+    },
+    tags=["Recipes"]
+)
+async def import_recipes(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security_bearer),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
+):
+    try:
+        recipe_repo = await get_recipe_repository(db)
+        usecase = ImportRecipesUseCase(recipe_repo, chunk_size=settings.RECIPES_IMPORT_CHUNK_SIZE)
+        validation_errors: List[Tuple[int, str]] = []
+        result = await usecase.execute(_valid_import_rows(request, validation_errors))
+        errors = sorted(validation_errors + result.errors)
+        return RecipeImportOutput(
+            imported=result.imported,
+            failed=len(errors),
+            errors=[RecipeImportError(index=index, error=error) for index, error in errors],
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        print(f"Erro inesperado ao importar receitas: {e}")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+# ----------------------
+# List Public Recipes (paginação keyset)
 # ----------------------
 @router.get(
     "/recipes",
-    response_model=List[RecipeOutput],
-    summary="Listar todas as receitas públicas",
-    description="Retorna uma lista de todas as receitas marcadas como públicas.",
+    response_model=RecipePageResponse,
+    summary="Listar receitas públicas",
+    description=(
+        "Retorna uma página de receitas públicas. Use o `next_cursor` da resposta "
+        "como `cursor` para obter a próxima página. Com `Accept: application/x-ndjson`, "
+        "transmite todas as receitas (uma por linha) ignorando `limit`. Com `fields`, só "
+        "esses campos são lidos do banco e retornados. Com `with_favorites`, cada receita "
+        "da página traz `is_favorite`. "
+        "Responde `304` quando o `If-None-Match` bate com o ETag da página."
+    ),
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}, 304: {"description": "Página não modificada"}},
     tags=["Recipes"]
 )
 async def get_all_public_recipes(
-    db: AsyncSession = Depends(get_db_session),
+    request: Request,
+    response: Response,
+    limit: int = Query(PUBLIC_FEED_LIMIT, ge=1, le=100, description="Quantidade máxima de receitas por página"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco retornado pela página anterior"),
+    sort: RecipeSort = Query(RecipeSort.NEWEST, description="Ordenação: -created_at, created_at, title, -title"),
+    title: Optional[str] = Query(None, description="Filtra receitas cujo título contém o texto"),
+    ingredient: Optional[str] = Query(None, description="Filtra receitas que contêm o ingrediente"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    with_favorites: bool = Query(False, description=WITH_FAVORITES_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security_bearer),
+    user_repo: UserRepository = Depends(get_user_repository),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
 ):
     try:
+        # Caso comum (primeira página padrão, sem filtros): bytes prontos do snapshot compartilhado
+        is_default_feed = (
+            limit == PUBLIC_FEED_LIMIT and cursor is None and sort == RecipeSort.NEWEST
+            and title is None and ingredient is None and fields is None and not with_favorites
+        )
+        if settings.FEED_SNAPSHOT_ENABLED and is_default_feed and not wants_ndjson(request):
+            snapshot = feed_snapshot.current()
+            if snapshot is not None:
+                return snapshot_response(
+                    snapshot, if_none_match, request.headers.get("accept-encoding"),
+                    settings.RECIPES_CACHE_MAX_AGE_SECONDS,
+                )
+
+        projection = parse_recipe_fields(fields)
         recipe_repo = await get_recipe_repository(db)
-        usecase = GetAllRecipesUseCase(recipe_repo)
-        recipes = await usecase.execute()
-        return [RecipeOutput.from_entity(r) for r in recipes]
+        if wants_ndjson(request):
+            batches = StreamPublicRecipesUseCase(recipe_repo).execute(
+                sort=sort, cursor=cursor, title=title, ingredient=ingredient,
+                batch_size=settings.RECIPES_STREAM_BATCH_SIZE, fields=projection,
+            )
+            return await ndjson_response(batches)
+        usecase = ListPublicRecipesUseCase(recipe_repo)
+        page = await usecase.execute(
+            limit, cursor=cursor, sort=sort, title=title, ingredient=ingredient, fields=projection
+        )
+        favorite_ids = None
+        if with_favorites:
+            favorite_ids = await _favorite_ids(recipe_repo, credentials, user_repo, [r.id for r in page.items])
+            # A marcação é do usuário: entra no ETag e a resposta deixa de ser cacheável por terceiros
+            etag = page_etag(page, (projection, sorted(favorite_ids)))
+            headers = cache_headers(etag, settings.RECIPES_CACHE_MAX_AGE_SECONDS, public=False)
+        else:
+            headers = cache_headers(page_etag(page, projection), settings.RECIPES_CACHE_MAX_AGE_SECONDS)
+        if etag_matches(if_none_match, headers["ETag"]):
+            return not_modified(headers)
+        # Com projeção ou marcação, sempre pelo caminho rápido (schema de projeção no response_model)
+        if settings.FAST_JSON_ENABLED or projection or favorite_ids is not None:
+            items = [project_recipe(r, projection or RECIPE_FIELDS) for r in page.items]
+            if favorite_ids is not None:
+                annotate_favorites(items, favorite_ids)
+            return fast_json_response({"items": items, "next_cursor": page.next_cursor}, headers=headers)
+        response.headers.update(headers)
+        return RecipePageOutput.from_page(page)
+    except HTTPException:
+        raise
+    except ValueError as e: # cursor ou fields inválidos
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"Erro inesperado ao listar receitas públicas: {e}")
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
+# ----------------------
+# Search Public Recipes (busca textual)
+# ----------------------
+@router.get(
+    "/recipes/search",
+    response_model=RecipeSearchPageResponse,
+    summary="Buscar receitas públicas",
+    description=(
+        "Busca textual em título, ingredientes e instruções das receitas públicas. "
+        "Aceita a sintaxe de busca web (`\"frase exata\"`, `-excluir`, `or`). "
+        "Os resultados vêm da maior para a menor relevância; use o `next_cursor` "
+        "como `cursor` para a próxima página. Com `fields`, só esses campos da receita "
+        "são retornados (além de `rank` e `snippet`). Com `with_favorites`, cada receita "
+        "traz `is_favorite`."
+    ),
+    tags=["Recipes"]
+)
+async def search_recipes(
+    q: str = Query(..., min_length=1, max_length=200, description="Termos da busca"),
+    limit: int = Query(20, ge=1, le=100, description="Quantidade máxima de receitas por página"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco retornado pela página anterior"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    with_favorites: bool = Query(False, description=WITH_FAVORITES_DESCRIPTION),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security_bearer),
+    user_repo: UserRepository = Depends(get_user_repository),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
+):
+    try:
+        projection = parse_recipe_fields(fields)
+        recipe_repo = await get_recipe_repository(db)
+        usecase = SearchRecipesUseCase(recipe_repo)
+        page = await usecase.execute(q, limit, cursor=cursor, fields=projection)
+        favorite_ids = None
+        if with_favorites:
+            favorite_ids = await _favorite_ids(recipe_repo, credentials, user_repo, [hit.recipe.id for hit in page.items])
+        if settings.FAST_JSON_ENABLED or projection or favorite_ids is not None:
+            items = [search_hit_payload(hit, projection or RECIPE_FIELDS) for hit in page.items]
+            if favorite_ids is not None:
+                annotate_favorites(items, favorite_ids)
+            return fast_json_response({"items": items, "next_cursor": page.next_cursor})
+        return RecipeSearchPageOutput.from_page(page)
+    except HTTPException:
+        raise
+    except ValueError as e: # cursor ou fields inválidos
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"Erro inesperado ao buscar receitas: {e}")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+# ----------------------
+# Find Public Recipes by Ingredients
+# ----------------------
+@router.get(
+    "/recipes/by-ingredients",
+    response_model=RecipeIngredientMatchPageOutput,
+    summary="Buscar receitas por ingredientes",
+    description=(
+        "Receitas públicas que contêm todos (`match=all`) ou algum (`match=any`) dos "
+        "ingredientes informados (repita `ingredient` para cada um). A comparação ignora "
+        "maiúsculas e espaços nas pontas. Os resultados vêm das que têm mais ingredientes "
+        "em comum e, no empate, das que pedem menos ingredientes."
+    ),
+    tags=["Recipes"]
+)
+async def find_recipes_by_ingredients(
+    ingredient: List[str] = Query(..., min_length=1, max_length=MAX_INGREDIENTS_QUERY, description="Ingredientes procurados"),
+    match: Literal["all", "any"] = Query("all", description="all: contém todos; any: contém algum"),
+    limit: int = Query(20, ge=1, le=100, description="Quantidade máxima de receitas por página"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco retornado pela página anterior"),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
+):
+    try:
+        recipe_repo = await get_recipe_repository(db)
+        usecase = FindRecipesByIngredientsUseCase(recipe_repo)
+        page = await usecase.execute(ingredient, match == "all", limit, cursor=cursor)
+        if settings.FAST_JSON_ENABLED:
+            items = [ingredient_match_payload(m) for m in page.items]
+            return fast_json_response({"items": items, "next_cursor": page.next_cursor})
+        return RecipeIngredientMatchPageOutput.from_page(page)
+    except ValueError as e: # inclui InvalidCursorError
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"Erro inesperado ao buscar receitas por ingredientes: {e}")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+# ----------------------
+# Most Favorited Public Recipes
+# ----------------------
+@router.get(
+    "/recipes/popular",
+    response_model=RecipePopularListOutput,
+    summary="Receitas mais favoritadas",
+    description=(
+        "Retorna as receitas públicas mais favoritadas, com a contagem de favoritos de cada uma. "
+        "A contagem é consolidada periodicamente, então favoritos recentes podem levar alguns "
+        "segundos para aparecer. Responde `304` quando o `If-None-Match` bate com o ETag atual."
+    ),
+    responses={304: {"description": "Ranking não modificado"}},
+    tags=["Recipes"]
+)
+async def get_popular_recipes(
+    response: Response,
+    limit: int = Query(20, ge=1, le=100, description="Quantidade de receitas no ranking"),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
+):
+    try:
+        recipe_repo = await get_recipe_repository(db)
+        ranking = await GetPopularRecipesUseCase(recipe_repo).execute(limit)
+        headers = cache_headers(popularity_etag(ranking), settings.RECIPES_CACHE_MAX_AGE_SECONDS)
+        if etag_matches(if_none_match, headers["ETag"]):
+            return not_modified(headers)
+        if settings.FAST_JSON_ENABLED:
+            return fast_json_response({"items": [popularity_payload(item) for item in ranking]}, headers=headers)
+        response.headers.update(headers)
+        return RecipePopularListOutput.from_ranking(ranking)
+    except Exception as e:
+        print(f"Erro inesperado ao listar receitas populares: {e}")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+# ----------------------
+# Trending Public Recipes
+# ----------------------
+@router.get(
+    "/recipes/trending",
+    response_model=RecipeTrendingListOutput,
+    summary="Receitas em alta",
+    description=(
+        "Retorna as receitas públicas mais favoritadas recentemente. Cada favorito vale "
+        "metade a cada meia-vida, então o `score` cai com o tempo sem novos favoritos. "
+        "O ranking é pré-calculado em segundo plano a cada poucos segundos."
+    ),
+    tags=["Recipes"]
+)
+async def get_trending_recipes(
+    limit: int = Query(20, ge=1, le=100, description="Quantidade de receitas no ranking"),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
+):
+    try:
+        recipe_repo = await get_recipe_repository(db)
+        usecase = GetTrendingRecipesUseCase(recipe_repo, trending_decay)
+        trends = await usecase.execute(limit, precomputed=trending_ranking.top(limit))
+        if settings.FAST_JSON_ENABLED:
+            return fast_json_response({"items": [trend_payload(trend) for trend in trends]})
+        return RecipeTrendingListOutput.from_trends(trends)
+    except Exception as e:
+        print(f"Erro inesperado ao listar receitas em alta: {e}")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+# ----------------------
+# Export Recipes (AUTHENTICATED, streaming)
+# ----------------------
+EXPORT_COLUMNS = ["id", "title", "ingredients", "instructions", "is_public", "created_at"]
+
+@router.get(
+    "/recipes/export",
+    summary="Exportar receitas",
+    description=(
+        "Transmite todas as receitas (ou as filtradas) em NDJSON ou CSV, lidas do banco "
+        "em lotes por cursor no servidor. Em CSV, listas são serializadas como JSON. "
+        "Requer autenticação."
+    ),
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}, CSV_MEDIA_TYPE: {}}}},
+    tags=["Recipes"]
+)
+async def export_recipes(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Formato da exportação"),
+    is_public: Optional[bool] = Query(None, description="Filtra por visibilidade (vazio: todas)"),
+    title: Optional[str] = Query(None, description="Filtra receitas cujo título contém o texto"),
+    ingredient: Optional[str] = Query(None, description="Filtra receitas que contêm o ingrediente"),
+    credentials: HTTPAuthorizationCredentials = Depends(security_bearer),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
+):
+    try:
+        recipe_repo = await get_recipe_repository(db)
+        batches = ExportRecipesUseCase(recipe_repo).execute(
+            is_public=is_public, title=title, ingredient=ingredient,
+            batch_size=settings.RECIPES_EXPORT_BATCH_SIZE,
+        )
+        headers = {"Content-Disposition": f'attachment; filename="recipes.{format}"'}
+        if format == "csv":
+            return await csv_response(batches, EXPORT_COLUMNS, headers=headers)
+        return await ndjson_response(batches, headers=headers)
+    except Exception as e:
+        print(f"Erro inesperado ao exportar receitas: {e}")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+# ----------------------
+# Batch Get Recipes by IDs
+# ----------------------
+@router.post(
+    "/recipes/batch-get",
+    response_model=RecipeBatchGetResponse,
+    summary="Obter várias receitas por ID",
+    description=(
+        "Retorna várias receitas numa única consulta, na ordem dos IDs enviados. "
+        "IDs inexistentes são listados em `missing`. Com `with_favorites`, cada receita "
+        "traz `is_favorite`."
+    ),
+    tags=["Recipes"]
+)
+async def batch_get_recipes(
+    batch: RecipeBatchGetInput,
+    with_favorites: bool = Query(False, description=WITH_FAVORITES_DESCRIPTION),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security_bearer),
+    user_repo: UserRepository = Depends(get_user_repository),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
+):
+    try:
+        recipe_repo = await get_recipe_repository(db)
+        usecase = GetRecipesByIdsUseCase(recipe_repo)
+        recipes, missing = await usecase.execute(batch.ids)
+        favorite_ids = None
+        if with_favorites:
+            favorite_ids = await _favorite_ids(recipe_repo, credentials, user_repo, [r.id for r in recipes])
+        if settings.FAST_JSON_ENABLED or favorite_ids is not None:
+            items = [project_recipe(r) for r in recipes]
+            if favorite_ids is not None:
+                annotate_favorites(items, favorite_ids)
+            return fast_json_response({"items": items, "missing": missing})
+        return RecipeBatchGetOutput(
+            items=[RecipeOutput.from_entity(r) for r in recipes],
+            missing=missing,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Erro inesperado ao obter receitas em lote: {e}")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
 # ----------------------
 # Get Recipe by ID
 # ----------------------
@@ -96,12 +562,18 @@ async def get_all_public_recipes(
     "/recipes/{recipe_id}",
     response_model=RecipeOutput,
     summary="Obter receita por ID",
-    description="Retorna os detalhes de uma receita específica pelo seu ID.",
+    description=(
+        "Retorna os detalhes de uma receita específica pelo seu ID. "
+        "Responde `304` quando o `If-None-Match` bate com o ETag atual."
+    ),
+    responses={304: {"description": "Receita não modificada"}},
     tags=["Recipes"]
 )
 async def get_recipe_by_id(
+    response: Response,
     recipe_id: str = Path(..., description="ID da receita a ser obtida"),
-    db: AsyncSession = Depends(get_db_session),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
 ):
     try:
         recipe_repo = await get_recipe_repository(db)
@@ -109,7 +581,15 @@ async def get_recipe_by_id(
         recipe = await usecase.execute(recipe_id)
         if not recipe:
             raise HTTPException(status_code=404, detail="Recipe not found.")
+        headers = cache_headers(recipe_etag(recipe), settings.RECIPES_CACHE_MAX_AGE_SECONDS, public=recipe.is_public)
+        if etag_matches(if_none_match, headers["ETag"]):
+            return not_modified(headers)
+        if settings.FAST_JSON_ENABLED:
+            return fast_json_response(project_recipe(recipe), headers=headers)
+        response.headers.update(headers)
         return RecipeOutput.from_entity(recipe)
+    except HTTPException as e:
+        raise e
     except Exception as e:
         print(f"Erro inesperado ao obter receita por ID: {e}")
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
@@ -131,7 +611,7 @@ async def add_recipe_to_favorites(
     recipe_id: str = Path(..., description="ID da receita a ser favoritada"),
     credentials: HTTPAuthorizationCredentials = Depends(security_bearer), # <-- Adicionado aqui para consistência
     current_user: User = Depends(get_current_user), 
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
 ):
     print(f"DEBUG: current_user ID in add_recipe_to_favorites: {current_user.id if current_user else 'None'} Type: {type(current_user)}")
     try:
@@ -142,7 +622,7 @@ async def add_recipe_to_favorites(
         if added:
             return MessageOutput(message="Recipe added to favorites successfully.")
         else:
-            raise HTTPException(status_code=400, detail="Recipe is already in favorites or not found.")
+            raise HTTPException(status_code=400, detail="Recipe is already in favorites.")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) 
     except HTTPException as e: 
@@ -168,7 +648,7 @@ async def remove_recipe_from_favorites(
     recipe_id: str = Path(..., description="ID da receita a ser removida dos favoritos"),
     credentials: HTTPAuthorizationCredentials = Depends(security_bearer), # <-- Adicionado aqui
     current_user: User = Depends(get_current_user), 
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
 ):
     print(f"DEBUG: current_user ID in remove_recipe_from_favorites: {current_user.id if current_user else 'None'} Type: {type(current_user)}")
     try:
@@ -189,34 +669,124 @@ async def remove_recipe_from_favorites(
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
 
+# ----------------------
+# Bulk Add/Remove Favorites (AUTHENTICATED)
+# ----------------------
+@router.patch(
+    "/users/me/favorites/recipes",
+    response_model=RecipeFavoritesBulkOutput,
+    summary="Adicionar e remover vários favoritos",
+    description=(
+        "Favorita os IDs em `add` e desfavorita os de `remove` numa única transação. "
+        "Retorna só os IDs que mudaram: receitas inexistentes, já favoritas (em `add`) ou "
+        "que não eram favoritas (em `remove`) ficam de fora. Um mesmo ID não pode estar nas duas listas."
+    ),
+    tags=["Users", "Favorites"],
+)
+async def update_my_favorite_recipes(
+    changes: RecipeFavoritesBulkInput,
+    credentials: HTTPAuthorizationCredentials = Depends(security_bearer),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
+):
+    try:
+        recipe_repo = await get_recipe_repository(db)
+        usecase = UpdateFavoriteRecipesUseCase(recipe_repo)
+        result = await usecase.execute(current_user, changes.add, changes.remove)
+        if settings.FAST_JSON_ENABLED:
+            return fast_json_response({"added": result.added, "removed": result.removed})
+        return RecipeFavoritesBulkOutput.from_changes(result)
+    except ValueError as e: # ID nas duas listas
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"Erro inesperado ao alterar favoritos em lote: {e}")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
 # ----------------------
 # Get User Favorite Recipes (AUTHENTICATED)
 # ----------------------
 @router.get(
     "/users/me/favorites/recipes", 
-    response_model=List[RecipeOutput],
+    response_model=RecipeListResponse,
     summary="Listar receitas favoritas do usuário logado",
-    description="Retorna uma lista das receitas favoritas do usuário atualmente logado.",
+    description=(
+        "Retorna uma lista das receitas favoritas do usuário atualmente logado, das favoritadas "
+        "mais recentemente. Com `fields`, só esses campos são lidos e retornados. Para coleções "
+        "grandes, prefira a versão paginada (`/users/me/favorites/recipes/page`)."
+    ),
     tags=["Users", "Favorites"],
     # Removido: dependencies=[Depends(get_current_user)] 
 )
 async def get_my_favorite_recipes(
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     credentials: HTTPAuthorizationCredentials = Depends(security_bearer), # <-- Adicionado aqui
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
 ):
     print(f"DEBUG: current_user ID in get_my_favorite_recipes: {current_user.id if current_user else 'None'} Type: {type(current_user)}")
     try:
+        projection = parse_recipe_fields(fields)
         recipe_repo = await get_recipe_repository(db)
         usecase = GetUserFavoriteRecipesUseCase(recipe_repo)
-        favorite_recipes = await usecase.execute(current_user)
+        favorite_recipes = await usecase.execute(current_user, fields=projection)
+        if settings.FAST_JSON_ENABLED or projection:
+            return fast_json_response([project_recipe(r, projection or RECIPE_FIELDS) for r in favorite_recipes])
         return [RecipeOutput.from_entity(r) for r in favorite_recipes]
     except HTTPException as e:
         raise e
+    except ValueError as e: # fields inválidos
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"Erro inesperado ao listar favoritos do usuário: {e}")
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
 
+
+# ----------------------
+# Get User Favorite Recipes, paginated (AUTHENTICATED)
+# ----------------------
+@router.get(
+    "/users/me/favorites/recipes/page",
+    response_model=RecipePageResponse,
+    summary="Listar receitas favoritas do usuário logado (paginado)",
+    description=(
+        "Retorna uma página das receitas favoritas do usuário logado, das favoritadas mais "
+        "recentemente. Use o `next_cursor` da resposta como `cursor` para obter a próxima página. "
+        "Com `fields`, só esses campos são lidos e retornados. "
+        "Responde `304` quando o `If-None-Match` bate com o ETag da página."
+    ),
+    responses={304: {"description": "Página não modificada"}},
+    tags=["Users", "Favorites"],
+)
+async def get_my_favorite_recipes_page(
+    response: Response,
+    limit: int = Query(20, ge=1, le=100, description="Quantidade máxima de receitas por página"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco retornado pela página anterior"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None),
+    credentials: HTTPAuthorizationCredentials = Depends(security_bearer),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
+):
+    try:
+        projection = parse_recipe_fields(fields)
+        recipe_repo = await get_recipe_repository(db)
+        usecase = ListUserFavoriteRecipesUseCase(recipe_repo)
+        page = await usecase.execute(current_user, limit, cursor=cursor, fields=projection)
+        headers = cache_headers(page_etag(page, projection), settings.RECIPES_CACHE_MAX_AGE_SECONDS, public=False)
+        if etag_matches(if_none_match, headers["ETag"]):
+            return not_modified(headers)
+        if settings.FAST_JSON_ENABLED or projection:
+            items = [project_recipe(r, projection or RECIPE_FIELDS) for r in page.items]
+            return fast_json_response({"items": items, "next_cursor": page.next_cursor}, headers=headers)
+        response.headers.update(headers)
+        return RecipePageOutput.from_page(page)
+    except ValueError as e: # cursor ou fields inválidos
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"Erro inesperado ao listar a página de favoritos do usuário: {e}")
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
 # ----------------------
 # Update Recipe (por ID - precisa de lógica de autorização)
 # ----------------------
@@ -233,7 +803,7 @@ async def update_recipe_endpoint(
     recipe_input: RecipeInput = Body(..., description="Dados da receita para atualização"),
     credentials: HTTPAuthorizationCredentials = Depends(security_bearer), # <-- Adicionado aqui
     current_user: User = Depends(get_current_user), 
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
 ):
     print(f"DEBUG: current_user ID in update_recipe_endpoint: {current_user.id if current_user else 'None'} Type: {type(current_user)}")
     try:
@@ -252,6 +822,8 @@ async def update_recipe_endpoint(
         if not updated_recipe:
             raise HTTPException(status_code=404, detail="Recipe not found.")
         
+        if settings.FAST_JSON_ENABLED:
+            return fast_json_response(project_recipe(updated_recipe))
         return RecipeOutput.from_entity(updated_recipe)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -276,7 +848,7 @@ async def delete_recipe_endpoint(
     recipe_id: str = Path(..., description="ID da receita a ser deletada"),
     credentials: HTTPAuthorizationCredentials = Depends(security_bearer), # <-- Adicionado aqui
     current_user: User = Depends(get_current_user), 
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_db_session, scope="function"),
 ):
     print(f"DEBUG: current_user ID in delete_recipe_endpoint: {current_user.id if current_user else 'None'} Type: {type(current_user)}")
     try:
@@ -12,7 +12,8 @@ import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 # Importe HTTPAuthorizationCredentials e security_bearer do deps.py
 from fastapi.security import HTTPAuthorizationCredentials # <-- ADICIONADO
-from petfit.api.deps import get_db_session, get_user_repository, get_current_user, security_bearer # <-- ADICIONADO security_bearer
+from petfit.api.deps import get_db_session, get_user_repository, get_current_user, get_password_hasher, security_bearer # <-- ADICIONADO security_bearer
+from petfit.domain.services.password_hasher import PasswordHasher, PasswordHasherBusyError
 from petfit.infra.repositories.sqlalchemy.sqlachemy_user_repository import (
     SQLAlchemyUserRepository,
 )
@@ -23,7 +24,10 @@ from petfit.api.schemas.user_schema import (
     RegisterUserInput,
     UserOutput,
     TokenResponse,
+    user_payload,
 )
+from petfit.api.fast_json import fast_json_response
+from petfit.api.settings import settings
 from petfit.api.schemas.message_schema import MessageOutput
 from petfit.api.security import create_access_token
 from petfit.domain.repositories.user_repository import UserRepository
@@ -46,7 +50,9 @@ router = APIRouter()
     status_code=status.HTTP_201_CREATED 
 )
 async def register_user(
-    data: RegisterUserInput, db: AsyncSession = Depends(get_db_session)
+    data: RegisterUserInput,
+    db: AsyncSession = Depends(get_db_session, scope="function"),
+    hasher: PasswordHasher = Depends(get_password_hasher),
 ):
     try:
         user_repo = SQLAlchemyUserRepository(db)
@@ -55,12 +61,14 @@ async def register_user(
             id=str(uuid.uuid4()),
             name=data.name,
             email=Email(data.email),
-            password=data.password, 
+            password=await hasher.hash(data.password),
         )
         await usecase.execute(user)
         return MessageOutput(
             message="User registered successfully"
         )
+    except PasswordHasherBusyError as b:
+        raise HTTPException(status_code=503, detail=str(b), headers={"Retry-After": "1"})
     except PasswordValidationError as p:
         raise HTTPException(status_code=400, detail=str(p))
     except ValueError as e:
@@ -84,17 +92,24 @@ async def register_user(
 async def login_user(
     data: LoginUserInput,
     user_repo: UserRepository = Depends(get_user_repository),
+    hasher: PasswordHasher = Depends(get_password_hasher),
 ):
     try:
-        usecase = LoginUserUseCase(user_repo)
+        usecase = LoginUserUseCase(user_repo, hasher)
         user = await usecase.execute(Email(data.email), data.password) 
 
         if not user:
             raise HTTPException(status_code=401, detail="Invalid credentials")
         token = create_access_token(data={"sub": user.id})
+        if settings.FAST_JSON_ENABLED:
+            return fast_json_response({"access_token": token, "token_type": "bearer", "user": user_payload(user)})
         return TokenResponse(
             access_token=token, token_type="bearer", user=UserOutput.from_entity(user)
         )
+    except HTTPException as e:
+        raise e
+    except PasswordHasherBusyError as b:
+        raise HTTPException(status_code=503, detail=str(b), headers={"Retry-After": "1"})
     except PasswordValidationError as p:
         raise HTTPException(status_code=400, detail=str(p))
     except ValueError as e: 
@@ -121,6 +136,8 @@ async def get_me_user(
 ):
     print(f"DEBUG: current_user ID in get_me_user: {user.id if user else 'None'} Type: {type(user)}") # Adicione print aqui também
     try:
+        if settings.FAST_JSON_ENABLED:
+            return fast_json_response(user_payload(user))
         return UserOutput.from_entity(user)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
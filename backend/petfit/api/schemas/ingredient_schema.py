@@ -0,0 +1,11 @@
+# petfit/api/schemas/ingredient_schema.py
+
+from pydantic import BaseModel, Field
+from typing import List
+
+class IngredientSuggestion(BaseModel):
+    name: str = Field(..., description="Ingrediente normalizado (minúsculo, sem espaços nas pontas)")
+    count: int = Field(..., description="Em quantas receitas públicas o ingrediente aparece")
+
+class IngredientSuggestOutput(BaseModel):
+    items: List[IngredientSuggestion] = Field(..., description="Sugestões, das mais frequentes")
@@ -1,7 +1,10 @@
 # petfit/api/schemas/recipe_schema.py
 
+from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from petfit.domain.value_objects.recipe_fields import RECIPE_FIELDS
 
 class RecipeInput(BaseModel):
     title: str = Field(..., min_length=3, max_length=100, description="Título da receita")
@@ -15,6 +18,7 @@ class RecipeOutput(BaseModel):
     ingredients: List[str] = Field(..., description="Lista de ingredientes")
     instructions: List[str] = Field(..., description="Lista de instruções")
     is_public: bool = Field(..., description="Indica se a receita é pública")
+    created_at: Optional[datetime] = Field(None, description="Data de criação da receita")
 
     @classmethod
     def from_entity(cls, recipe):
@@ -24,8 +28,190 @@ class RecipeOutput(BaseModel):
             ingredients=recipe.ingredients,
             instructions=recipe.instructions,
             is_public=recipe.is_public,
+            created_at=recipe.created_at,
         )
 
+IS_FAVORITE_DESCRIPTION = "Se o usuário autenticado favoritou a receita (só com `with_favorites`)"
+
+class RecipeWithFavoriteOutput(RecipeOutput):
+    is_favorite: bool = Field(..., description=IS_FAVORITE_DESCRIPTION)
+
+class RecipeProjectionOutput(BaseModel):
+    """Receita de uma listagem com `fields=` ou `with_favorites`: só o `id` sempre vem; os demais, se pedidos."""
+    id: str = Field(..., description="ID da receita")
+    title: Optional[str] = Field(None, description="Título da receita")
+    ingredients: Optional[List[str]] = Field(None, description="Lista de ingredientes")
+    instructions: Optional[List[str]] = Field(None, description="Lista de instruções")
+    is_public: Optional[bool] = Field(None, description="Indica se a receita é pública")
+    created_at: Optional[datetime] = Field(None, description="Data de criação da receita")
+    is_favorite: Optional[bool] = Field(None, description=IS_FAVORITE_DESCRIPTION)
+
+# Versões dict dos schemas, para o caminho rápido (orjson) que não passa pelo Pydantic
+
+def project_recipe(recipe, fields: Sequence[str] = RECIPE_FIELDS) -> Dict[str, Any]:
+    """RecipeOutput como dict; com `fields=`, só os campos pedidos."""
+    return {name: getattr(recipe, name) for name in fields}
+
+def search_hit_payload(hit, fields: Sequence[str] = RECIPE_FIELDS) -> Dict[str, Any]:
+    """RecipeSearchHitOutput como dict."""
+    return {**project_recipe(hit.recipe, fields), "rank": hit.rank, "snippet": hit.snippet}
+
+def ingredient_match_payload(match) -> Dict[str, Any]:
+    """RecipeIngredientMatchOutput como dict."""
+    return {**project_recipe(match.recipe), "matched_count": match.matched}
+
+def annotate_favorites(payloads: List[Dict[str, Any]], favorite_ids) -> List[Dict[str, Any]]:
+    """Acrescenta `is_favorite` a cada receita (já em dict) de uma listagem."""
+    for payload in payloads:
+        payload["is_favorite"] = payload["id"] in favorite_ids
+    return payloads
+
+class RecipePageOutput(BaseModel):
+    items: List[RecipeOutput] = Field(..., description="Receitas da página")
+    next_cursor: Optional[str] = Field(None, description="Cursor da próxima página (nulo na última)")
+
+    @classmethod
+    def from_page(cls, page):
+        return cls(
+            items=[RecipeOutput.from_entity(r) for r in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+class RecipeProjectionPageOutput(BaseModel):
+    items: List[RecipeProjectionOutput] = Field(..., description="Receitas da página, só com os campos pedidos")
+    next_cursor: Optional[str] = Field(None, description="Cursor da próxima página (nulo na última)")
+
+# Listagens com `fields=` (ou `with_favorites`): a resposta segue o schema de projeção em vez do completo
+RecipePageResponse = Union[RecipePageOutput, RecipeProjectionPageOutput]
+RecipeListResponse = Union[List[RecipeOutput], List[RecipeProjectionOutput]]
+
+class RecipeSearchHitOutput(RecipeOutput):
+    rank: float = Field(..., description="Relevância da receita para a busca")
+    snippet: str = Field(..., description="Trecho com os termos encontrados entre « e »")
+
+    @classmethod
+    def from_result(cls, result):
+        return cls(
+            **RecipeOutput.from_entity(result.recipe).model_dump(),
+            rank=result.rank,
+            snippet=result.snippet,
+        )
+
+class RecipeSearchPageOutput(BaseModel):
+    items: List[RecipeSearchHitOutput] = Field(..., description="Receitas encontradas, da mais relevante")
+    next_cursor: Optional[str] = Field(None, description="Cursor da próxima página (nulo na última)")
+
+    @classmethod
+    def from_page(cls, page):
+        return cls(
+            items=[RecipeSearchHitOutput.from_result(r) for r in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+class RecipeSearchHitProjectionOutput(RecipeProjectionOutput):
+    rank: float = Field(..., description="Relevância da receita para a busca")
+    snippet: str = Field(..., description="Trecho com os termos encontrados entre « e »")
+
+class RecipeSearchProjectionPageOutput(BaseModel):
+    items: List[RecipeSearchHitProjectionOutput] = Field(..., description="Receitas encontradas, só com os campos pedidos")
+    next_cursor: Optional[str] = Field(None, description="Cursor da próxima página (nulo na última)")
+
+RecipeSearchPageResponse = Union[RecipeSearchPageOutput, RecipeSearchProjectionPageOutput]
+
+class RecipeIngredientMatchOutput(RecipeOutput):
+    matched_count: int = Field(..., description="Quantos dos ingredientes pedidos a receita contém")
+
+    @classmethod
+    def from_match(cls, match):
+        return cls(**RecipeOutput.from_entity(match.recipe).model_dump(), matched_count=match.matched)
+
+class RecipeIngredientMatchPageOutput(BaseModel):
+    items: List[RecipeIngredientMatchOutput] = Field(..., description="Receitas encontradas, das que mais casam")
+    next_cursor: Optional[str] = Field(None, description="Cursor da próxima página (nulo na última)")
+
+    @classmethod
+    def from_page(cls, page):
+        return cls(
+            items=[RecipeIngredientMatchOutput.from_match(m) for m in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+MAX_INGREDIENTS_QUERY = 20
+
+def popularity_payload(item) -> Dict[str, Any]:
+    """RecipePopularOutput como dict."""
+    return {**project_recipe(item.recipe), "favorite_count": item.favorite_count}
+
+class RecipePopularOutput(RecipeOutput):
+    favorite_count: int = Field(..., description="Quantos usuários favoritaram a receita")
+
+    @classmethod
+    def from_popularity(cls, item):
+        return cls(**RecipeOutput.from_entity(item.recipe).model_dump(), favorite_count=item.favorite_count)
+
+def trend_payload(trend) -> Dict[str, Any]:
+    """RecipeTrendingOutput como dict."""
+    return {**project_recipe(trend.recipe), "score": trend.score}
+
+class RecipeTrendingOutput(RecipeOutput):
+    score: float = Field(..., description="Favoritos recentes, cada um valendo metade a cada meia-vida")
+
+    @classmethod
+    def from_trend(cls, trend):
+        return cls(**RecipeOutput.from_entity(trend.recipe).model_dump(), score=trend.score)
+
+class RecipeTrendingListOutput(BaseModel):
+    items: List[RecipeTrendingOutput] = Field(..., description="Receitas em alta, em ordem decrescente de escore")
+
+    @classmethod
+    def from_trends(cls, trends):
+        return cls(items=[RecipeTrendingOutput.from_trend(trend) for trend in trends])
+
+class RecipePopularListOutput(BaseModel):
+    items: List[RecipePopularOutput] = Field(..., description="Receitas mais favoritadas, em ordem decrescente")
+
+    @classmethod
+    def from_ranking(cls, ranking):
+        return cls(items=[RecipePopularOutput.from_popularity(item) for item in ranking])
+
+MAX_BATCH_GET_IDS = 500
+
+class RecipeBatchGetInput(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_GET_IDS, description="IDs das receitas")
+
+class RecipeBatchGetOutput(BaseModel):
+    items: List[RecipeOutput] = Field(..., description="Receitas encontradas, na ordem dos IDs pedidos")
+    missing: List[str] = Field(..., description="IDs que não correspondem a nenhuma receita")
+
+class RecipeBatchGetWithFavoritesOutput(BaseModel):
+    items: List[RecipeWithFavoriteOutput] = Field(..., description="Receitas encontradas, marcadas com `is_favorite`")
+    missing: List[str] = Field(..., description="IDs que não correspondem a nenhuma receita")
+
+RecipeBatchGetResponse = Union[RecipeBatchGetOutput, RecipeBatchGetWithFavoritesOutput]
+
+class RecipeImportError(BaseModel):
+    index: int = Field(..., description="Posição da linha na entrada (a partir de 0)")
+    error: str = Field(..., description="Motivo da rejeição")
+
+class RecipeImportOutput(BaseModel):
+    imported: int = Field(..., description="Quantidade de receitas criadas")
+    failed: int = Field(..., description="Quantidade de linhas rejeitadas")
+    errors: List[RecipeImportError] = Field(..., description="Erros por linha")
+
+MAX_BULK_FAVORITES = 500
+
+class RecipeFavoritesBulkInput(BaseModel):
+    add: List[str] = Field(default_factory=list, max_length=MAX_BULK_FAVORITES, description="IDs a favoritar")
+    remove: List[str] = Field(default_factory=list, max_length=MAX_BULK_FAVORITES, description="IDs a desfavoritar")
+
+class RecipeFavoritesBulkOutput(BaseModel):
+    added: List[str] = Field(..., description="IDs que passaram a ser favoritos")
+    removed: List[str] = Field(..., description="IDs que deixaram de ser favoritos")
+
+    @classmethod
+    def from_changes(cls, changes):
+        return cls(added=changes.added, removed=changes.removed)
+
 class RecipeFavoriteResponse(BaseModel):
     message: str
     recipe_id: str
\ No newline at end of file
@@ -1,12 +1,18 @@
-from pydantic import BaseModel, EmailStr, Field
-from typing import Literal
+from pydantic import BaseModel, EmailStr, Field, field_validator
+from typing import Any, Dict, Literal
 from petfit.domain.entities.user import User
 from petfit.domain.value_objects.password import Password
 
 class RegisterUserInput(BaseModel):
     name: str = Field(..., min_length=3, max_length=50, description="Nome do usuário")
     email: EmailStr = Field(..., description="Email do usuário")
-    password: Password = Field(..., description="Senha do usuário") 
+    # Só valida a força aqui; o hash é feito pelo PasswordHasher, fora do event loop
+    password: str = Field(..., description="Senha do usuário")
+
+    @field_validator("password")
+    @classmethod
+    def validate_password(cls, value: str) -> str:
+        return Password.validate_plain(value)
 
 
 class LoginUserInput(BaseModel):
@@ -47,4 +53,9 @@ def user_to_output(user: User) -> UserOutput:
         name=user.name,
         email=str(user.email),
 
-    )
\ No newline at end of file
+    )
+
+
+def user_payload(user: User) -> Dict[str, Any]:
+    """UserOutput como dict, para o caminho rápido (orjson) que não passa pelo Pydantic."""
+    return {"id": user.id, "name": user.name, "email": str(user.email)}
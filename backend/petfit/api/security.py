@@ -17,8 +17,10 @@ def get_password_hash(password):
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
-    expire = datetime.now() + (expires_delta or timedelta(minutes=15))
-    to_encode.update({"exp": expire})
+    issued_at = datetime.now()
+    expire = issued_at + (expires_delta or timedelta(minutes=15))
+    # "iat" também compõe a chave do cache de principal em deps.get_current_user
+    to_encode.update({"exp": expire, "iat": issued_at})
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
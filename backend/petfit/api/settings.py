@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import ClassVar
 
@@ -24,6 +25,71 @@ class Settings(BaseSettings):
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
 
+    # Cache do usuário autenticado (get_current_user)
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    AUTH_CACHE_MAX_SIZE: int = 10_000
+
+    # Cache read-through de receitas (get_by_id, lista pública, favoritos)
+    RECIPE_CACHE_ENABLED: bool = True
+    RECIPE_CACHE_TTL_SECONDS: int = 30
+    RECIPE_CACHE_MAX_SIZE: int = 10_000
+
+    # Leituras de receitas idênticas e simultâneas compartilham uma única consulta
+    RECIPE_SINGLE_FLIGHT_ENABLED: bool = True
+
+    # Tamanho do lote lido do cursor no servidor na exportação (NDJSON/CSV)
+    RECIPES_EXPORT_BATCH_SIZE: int = 2000
+
+    # Linhas por INSERT multi-linhas na importação em massa de receitas
+    RECIPES_IMPORT_CHUNK_SIZE: int = 1000
+
+    # Limites da importação: tamanho de uma linha NDJSON e do corpo inteiro de um array JSON (413 acima)
+    RECIPES_IMPORT_MAX_LINE_BYTES: int = 64 * 1024
+    RECIPES_IMPORT_MAX_BODY_BYTES: int = 16 * 1024 * 1024
+
+    # max-age do Cache-Control nas leituras de receitas (revalidadas via ETag)
+    RECIPES_CACHE_MAX_AGE_SECONDS: int = 30
+
+    # Pool de threads do bcrypt: workers simultâneos e fila máxima antes de rejeitar (503)
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # Tamanho do lote lido do cursor no servidor nas respostas em streaming (NDJSON)
+    RECIPES_STREAM_BATCH_SIZE: int = 500
+
+    # Rotas de receitas/usuários codificam a resposta direto com orjson, sem revalidar pelo response_model
+    FAST_JSON_ENABLED: bool = True
+
+    # Snapshot pré-serializado da primeira página de GET /recipes, compartilhado entre workers via mmap
+    FEED_SNAPSHOT_ENABLED: bool = True
+    FEED_SNAPSHOT_PATH: str = os.path.join(tempfile.gettempdir(), "petfit-public-feed.snapshot")
+    FEED_SNAPSHOT_DEBOUNCE_SECONDS: float = 1.0
+    # Reconstrução periódica (cobre escritas feitas fora da API); snapshots mais velhos que o máximo são ignorados
+    FEED_SNAPSHOT_REFRESH_SECONDS: int = 60
+    FEED_SNAPSHOT_MAX_AGE_SECONDS: int = 180
+
+    # Reconstrução periódica do índice de autocomplete de ingredientes (0 desliga)
+    INGREDIENT_INDEX_REFRESH_SECONDS: int = 300
+
+    # Intervalo da consolidação dos shards do contador de favoritos em recipes.favorite_count (0 desliga)
+    FAVORITE_COUNT_FOLD_SECONDS: int = 10
+
+    # Tendências: meia-vida do peso de cada favorito, tamanho do top-K em memória e
+    # intervalo do agregador que consome o log de favoritos (0 desliga)
+    TRENDING_HALF_LIFE_HOURS: float = 12.0
+    TRENDING_TOP_K: int = 100
+    TRENDING_REFRESH_SECONDS: int = 30
+    TRENDING_AGGREGATE_BATCH_SIZE: int = 10_000
+
+    # Compressão gzip/brotli negociada pelo Accept-Encoding (respostas menores que o mínimo saem sem compressão)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    # Corpos comprimidos de respostas com ETag, reaproveitados entre requisições
+    COMPRESSION_CACHE_MAX_SIZE: int = 1_000
+    COMPRESSION_CACHE_TTL_SECONDS: int = 300
+
     # env_file = ".env"
     # extra = "forbid"
     # model_config = {
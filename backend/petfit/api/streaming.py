@@ -0,0 +1,142 @@
+# petfit/api/streaming.py
+
+import csv
+import io
+import json
+from datetime import datetime
+
+import orjson
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Mapping, Optional, Sequence
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv"
+
+RowBatches = AsyncIterator[Sequence[Mapping[str, Any]]]
+
+NDJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE
+
+
+def wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def encode_ndjson_batch(batch: Sequence[Mapping[str, Any]]) -> bytes:
+    """Codifica um lote de linhas como NDJSON (uma linha JSON por registro), no mesmo formato do FastJSONResponse."""
+    return b"".join(orjson.dumps(dict(row), option=NDJSON_OPTIONS) for row in batch)
+
+
+def _csv_cell(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False) # arrays viram JSON dentro da célula
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def encode_csv_batch(batch: Sequence[Mapping[str, Any]], columns: Sequence[str]) -> bytes:
+    """Codifica um lote de linhas como CSV (sem cabeçalho)."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerows([_csv_cell(row[column]) for column in columns] for row in batch)
+    return out.getvalue().encode("utf-8")
+
+
+def csv_header(columns: Sequence[str]) -> bytes:
+    out = io.StringIO()
+    csv.writer(out).writerow(columns)
+    return out.getvalue().encode("utf-8")
+
+
+async def _prime(batches: RowBatches) -> RowBatches:
+    # Lê o primeiro lote antes de responder: erros de consulta/cursor ainda viram
+    # uma resposta HTTP normal em vez de cortar o stream no meio
+    first = await anext(batches, None)
+
+    async def chained() -> RowBatches:
+        if first is not None:
+            yield first
+        async for batch in batches:
+            yield batch
+
+    return chained()
+
+
+async def encoded_stream_response(
+    batches: RowBatches,
+    encode: Callable[[Sequence[Mapping[str, Any]]], bytes],
+    media_type: str,
+    prefix: bytes = b"",
+    headers: Optional[Dict[str, str]] = None,
+) -> StreamingResponse:
+    """Resposta em streaming que codifica cada lote direto para bytes."""
+    primed = await _prime(batches)
+
+    async def body() -> AsyncIterator[bytes]:
+        if prefix:
+            yield prefix
+        async for batch in primed:
+            yield encode(batch)
+
+    return StreamingResponse(body(), media_type=media_type, headers=headers)
+
+
+async def ndjson_response(batches: RowBatches, headers: Optional[Dict[str, str]] = None) -> StreamingResponse:
+    return await encoded_stream_response(batches, encode_ndjson_batch, NDJSON_MEDIA_TYPE, headers=headers)
+
+
+async def csv_response(
+    batches: RowBatches, columns: Sequence[str], headers: Optional[Dict[str, str]] = None
+) -> StreamingResponse:
+    return await encoded_stream_response(
+        batches,
+        lambda batch: encode_csv_batch(batch, columns),
+        f"{CSV_MEDIA_TYPE}; charset=utf-8",
+        prefix=csv_header(columns),
+        headers=headers,
+    )
+
+
+class PayloadTooLargeError(Exception):
+    pass
+
+
+async def iter_ndjson_lines(chunks: AsyncIterable[bytes], max_line_bytes: int) -> AsyncIterator[bytes]:
+    """Quebra um corpo NDJSON recebido em pedaços em linhas, sem ler o corpo inteiro.
+
+    Só o pedaço novo é varrido atrás de `\\n`; uma linha maior que `max_line_bytes`
+    levanta PayloadTooLargeError em vez de crescer o buffer indefinidamente.
+    """
+    buffer = bytearray()
+    async for chunk in chunks:
+        start = 0
+        end = chunk.find(b"\n")
+        while end != -1:
+            buffer += chunk[start:end]
+            if len(buffer) > max_line_bytes:
+                raise PayloadTooLargeError(f"NDJSON line exceeds {max_line_bytes} bytes.")
+            if buffer.strip():
+                yield bytes(buffer)
+            buffer.clear()
+            start = end + 1
+            end = chunk.find(b"\n", start)
+        buffer += chunk[start:]
+        if len(buffer) > max_line_bytes:
+            raise PayloadTooLargeError(f"NDJSON line exceeds {max_line_bytes} bytes.")
+    if buffer.strip():
+        yield bytes(buffer)
+
+
+async def read_body(request: Request, max_bytes: int) -> bytes:
+    """Lê o corpo inteiro, levantando PayloadTooLargeError acima de `max_bytes` (pelo Content-Length ou lido)."""
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > max_bytes:
+        raise PayloadTooLargeError(f"Body exceeds {max_bytes} bytes.")
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_bytes:
+            raise PayloadTooLargeError(f"Body exceeds {max_bytes} bytes.")
+    return bytes(body)
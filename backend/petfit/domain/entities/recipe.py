@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List, Optional
 
 class Recipe:
@@ -5,14 +6,17 @@ class Recipe:
         self,
         id: str,
         title: str,
-        ingredients: str,
-        instructions: str,
+        ingredients: List[str],
+        instructions: List[str],
         is_public: bool = True,
-    
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
     ):
         self.id = id
         self.title = title
         self.ingredients = ingredients
         self.instructions = instructions
         self.is_public = is_public
+        self.created_at = created_at
+        self.updated_at = updated_at # muda a cada alteração; base do ETag
 
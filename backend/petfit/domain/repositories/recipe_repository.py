@@ -1,9 +1,16 @@
 # petfit/domain/repositories/recipe_repository.py
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, AsyncIterator, List, Mapping, Optional, Sequence, Set, Tuple
 from petfit.domain.entities.recipe import Recipe
 from petfit.domain.entities.user import User # Para tipagem nas operações de favoritos
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.page import Page
+from petfit.domain.value_objects.recipe_sort import RecipeSort
+from petfit.domain.value_objects.recipe_search_result import RecipeSearchResult
+from petfit.domain.value_objects.recipe_ingredient_match import RecipeIngredientMatch
+from petfit.domain.value_objects.recipe_popularity import RecipePopularity
+from petfit.domain.value_objects.favorite_changes import FavoriteChanges
 
 class RecipeRepository(ABC):
     @abstractmethod
@@ -11,36 +18,142 @@ class RecipeRepository(ABC):
         """Cria uma nova receita."""
         pass
 
+    @abstractmethod
+    async def create_many(self, recipes: List[Recipe]) -> int:
+        """Cria várias receitas de uma vez (INSERT multi-linhas num SAVEPOINT: se falhar, só esse lote é desfeito). Retorna quantas foram criadas.
+        Levanta ValueError, com o motivo dado pelo banco, se alguma receita do lote for rejeitada."""
+        pass
+
     @abstractmethod
     async def get_by_id(self, recipe_id: str) -> Optional[Recipe]:
         """Obtém uma receita pelo ID."""
         pass
 
     @abstractmethod
-    async def get_all_public_recipes(self) -> Recipe:
+    async def get_many(self, recipe_ids: List[str]) -> List[Recipe]:
+        """Obtém várias receitas pelos IDs numa só consulta, na ordem dos IDs; IDs inexistentes são omitidos."""
+        pass
+
+    @abstractmethod
+    async def get_all_public_recipes(self) -> List[Recipe]:
         """Obtém todas as receitas públicas."""
         pass
 
     @abstractmethod
-    async def add_favorite(self, user: User, recipe: Recipe) -> bool:
-        """Adiciona uma receita aos favoritos de um usuário. Retorna True se adicionado com sucesso."""
+    async def get_public_recipes_page(
+        self,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+        sort: RecipeSort = RecipeSort.NEWEST,
+        title: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[Recipe]:
+        """Obtém uma página de receitas públicas (paginação keyset) a partir do cursor, com filtros opcionais.
+
+        Com `fields`, só essas colunas são lidas; os demais atributos das receitas vêm como None.
+        """
+        pass
+
+    @abstractmethod
+    async def search_public_recipes(
+        self,
+        query: str,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[RecipeSearchResult]:
+        """Busca textual nas receitas públicas (título, ingredientes e instruções), da mais para a menos relevante."""
+        pass
+
+    @abstractmethod
+    async def find_public_recipes_by_ingredients(
+        self,
+        ingredients: List[str],
+        match_all: bool,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+    ) -> Page[RecipeIngredientMatch]:
+        """Receitas públicas que contêm todos (`match_all`) ou algum dos ingredientes já normalizados, das que mais casam para as que menos."""
+        pass
+
+    @abstractmethod
+    async def get_popular_recipes(self, limit: int) -> List[RecipePopularity]:
+        """As `limit` receitas públicas mais favoritadas, com a contagem de favoritos de cada uma."""
+        pass
+
+    @abstractmethod
+    async def get_trending_scores(self, limit: int) -> List[Tuple[str, float]]:
+        """(recipe_id, log_score) das `limit` receitas públicas em alta, da maior para a menor (escala de TrendingDecay)."""
         pass
 
     @abstractmethod
-    async def remove_favorite(self, user: User, recipe: Recipe) -> bool:
+    def stream_public_recipes(
+        self,
+        sort: RecipeSort = RecipeSort.NEWEST,
+        cursor: Optional[Cursor] = None,
+        title: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        batch_size: int = 500,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Sequence[Mapping[str, Any]]]:
+        """Itera (async) sobre as receitas públicas em lotes de linhas cruas, sem montar a lista inteira em memória."""
+        pass
+
+    @abstractmethod
+    def stream_recipes(
+        self,
+        is_public: Optional[bool] = None,
+        title: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Mapping[str, Any]]]:
+        """Itera (async) sobre todas as receitas (ou as filtradas) em lotes de linhas cruas, sem ordem definida."""
+        pass
+
+    @abstractmethod
+    async def add_favorite(self, user: User, recipe_id: str) -> bool:
+        """Adiciona uma receita aos favoritos de um usuário. Retorna True se adicionado, False se já era favorita.
+        Levanta ValueError se a receita não existir."""
+        pass
+
+    @abstractmethod
+    async def remove_favorite(self, user: User, recipe_id: str) -> bool:
         """Remove uma receita dos favoritos de um usuário. Retorna True se removido com sucesso."""
         pass
 
     @abstractmethod
-    async def get_user_favorite_recipes(self, user: User) -> List[Recipe]:
+    async def update_favorites(self, user: User, add: Sequence[str], remove: Sequence[str]) -> FavoriteChanges:
+        """Adiciona e remove vários favoritos numa só transação (IDs sem sobreposição).
+        IDs de receitas inexistentes, já favoritas (em `add`) ou não favoritas (em `remove`) são ignorados."""
+        pass
+
+    @abstractmethod
+    async def get_user_favorite_recipes(self, user: User, fields: Optional[Sequence[str]] = None) -> List[Recipe]:
         """Obtém todas as receitas favoritas de um usuário."""
         pass
 
+    @abstractmethod
+    async def get_user_favorite_recipes_page(
+        self,
+        user: User,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[Recipe]:
+        """Obtém uma página das receitas favoritas de um usuário, das favoritadas mais recentemente (paginação keyset)."""
+        pass
+
     @abstractmethod
     async def is_favorite(self, user: User, recipe: Recipe) -> bool:
         """Verifica se uma receita é favorita de um usuário."""
         pass
 
+    @abstractmethod
+    async def get_favorite_recipe_ids(self, user: User, recipe_ids: Sequence[str]) -> Set[str]:
+        """Dentre `recipe_ids`, os que são favoritos do usuário (uma consulta só, para marcar uma página inteira)."""
+        pass
+
     @abstractmethod
     async def update(self, recipe: Recipe) -> Optional[Recipe]:
         """Atualiza uma receita existente."""
@@ -30,7 +30,7 @@ class UserRepository(ABC):
 
     @abstractmethod
     # Retorno Optional[User] para consistência com InMemory
-    def update(self, user: User) -> Optional[User]:
+    async def update(self, user: User) -> Optional[User]:
         pass
 
 
@@ -38,4 +38,7 @@ class UserRepository(ABC):
     async def get_by_email(self, email: Email) -> Optional[User]: ...
 
     @abstractmethod
-    async def get_by_id(self, id: str) -> Optional[User]: ...
\ No newline at end of file
+    async def get_by_id(self, id: str) -> Optional[User]: ...
+
+    @abstractmethod
+    async def delete(self, id: str) -> bool: ...
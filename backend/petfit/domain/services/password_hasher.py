@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from petfit.domain.value_objects.password import Password
+
+
+class PasswordHasherBusyError(Exception):
+    """A fila de hashing está cheia; a requisição deve ser rejeitada (e repetida depois)."""
+    pass
+
+
+class PasswordHasher(ABC):
+    @abstractmethod
+    async def hash(self, plain_password: str) -> Password:
+        """Valida e gera o hash de uma senha em texto claro."""
+        pass
+
+    @abstractmethod
+    async def verify(self, password: Password, plain_password: str) -> bool:
+        """Verifica uma senha em texto claro contra o hash armazenado."""
+        pass
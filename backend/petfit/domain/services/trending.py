@@ -0,0 +1,32 @@
+import math
+from datetime import datetime, timezone
+
+# Referência fixa da escala logarítmica dos escores de tendência (não mude: invalida os escores salvos)
+TRENDING_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class TrendingDecay:
+    """Decaimento exponencial dos favoritos: cada um vale 1 ao acontecer e metade a cada `half_life_seconds`.
+
+    O escore de uma receita é a soma desses pesos. Para não reescrever todos os
+    escores conforme o tempo passa, eles são guardados em escala log relativa a
+    TRENDING_EPOCH: log_score = ln(Σ e^(λ·(tᵢ − epoch))). Essa forma só cresce com
+    novos favoritos e ordena as receitas exatamente como o escore decaído de agora.
+    """
+
+    def __init__(self, half_life_seconds: float):
+        self.rate = math.log(2) / half_life_seconds
+
+    def log_weight(self, at: datetime) -> float:
+        """Peso (em escala log) de um favorito feito em `at`."""
+        return self.rate * (at - TRENDING_EPOCH).total_seconds()
+
+    def score(self, log_score: float, now: datetime) -> float:
+        """Escore decaído até `now`: quantos favoritos "recentes" a receita vale."""
+        return math.exp(log_score - self.log_weight(now))
+
+
+def log_add_exp(a: float, b: float) -> float:
+    """ln(e^a + e^b) sem overflow."""
+    high, low = (a, b) if a >= b else (b, a)
+    return high + math.log1p(math.exp(low - high))
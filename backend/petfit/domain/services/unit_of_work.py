@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+
+class UnitOfWork(ABC):
+    """Transação que agrupa várias chamadas de repositório.
+
+    Os repositórios só fazem flush; quem confirma é a unidade de trabalho, uma vez,
+    ao sair do bloco sem erro (ou desfaz tudo se o bloco falhar). Efeitos fora do
+    banco (caches, índices, snapshots) são agendados com `after_commit`:
+
+        async with unit_of_work:
+            await recipes.create(recipe)
+            await recipes.add_favorite(user, recipe.id)
+    """
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+
+    @property
+    @abstractmethod
+    def has_writes(self) -> bool:
+        """Se há escritas ainda não confirmadas (leituras agora precisam ver a própria transação)."""
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Confirma tudo o que foi escrito desde o último commit/rollback."""
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Desfaz tudo o que foi escrito desde o último commit/rollback."""
+        pass
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Agenda `callback` para logo depois do próximo commit; um rollback o descarta."""
+        pass
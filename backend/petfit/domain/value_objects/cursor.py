@@ -0,0 +1,36 @@
+import base64
+import binascii
+import json
+from typing import Any, List
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+class Cursor:
+    """Cursor opaco de paginação keyset: guarda a ordenação e a chave do último item."""
+
+    def __init__(self, sort: str, values: List[Any]):
+        self.sort = sort
+        self.values = values
+
+    def encode(self) -> str:
+        raw = json.dumps([self.sort, self.values], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            sort, values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError, TypeError):
+            raise InvalidCursorError("Invalid pagination cursor.")
+        if not isinstance(sort, str) or not isinstance(values, list):
+            raise InvalidCursorError("Invalid pagination cursor.")
+        return cls(sort, values)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Cursor):
+            return self.sort == other.sort and self.values == other.values
+        return NotImplemented
@@ -0,0 +1,9 @@
+from typing import List
+
+
+class FavoriteChanges:
+    """Resultado de uma alteração em lote dos favoritos: o que de fato mudou."""
+
+    def __init__(self, added: List[str], removed: List[str]):
+        self.added = added # não eram favoritas (e existem)
+        self.removed = removed # eram favoritas
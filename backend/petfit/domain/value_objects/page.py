@@ -0,0 +1,11 @@
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Page(Generic[T]):
+    """Uma página de resultados e o cursor para a próxima (None na última página)."""
+
+    def __init__(self, items: List[T], next_cursor: Optional[str] = None):
+        self.items = items
+        self.next_cursor = next_cursor
@@ -9,16 +9,23 @@ class PasswordValidationError(Exception):
 class Password:
     def __init__(self, value: str, hashed: bool = False):
         if not hashed:
-            if not self._is_valid(value):
-                raise ValueError("Password must be at least 8 characters and contain letters and numbers.")
+            self.validate_plain(value)
             self._value = self._hash_password(value) # Armazenar o hash
         else:
             self._value = value # Já é um hash
 
-    def _is_valid(self, password: str) -> bool:
+    @staticmethod
+    def _is_valid(password: str) -> bool:
         # Estas validações são para a senha em TEXTO CLARO antes de hash
         return len(password) >= 8 and any(c.isalpha() for c in password) and any(c.isdigit() for c in password)
 
+    @classmethod
+    def validate_plain(cls, value: str) -> str:
+        # Só valida a senha em texto claro, sem hashear (o hash pode ser feito fora do event loop)
+        if not cls._is_valid(value):
+            raise ValueError("Password must be at least 8 characters and contain letters and numbers.")
+        return value
+
     def _hash_password(self, password: str) -> str:
         # Hashear a senha
         hashed_bytes = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
@@ -0,0 +1,19 @@
+from typing import Optional, Tuple
+
+# Campos de uma receita que as listagens podem projetar (`fields=`), na ordem do RecipeOutput
+RECIPE_FIELDS: Tuple[str, ...] = ("id", "title", "ingredients", "instructions", "is_public", "created_at")
+
+
+class InvalidFieldsError(ValueError):
+    pass
+
+
+def parse_recipe_fields(raw: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Converte `fields=title,created_at` na projeção pedida (sempre com `id`); None é a receita inteira."""
+    if raw is None or not raw.strip():
+        return None
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested - set(RECIPE_FIELDS)
+    if unknown:
+        raise InvalidFieldsError(f"Unknown fields: {', '.join(sorted(unknown))}.")
+    return tuple(name for name in RECIPE_FIELDS if name == "id" or name in requested)
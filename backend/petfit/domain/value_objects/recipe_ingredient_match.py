@@ -0,0 +1,9 @@
+from petfit.domain.entities.recipe import Recipe
+
+
+class RecipeIngredientMatch:
+    """Receita encontrada pela busca por ingredientes, com quantos deles ela contém."""
+
+    def __init__(self, recipe: Recipe, matched: int):
+        self.recipe = recipe
+        self.matched = matched
@@ -0,0 +1,9 @@
+from petfit.domain.entities.recipe import Recipe
+
+
+class RecipePopularity:
+    """Receita com a quantidade de usuários que a favoritaram."""
+
+    def __init__(self, recipe: Recipe, favorite_count: int):
+        self.recipe = recipe
+        self.favorite_count = favorite_count
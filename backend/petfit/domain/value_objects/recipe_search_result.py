@@ -0,0 +1,10 @@
+from petfit.domain.entities.recipe import Recipe
+
+
+class RecipeSearchResult:
+    """Receita encontrada na busca textual, com a relevância e o trecho destacado."""
+
+    def __init__(self, recipe: Recipe, rank: float, snippet: str):
+        self.recipe = recipe
+        self.rank = rank
+        self.snippet = snippet
@@ -0,0 +1,9 @@
+from petfit.domain.entities.recipe import Recipe
+
+
+class RecipeTrend:
+    """Receita em alta, com o escore de favoritos recentes (decaído no tempo)."""
+
+    def __init__(self, recipe: Recipe, score: float):
+        self.recipe = recipe
+        self.score = score
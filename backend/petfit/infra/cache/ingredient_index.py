@@ -0,0 +1,96 @@
+# petfit/infra/cache/ingredient_index.py
+
+import bisect
+import heapq
+from typing import Any, AsyncIterable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+
+def normalize_ingredient(name: str) -> str:
+    """Mesma normalização da coluna ingredients_normalized: sem caixa e sem espaços nas pontas."""
+    return name.strip().lower()
+
+
+class IngredientIndex:
+    """Índice de prefixos dos ingredientes das receitas públicas, em memória.
+
+    Mantém a frequência de cada ingrediente (em quantas receitas aparece) e um
+    array ordenado dos nomes: a busca por prefixo é um bisect + top-K pela
+    frequência, sem tocar no banco. As escritas do repositório o atualizam
+    incrementalmente e `rebuild` o reconstrói a partir do banco periodicamente.
+
+    Não é thread-safe: foi feito para ser usado de dentro do event loop.
+    """
+
+    def __init__(self) -> None:
+        self._by_recipe: Dict[str, FrozenSet[str]] = {}
+        self._counts: Dict[str, int] = {}
+        self._names: List[str] = []
+        # Escritas que chegam durante um rebuild são reaplicadas sobre o índice novo
+        self._pending: Optional[List[Tuple[str, Optional[FrozenSet[str]]]]] = None
+        self.rebuilds = 0
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def put(self, recipe_id: str, ingredients: Iterable[str], is_public: bool = True) -> None:
+        """Registra (ou substitui) os ingredientes de uma receita; receitas privadas saem do índice."""
+        names = frozenset(n for n in (normalize_ingredient(i) for i in ingredients) if n) if is_public else None
+        if self._pending is not None:
+            self._pending.append((recipe_id, names))
+        self._apply(recipe_id, names)
+
+    def discard(self, recipe_id: str) -> None:
+        if self._pending is not None:
+            self._pending.append((recipe_id, None))
+        self._apply(recipe_id, None)
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """Os `limit` ingredientes mais frequentes que começam com `prefix`."""
+        prefix = normalize_ingredient(prefix)
+        start = bisect.bisect_left(self._names, prefix)
+        end = bisect.bisect_left(self._names, prefix + "\uffff", lo=start)
+        candidates = self._names[start:end]
+        best = heapq.nsmallest(limit, candidates, key=lambda name: (-self._counts[name], name))
+        return [(name, self._counts[name]) for name in best]
+
+    async def rebuild(self, batches: AsyncIterable[Sequence[Mapping[str, Any]]]) -> None:
+        """Reconstrói o índice a partir de lotes de linhas com `id` e `ingredients` (receitas públicas)."""
+        self._pending = []
+        try:
+            fresh = IngredientIndex()
+            async for batch in batches:
+                for row in batch:
+                    fresh._apply(row["id"], frozenset(
+                        n for n in (normalize_ingredient(i) for i in row["ingredients"]) if n
+                    ))
+            pending = self._pending
+            self._by_recipe, self._counts, self._names = fresh._by_recipe, fresh._counts, fresh._names
+            for recipe_id, names in pending:
+                self._apply(recipe_id, names)
+            self.rebuilds += 1
+        finally:
+            self._pending = None
+
+    def _apply(self, recipe_id: str, names: Optional[FrozenSet[str]]) -> None:
+        previous = self._by_recipe.pop(recipe_id, frozenset())
+        current = names or frozenset()
+        if current:
+            self._by_recipe[recipe_id] = current
+        for name in previous - current:
+            self._counts[name] -= 1
+            if self._counts[name] == 0:
+                del self._counts[name]
+                del self._names[bisect.bisect_left(self._names, name)]
+        for name in current - previous:
+            if name in self._counts:
+                self._counts[name] += 1
+            else:
+                self._counts[name] = 1
+                bisect.insort(self._names, name)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "ingredients": len(self._names),
+            "recipes": len(self._by_recipe),
+            "rebuilds": self.rebuilds,
+        }
@@ -0,0 +1,33 @@
+# petfit/infra/cache/principal_cache.py
+
+from typing import Any, Dict, Optional, Tuple
+
+from petfit.domain.entities.user import User
+from petfit.infra.cache.lru_ttl_cache import LRUTTLCache
+
+
+class PrincipalCache:
+    """Cache do usuário autenticado, por (id do usuário, iat do token).
+
+    Evita ir ao banco em toda requisição autenticada só para remontar o User.
+    Deve ser invalidado quando o usuário é alterado ou removido.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl_seconds: float = 60):
+        self._cache: LRUTTLCache[Tuple[str, Any], User] = LRUTTLCache(max_size, ttl_seconds)
+
+    def get(self, user_id: str, issued_at: Any) -> Optional[User]:
+        return self._cache.get((user_id, issued_at))
+
+    def set(self, user_id: str, issued_at: Any, user: User) -> None:
+        self._cache.set((user_id, issued_at), user)
+
+    def invalidate_user(self, user_id: str) -> None:
+        # Um usuário pode ter vários tokens (iat) válidos ao mesmo tempo
+        self._cache.delete_where(lambda key, _: key[0] == user_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
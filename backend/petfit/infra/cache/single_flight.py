@@ -0,0 +1,46 @@
+# petfit/infra/cache/single_flight.py
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Agrupa chamadas assíncronas idênticas e simultâneas numa única execução.
+
+    A primeira chamada para uma chave executa `fn`; as que chegam enquanto ela
+    está em andamento aguardam o mesmo resultado (ou a mesma exceção). Nada é
+    guardado depois que a chamada termina: isto não é um cache.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        # shield: o cancelamento de um chamador (ex: cliente desconectou) não
+        # cancela a consulta que os outros estão aguardando
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception() # marca a exceção como lida mesmo sem ninguém aguardando
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._in_flight),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,43 @@
+# petfit/infra/cache/trending_ranking.py
+
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class TrendingRanking:
+    """Top-K das receitas em alta, pré-calculado pelo agregador e servido da memória (por processo).
+
+    Guarda só (recipe_id, log_score): as receitas em si vêm do repositório (com cache),
+    então edições e mudanças de visibilidade aparecem sem esperar o próximo cálculo.
+    """
+
+    def __init__(self, capacity: int, clock: Callable[[], float] = time.monotonic):
+        self._capacity = capacity
+        self._clock = clock
+        self._entries: Optional[List[Tuple[str, float]]] = None
+        self._loaded_at: Optional[float] = None
+        self.refreshes = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def replace(self, entries: Sequence[Tuple[str, float]]) -> None:
+        self._entries = list(entries[: self._capacity])
+        self._loaded_at = self._clock()
+        self.refreshes += 1
+
+    def top(self, limit: int) -> Optional[List[Tuple[str, float]]]:
+        """As `limit` primeiras, ou None se o ranking ainda não foi carregado ou não cobre `limit`."""
+        if self._entries is None:
+            return None
+        if limit > len(self._entries) and len(self._entries) == self._capacity:
+            return None # truncado na capacidade: faltariam receitas
+        return self._entries[:limit]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries or ()),
+            "refreshes": self.refreshes,
+            "age_seconds": int(self._clock() - self._loaded_at) if self._loaded_at is not None else -1,
+        }
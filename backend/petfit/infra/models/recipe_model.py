@@ -1,15 +1,41 @@
 # petfit/infra/models/recipe_model.py
 from __future__ import annotations
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from petfit.infra.database import Base
 from petfit.domain.entities.recipe import Recipe
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, List, Optional
 from petfit.infra.models.recipe_user_model import user_favorite_recipes_table # <--- ADICIONE ESTA LINHA
 from petfit.infra.models.user_model import UserModel
 
 
+# Configuração de texto do Postgres usada na busca (receitas em português)
+SEARCH_CONFIG = "portuguese"
+
+# array_to_string é STABLE e não pode ir numa coluna gerada; este wrapper é IMMUTABLE
+ARRAY_TO_TEXT_FUNCTION_DDL = """
+CREATE OR REPLACE FUNCTION petfit_array_to_text(character varying[]) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE
+AS $$ SELECT coalesce(array_to_string($1, ' '), '') $$
+"""
+
+# Ingredientes normalizados (minúsculos, sem espaços nas pontas) para @> e && com índice GIN
+NORMALIZE_INGREDIENTS_FUNCTION_DDL = """
+CREATE OR REPLACE FUNCTION petfit_normalize_ingredients(character varying[]) RETURNS text[]
+LANGUAGE sql IMMUTABLE PARALLEL SAFE
+AS $$ SELECT coalesce(ARRAY(SELECT lower(btrim(item)) FROM unnest($1) AS item), '{}') $$
+"""
+
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', petfit_array_to_text(ingredients)), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', petfit_array_to_text(instructions)), 'C')"
+)
+
+
 class RecipeModel(Base):
     __tablename__ = "recipes"
 
@@ -20,23 +46,72 @@ class RecipeModel(Base):
     ingredients: Mapped[List[str]] = mapped_column(sa.ARRAY(sa.String), nullable=False)
     instructions: Mapped[List[str]] = mapped_column(sa.ARRAY(sa.String), nullable=False)
     is_public: Mapped[bool] = mapped_column(sa.Boolean, default=True)
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+    )
+    # Versão da linha: atualizada em todo UPDATE via ORM e usada nos ETags
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now(), onupdate=sa.func.now()
+    )
+    # Quantos usuários favoritaram: consolidado dos shards em recipe_favorite_count_shards
+    favorite_count: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=0, server_default="0")
+    # Documento da busca textual, mantido pelo próprio Postgres (coluna gerada)
+    search_vector: Mapped[Any] = mapped_column(
+        TSVECTOR, sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), nullable=True, deferred=True
+    )
+
+    ingredients_normalized: Mapped[List[str]] = mapped_column(
+        ARRAY(sa.Text), sa.Computed("petfit_normalize_ingredients(ingredients)", persisted=True),
+        nullable=True, deferred=True,
+    )
 
     favorite_of_users: Mapped[List["UserModel"]] = relationship(
         "UserModel",
         secondary=user_favorite_recipes_table,
         back_populates="favorite_recipes",
-        lazy="selectin"
+        # Nada é carregado implicitamente: cada consulta do repositório escolhe
+        # explicitamente o que carregar (ex: selectinload) ou usa a tabela de associação
+        lazy="raise",
+    )
+
+    # Índices parciais que sustentam a paginação keyset da listagem pública
+    __table_args__ = (
+        sa.Index(
+            "ix_recipes_public_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=sa.text("is_public"),
+        ),
+        sa.Index(
+            "ix_recipes_public_title_id",
+            "title",
+            "id",
+            postgresql_where=sa.text("is_public"),
+        ),
+        # Top-K de GET /recipes/popular (lido de trás para frente: favorite_count desc, id desc)
+        sa.Index(
+            "ix_recipes_public_favorite_count_id",
+            "favorite_count",
+            "id",
+            postgresql_where=sa.text("is_public"),
+        ),
+        sa.Index("ix_recipes_search_vector", "search_vector", postgresql_using="gin"),
+        sa.Index("ix_recipes_ingredients_normalized", "ingredients_normalized", postgresql_using="gin"),
     )
 
     @classmethod
     def from_entity(cls, entity: Recipe) -> "RecipeModel":
-        return cls(
+        model = cls(
             id=entity.id,
             title=entity.title,
             ingredients=entity.ingredients,
             instructions=entity.instructions,
             is_public=entity.is_public,
         )
+        # Sem data definida, deixa o server_default (now()) preencher
+        if entity.created_at is not None:
+            model.created_at = entity.created_at
+        return model
 
     def to_entity(self) -> Recipe:
         return Recipe(
@@ -45,4 +120,22 @@ class RecipeModel(Base):
             ingredients=self.ingredients,
             instructions=self.instructions,
             is_public=self.is_public,
-        )
\ No newline at end of file
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
+
+
+# Garante as funções das colunas geradas também quando as tabelas vêm do create_all (testes)
+sa.event.listen(RecipeModel.__table__, "before_create", sa.DDL(ARRAY_TO_TEXT_FUNCTION_DDL))
+sa.event.listen(RecipeModel.__table__, "before_create", sa.DDL(NORMALIZE_INGREDIENTS_FUNCTION_DDL))
+
+
+# Colunas expostas pela API, na ordem do RecipeOutput (leituras sem ORM/streaming)
+RECIPE_COLUMNS = (
+    RecipeModel.id,
+    RecipeModel.title,
+    RecipeModel.ingredients,
+    RecipeModel.instructions,
+    RecipeModel.is_public,
+    RecipeModel.created_at,
+)
@@ -8,5 +8,40 @@ user_favorite_recipes_table = sa.Table(
     "user_favorite_recipes",
     Base.metadata,
     sa.Column("user_id", sa.String, sa.ForeignKey("users.id"), primary_key=True),
-    sa.Column("recipe_id", sa.String, sa.ForeignKey("recipes.id"), primary_key=True)
-)
\ No newline at end of file
+    sa.Column("recipe_id", sa.String, sa.ForeignKey("recipes.id"), primary_key=True),
+    # Quando a receita foi favoritada
+    sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    # Favoritos de um usuário por data (paginação keyset); recipe_id desempata
+    sa.Index("ix_user_favorite_recipes_user_created_at", "user_id", "created_at", "recipe_id"),
+)
+
+# Contador de favoritos em shards: cada favoritar/desfavoritar soma +1/-1 numa linha
+# (receita, shard), então receitas muito favoritadas não disputam o lock de uma linha só.
+# Os deltas são consolidados periodicamente em recipes.favorite_count (fold).
+FAVORITE_COUNT_SHARDS = 16
+
+recipe_favorite_count_shards_table = sa.Table(
+    "recipe_favorite_count_shards",
+    Base.metadata,
+    sa.Column("recipe_id", sa.String, sa.ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True),
+    sa.Column("shard", sa.SmallInteger, primary_key=True),
+    sa.Column("delta", sa.Integer, nullable=False, server_default="0"),
+)
+
+# Log dos favoritos adicionados, consumido (e esvaziado) pelo agregador de tendências
+recipe_favorite_events_table = sa.Table(
+    "recipe_favorite_events",
+    Base.metadata,
+    sa.Column("id", sa.BigInteger, sa.Identity(), primary_key=True),
+    sa.Column("recipe_id", sa.String, sa.ForeignKey("recipes.id", ondelete="CASCADE"), nullable=False),
+    sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+)
+
+# Escore de tendência por receita, em escala log (ver petfit.domain.services.trending)
+recipe_trending_scores_table = sa.Table(
+    "recipe_trending_scores",
+    Base.metadata,
+    sa.Column("recipe_id", sa.String, sa.ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True),
+    sa.Column("log_score", sa.Float, nullable=False),
+    sa.Index("ix_recipe_trending_scores_log_score", "log_score"),
+)
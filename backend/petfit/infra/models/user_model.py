@@ -26,7 +26,9 @@ class UserModel(Base):
         "RecipeModel",
         secondary=user_favorite_recipes_table,
         back_populates="favorite_of_users",
-        lazy="selectin"
+        # Nada é carregado implicitamente: cada consulta do repositório escolhe
+        # explicitamente o que carregar (ex: selectinload) ou usa a tabela de associação
+        lazy="raise",
     )
     
     @classmethod
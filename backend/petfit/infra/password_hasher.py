@@ -0,0 +1,48 @@
+# petfit/infra/password_hasher.py
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from petfit.domain.services.password_hasher import PasswordHasher, PasswordHasherBusyError
+from petfit.domain.value_objects.password import Password
+
+T = TypeVar("T")
+
+
+class ThreadPoolPasswordHasher(PasswordHasher):
+    """Executa o bcrypt em um pool de threads limitado, fora do event loop.
+
+    O bcrypt libera o GIL durante o hash, então threads bastam para paralelizar.
+    No máximo `max_workers + max_pending` operações ficam em andamento; acima
+    disso a chamada falha na hora com PasswordHasherBusyError em vez de enfileirar.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 64):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._capacity = max_workers + max_pending
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        if self._in_flight >= self._capacity:
+            raise PasswordHasherBusyError("Too many password operations in progress. Try again later.")
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._in_flight -= 1
+
+    async def hash(self, plain_password: str) -> Password:
+        # O construtor de Password valida e faz o hash (bcrypt.hashpw)
+        return await self._run(Password, plain_password)
+
+    async def verify(self, password: Password, plain_password: str) -> bool:
+        return await self._run(password.verify, plain_password)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,174 @@
+# petfit/infra/repositories/cached/caching_recipe_repository.py
+
+import copy
+from typing import Any, Callable, List, Optional, Sequence, Set
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.entities.user import User
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.services.unit_of_work import UnitOfWork
+from petfit.domain.value_objects.favorite_changes import FavoriteChanges
+from petfit.infra.cache.lru_ttl_cache import LRUTTLCache
+from petfit.infra.repositories.cached.recipe_repository_decorator import RecipeRepositoryDecorator
+
+PUBLIC_RECIPES_KEY = ("public",)
+
+
+def recipe_key(recipe_id: str) -> tuple:
+    return ("recipe", recipe_id)
+
+
+def favorites_key(user_id: str) -> tuple:
+    return ("favorites", user_id)
+
+
+class CachingRecipeRepository(RecipeRepositoryDecorator):
+    """Decorator read-through sobre qualquer RecipeRepository.
+
+    Guarda em cache get_by_id (também usado por get_many), get_all_public_recipes e get_user_favorite_recipes
+    e invalida exatamente as chaves afetadas nas escritas. O cache é por processo:
+    escritas feitas em outro worker só aparecem aqui depois do TTL.
+
+    A invalidação acontece na hora (a própria requisição lê o que escreveu) e de
+    novo depois do commit: uma leitura concorrente pode ter recolocado no cache a
+    linha de antes do commit. Leituras feitas com escritas ainda não confirmadas na
+    unidade de trabalho não entram no cache (o rollback as desfaria).
+
+    O cache guarda cópias e entrega cópias: quem altera a entidade recebida não
+    altera a de outras requisições.
+    """
+
+    def __init__(
+        self,
+        inner: RecipeRepository,
+        cache: LRUTTLCache[tuple, Any],
+        unit_of_work: Optional[UnitOfWork] = None,
+    ):
+        super().__init__(inner, unit_of_work)
+        self._cache = cache
+
+    # Leituras em cache
+
+    async def get_by_id(self, recipe_id: str) -> Optional[Recipe]:
+        key = recipe_key(recipe_id)
+        recipe = self._cached(key)
+        if recipe is None:
+            recipe = await self._inner.get_by_id(recipe_id)
+            if recipe is not None:
+                self._store(key, recipe)
+        return recipe
+
+    async def get_many(self, recipe_ids: List[str]) -> List[Recipe]:
+        # Serve do cache o que já estiver lá e busca só os IDs que faltam
+        found = {}
+        misses = []
+        for recipe_id in recipe_ids:
+            recipe = self._cached(recipe_key(recipe_id))
+            if recipe is None:
+                misses.append(recipe_id)
+            else:
+                found[recipe_id] = recipe
+        if misses:
+            for recipe in await self._inner.get_many(misses):
+                self._store(recipe_key(recipe.id), recipe)
+                found[recipe.id] = recipe
+        return [found[recipe_id] for recipe_id in recipe_ids if recipe_id in found]
+
+    async def get_all_public_recipes(self) -> List[Recipe]:
+        recipes = self._cached(PUBLIC_RECIPES_KEY)
+        if recipes is None:
+            recipes = await self._inner.get_all_public_recipes()
+            self._store(PUBLIC_RECIPES_KEY, recipes)
+        return recipes
+
+    async def get_user_favorite_recipes(self, user: User, fields: Optional[Sequence[str]] = None) -> List[Recipe]:
+        key = favorites_key(user.id)
+        recipes = self._cached(key)
+        if recipes is None:
+            if fields:
+                # Projeção parcial: não guarda no cache, que só tem listas completas
+                return await self._inner.get_user_favorite_recipes(user, fields=fields)
+            recipes = await self._inner.get_user_favorite_recipes(user)
+            self._store(key, recipes)
+        return recipes
+
+    async def get_favorite_recipe_ids(self, user: User, recipe_ids: Sequence[str]) -> Set[str]:
+        # Com a lista de favoritos do usuário em cache, responde sem ir ao banco
+        favorites = self._cache.get(favorites_key(user.id))
+        if favorites is None:
+            return await self._inner.get_favorite_recipe_ids(user, recipe_ids)
+        return {recipe.id for recipe in favorites} & set(recipe_ids)
+
+    async def is_favorite(self, user: User, recipe: Recipe) -> bool:
+        return recipe.id in await self.get_favorite_recipe_ids(user, [recipe.id])
+
+    def _cached(self, key: tuple) -> Any:
+        value = self._cache.get(key)
+        return copy.deepcopy(value) if value is not None else None
+
+    def _store(self, key: tuple, value: Any) -> None:
+        # Sem escritas pendentes: a leitura reflete só o que já foi confirmado no banco
+        if self._unit_of_work is not None and self._unit_of_work.has_writes:
+            return
+        self._cache.set(key, copy.deepcopy(value))
+
+    # Escritas com invalidação
+
+    async def create(self, recipe: Recipe) -> Recipe:
+        created = await self._inner.create(recipe)
+        if created.is_public:
+            self._invalidate(lambda: self._cache.delete(PUBLIC_RECIPES_KEY))
+        return created
+
+    async def create_many(self, recipes: List[Recipe]) -> int:
+        created = await self._inner.create_many(recipes)
+        if any(recipe.is_public for recipe in recipes):
+            self._invalidate(lambda: self._cache.delete(PUBLIC_RECIPES_KEY))
+        return created
+
+    async def update(self, recipe: Recipe) -> Optional[Recipe]:
+        updated = await self._inner.update(recipe)
+        if updated is not None:
+            self._invalidate(lambda: self._delete_recipe_keys(recipe.id))
+        return updated
+
+    async def delete(self, recipe_id: str) -> bool:
+        deleted = await self._inner.delete(recipe_id)
+        if deleted:
+            self._invalidate(lambda: self._delete_recipe_keys(recipe_id))
+        return deleted
+
+    async def add_favorite(self, user: User, recipe_id: str) -> bool:
+        added = await self._inner.add_favorite(user, recipe_id)
+        if added:
+            self._invalidate_favorites(user)
+        return added
+
+    async def remove_favorite(self, user: User, recipe_id: str) -> bool:
+        removed = await self._inner.remove_favorite(user, recipe_id)
+        if removed:
+            self._invalidate_favorites(user)
+        return removed
+
+    async def update_favorites(self, user: User, add: Sequence[str], remove: Sequence[str]) -> FavoriteChanges:
+        changes = await self._inner.update_favorites(user, add, remove)
+        if changes.added or changes.removed:
+            self._invalidate_favorites(user)
+        return changes
+
+    def _invalidate(self, invalidate: Callable[[], None]) -> None:
+        invalidate()
+        if self._unit_of_work is not None:
+            self._after_commit(invalidate)
+
+    def _invalidate_favorites(self, user: User) -> None:
+        self._invalidate(lambda: self._cache.delete(favorites_key(user.id)))
+
+    def _delete_recipe_keys(self, recipe_id: str) -> None:
+        # A receita em si, a lista pública (pode ter entrado/saído dela) e só as
+        # listas de favoritos que contêm essa receita
+        self._cache.delete(recipe_key(recipe_id))
+        self._cache.delete(PUBLIC_RECIPES_KEY)
+        self._cache.delete_where(
+            lambda key, value: key[0] == "favorites" and any(r.id == recipe_id for r in value)
+        )
@@ -0,0 +1,138 @@
+# petfit/infra/repositories/cached/coalescing_recipe_repository.py
+
+import copy
+from typing import AsyncContextManager, Awaitable, Callable, Hashable, List, Optional, Sequence, TypeVar
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.entities.user import User
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.services.unit_of_work import UnitOfWork
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.page import Page
+from petfit.domain.value_objects.recipe_sort import RecipeSort
+from petfit.domain.value_objects.recipe_search_result import RecipeSearchResult
+from petfit.domain.value_objects.recipe_ingredient_match import RecipeIngredientMatch
+from petfit.domain.value_objects.recipe_popularity import RecipePopularity
+from petfit.infra.cache.single_flight import SingleFlight
+from petfit.infra.repositories.cached.recipe_repository_decorator import RecipeRepositoryDecorator
+
+T = TypeVar("T")
+
+
+class CoalescingRecipeRepository(RecipeRepositoryDecorator):
+    """Decorator que faz leituras idênticas e simultâneas compartilharem uma só consulta.
+
+    A chave é a identidade da consulta (método + argumentos). A consulta compartilhada
+    roda num repositório próprio, aberto por `open_repository` (sessão dedicada): não
+    depende da sessão de nenhuma requisição, então o cancelamento de quem a iniciou não
+    afeta os demais. Cada chamador recebe a sua cópia do resultado.
+
+    Com escritas ainda não confirmadas na unidade de trabalho da requisição, a leitura
+    vai direto ao repositório interno, para enxergar a própria transação.
+    """
+
+    def __init__(
+        self,
+        inner: RecipeRepository,
+        single_flight: SingleFlight,
+        open_repository: Callable[[], AsyncContextManager[RecipeRepository]],
+        unit_of_work: Optional[UnitOfWork] = None,
+    ):
+        super().__init__(inner, unit_of_work)
+        self._single_flight = single_flight
+        self._open_repository = open_repository
+
+    async def _coalesce(self, key: Hashable, read: Callable[[RecipeRepository], Awaitable[T]]) -> T:
+        if self._unit_of_work is not None and self._unit_of_work.has_writes:
+            return await read(self._inner)
+
+        async def flight() -> T:
+            async with self._open_repository() as repository:
+                return await read(repository)
+
+        return copy.deepcopy(await self._single_flight.do(key, flight))
+
+    async def get_by_id(self, recipe_id: str) -> Optional[Recipe]:
+        return await self._coalesce(
+            ("get_by_id", recipe_id), lambda repository: repository.get_by_id(recipe_id)
+        )
+
+    async def get_all_public_recipes(self) -> List[Recipe]:
+        return await self._coalesce(
+            ("get_all_public_recipes",), lambda repository: repository.get_all_public_recipes()
+        )
+
+    async def get_public_recipes_page(
+        self,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+        sort: RecipeSort = RecipeSort.NEWEST,
+        title: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[Recipe]:
+        key = (
+            "get_public_recipes_page",
+            limit,
+            cursor.encode() if cursor else None,
+            sort.value,
+            title,
+            ingredient,
+            tuple(fields) if fields else None,
+        )
+        return await self._coalesce(
+            key,
+            lambda repository: repository.get_public_recipes_page(
+                limit, cursor=cursor, sort=sort, title=title, ingredient=ingredient, fields=fields
+            ),
+        )
+
+    async def search_public_recipes(
+        self,
+        query: str,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[RecipeSearchResult]:
+        key = (
+            "search_public_recipes",
+            query,
+            limit,
+            cursor.encode() if cursor else None,
+            tuple(fields) if fields else None,
+        )
+        return await self._coalesce(
+            key, lambda repository: repository.search_public_recipes(query, limit, cursor=cursor, fields=fields)
+        )
+
+    async def find_public_recipes_by_ingredients(
+        self,
+        ingredients: List[str],
+        match_all: bool,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+    ) -> Page[RecipeIngredientMatch]:
+        key = (
+            "find_public_recipes_by_ingredients",
+            tuple(ingredients),
+            match_all,
+            limit,
+            cursor.encode() if cursor else None,
+        )
+        return await self._coalesce(
+            key,
+            lambda repository: repository.find_public_recipes_by_ingredients(
+                ingredients, match_all, limit, cursor=cursor
+            ),
+        )
+
+    async def get_popular_recipes(self, limit: int) -> List[RecipePopularity]:
+        return await self._coalesce(
+            ("get_popular_recipes", limit), lambda repository: repository.get_popular_recipes(limit)
+        )
+
+    async def get_user_favorite_recipes(self, user: User, fields: Optional[Sequence[str]] = None) -> List[Recipe]:
+        return await self._coalesce(
+            ("get_user_favorite_recipes", user.id, tuple(fields) if fields else None),
+            lambda repository: repository.get_user_favorite_recipes(user, fields=fields),
+        )
@@ -0,0 +1,46 @@
+# petfit/infra/repositories/cached/indexing_recipe_repository.py
+
+from typing import List, Optional
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.services.unit_of_work import UnitOfWork
+from petfit.infra.cache.ingredient_index import IngredientIndex
+from petfit.infra.repositories.cached.recipe_repository_decorator import RecipeRepositoryDecorator
+
+
+class IngredientIndexingRecipeRepository(RecipeRepositoryDecorator):
+    """Decorator que mantém o IngredientIndex em dia com as escritas de receitas.
+
+    O índice só é tocado depois do commit da escrita (uma escrita desfeita não entra nele).
+    Escritas feitas em outro worker só aparecem aqui no próximo rebuild.
+    """
+
+    def __init__(self, inner: RecipeRepository, index: IngredientIndex, unit_of_work: Optional[UnitOfWork] = None):
+        super().__init__(inner, unit_of_work)
+        self._index = index
+
+    async def create(self, recipe: Recipe) -> Recipe:
+        created = await self._inner.create(recipe)
+        self._after_commit(lambda: self._index.put(created.id, created.ingredients, created.is_public))
+        return created
+
+    async def create_many(self, recipes: List[Recipe]) -> int:
+        count = await self._inner.create_many(recipes)
+        def index_all() -> None:
+            for recipe in recipes:
+                self._index.put(recipe.id, recipe.ingredients, recipe.is_public)
+        self._after_commit(index_all)
+        return count
+
+    async def update(self, recipe: Recipe) -> Optional[Recipe]:
+        updated = await self._inner.update(recipe)
+        if updated is not None:
+            self._after_commit(lambda: self._index.put(updated.id, updated.ingredients, updated.is_public))
+        return updated
+
+    async def delete(self, recipe_id: str) -> bool:
+        deleted = await self._inner.delete(recipe_id)
+        if deleted:
+            self._after_commit(lambda: self._index.discard(recipe_id))
+        return deleted
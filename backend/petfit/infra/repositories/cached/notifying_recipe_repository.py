@@ -0,0 +1,50 @@
+# petfit/infra/repositories/cached/notifying_recipe_repository.py
+
+from typing import Callable, List, Optional
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.services.unit_of_work import UnitOfWork
+from petfit.infra.repositories.cached.recipe_repository_decorator import RecipeRepositoryDecorator
+
+
+class PublicChangeNotifyingRecipeRepository(RecipeRepositoryDecorator):
+    """Decorator que avisa `on_public_change` depois de escritas que podem mudar as receitas públicas.
+
+    Criações só avisam se houver receita pública; update e delete sempre avisam,
+    porque a receita pode ter entrado ou saído do feed público. O aviso só sai
+    depois do commit: um rebuild antes dele publicaria o feed antigo.
+    """
+
+    def __init__(
+        self,
+        inner: RecipeRepository,
+        on_public_change: Callable[[], None],
+        unit_of_work: Optional[UnitOfWork] = None,
+    ):
+        super().__init__(inner, unit_of_work)
+        self._on_public_change = on_public_change
+
+    async def create(self, recipe: Recipe) -> Recipe:
+        created = await self._inner.create(recipe)
+        if created.is_public:
+            self._after_commit(self._on_public_change)
+        return created
+
+    async def create_many(self, recipes: List[Recipe]) -> int:
+        count = await self._inner.create_many(recipes)
+        if any(recipe.is_public for recipe in recipes):
+            self._after_commit(self._on_public_change)
+        return count
+
+    async def update(self, recipe: Recipe) -> Optional[Recipe]:
+        updated = await self._inner.update(recipe)
+        if updated is not None:
+            self._after_commit(self._on_public_change)
+        return updated
+
+    async def delete(self, recipe_id: str) -> bool:
+        deleted = await self._inner.delete(recipe_id)
+        if deleted:
+            self._after_commit(self._on_public_change)
+        return deleted
@@ -0,0 +1,145 @@
+# petfit/infra/repositories/cached/recipe_repository_decorator.py
+
+from typing import Any, AsyncIterator, Callable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.entities.user import User
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.services.unit_of_work import UnitOfWork
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.page import Page
+from petfit.domain.value_objects.recipe_sort import RecipeSort
+from petfit.domain.value_objects.recipe_search_result import RecipeSearchResult
+from petfit.domain.value_objects.recipe_ingredient_match import RecipeIngredientMatch
+from petfit.domain.value_objects.recipe_popularity import RecipePopularity
+from petfit.domain.value_objects.favorite_changes import FavoriteChanges
+
+
+class RecipeRepositoryDecorator(RecipeRepository):
+    """Base para decorators de RecipeRepository: delega tudo ao repositório interno.
+
+    As subclasses sobrescrevem só os métodos que precisam alterar. Efeitos das
+    escritas fora do banco passam por `_after_commit`: com uma unidade de trabalho,
+    só rodam depois do commit (e somem no rollback); sem ela, rodam na hora.
+    """
+
+    def __init__(self, inner: RecipeRepository, unit_of_work: Optional[UnitOfWork] = None):
+        self._inner = inner
+        self._unit_of_work = unit_of_work
+
+    def _after_commit(self, callback: Callable[[], None]) -> None:
+        if self._unit_of_work is None:
+            callback()
+        else:
+            self._unit_of_work.after_commit(callback)
+
+    async def create(self, recipe: Recipe) -> Recipe:
+        return await self._inner.create(recipe)
+
+    async def create_many(self, recipes: List[Recipe]) -> int:
+        return await self._inner.create_many(recipes)
+
+    async def get_by_id(self, recipe_id: str) -> Optional[Recipe]:
+        return await self._inner.get_by_id(recipe_id)
+
+    async def get_many(self, recipe_ids: List[str]) -> List[Recipe]:
+        return await self._inner.get_many(recipe_ids)
+
+    async def get_all_public_recipes(self) -> List[Recipe]:
+        return await self._inner.get_all_public_recipes()
+
+    async def get_public_recipes_page(
+        self,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+        sort: RecipeSort = RecipeSort.NEWEST,
+        title: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[Recipe]:
+        return await self._inner.get_public_recipes_page(
+            limit, cursor=cursor, sort=sort, title=title, ingredient=ingredient, fields=fields
+        )
+
+    async def search_public_recipes(
+        self,
+        query: str,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[RecipeSearchResult]:
+        return await self._inner.search_public_recipes(query, limit, cursor=cursor, fields=fields)
+
+    async def find_public_recipes_by_ingredients(
+        self,
+        ingredients: List[str],
+        match_all: bool,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+    ) -> Page[RecipeIngredientMatch]:
+        return await self._inner.find_public_recipes_by_ingredients(
+            ingredients, match_all, limit, cursor=cursor
+        )
+
+    async def get_popular_recipes(self, limit: int) -> List[RecipePopularity]:
+        return await self._inner.get_popular_recipes(limit)
+
+    async def get_trending_scores(self, limit: int) -> List[Tuple[str, float]]:
+        return await self._inner.get_trending_scores(limit)
+
+    def stream_public_recipes(
+        self,
+        sort: RecipeSort = RecipeSort.NEWEST,
+        cursor: Optional[Cursor] = None,
+        title: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        batch_size: int = 500,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Sequence[Mapping[str, Any]]]:
+        return self._inner.stream_public_recipes(
+            sort=sort, cursor=cursor, title=title, ingredient=ingredient, batch_size=batch_size, fields=fields
+        )
+
+    def stream_recipes(
+        self,
+        is_public: Optional[bool] = None,
+        title: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Mapping[str, Any]]]:
+        return self._inner.stream_recipes(
+            is_public=is_public, title=title, ingredient=ingredient, batch_size=batch_size
+        )
+
+    async def add_favorite(self, user: User, recipe_id: str) -> bool:
+        return await self._inner.add_favorite(user, recipe_id)
+
+    async def remove_favorite(self, user: User, recipe_id: str) -> bool:
+        return await self._inner.remove_favorite(user, recipe_id)
+
+    async def update_favorites(self, user: User, add: Sequence[str], remove: Sequence[str]) -> FavoriteChanges:
+        return await self._inner.update_favorites(user, add, remove)
+
+    async def get_user_favorite_recipes(self, user: User, fields: Optional[Sequence[str]] = None) -> List[Recipe]:
+        return await self._inner.get_user_favorite_recipes(user, fields=fields)
+
+    async def get_user_favorite_recipes_page(
+        self,
+        user: User,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[Recipe]:
+        return await self._inner.get_user_favorite_recipes_page(user, limit, cursor=cursor, fields=fields)
+
+    async def is_favorite(self, user: User, recipe: Recipe) -> bool:
+        return await self._inner.is_favorite(user, recipe)
+
+    async def get_favorite_recipe_ids(self, user: User, recipe_ids: Sequence[str]) -> Set[str]:
+        return await self._inner.get_favorite_recipe_ids(user, recipe_ids)
+
+    async def update(self, recipe: Recipe) -> Optional[Recipe]:
+        return await self._inner.update(recipe)
+
+    async def delete(self, recipe_id: str) -> bool:
+        return await self._inner.delete(recipe_id)
@@ -1,6 +1,9 @@
 from petfit.domain.repositories.recipe_repository import RecipeRepository
 from petfit.domain.entities.recipe import Recipe
-from typing import List, Optional
+from petfit.domain.value_objects.cursor import Cursor, InvalidCursorError
+from petfit.domain.value_objects.page import Page
+from petfit.domain.value_objects.recipe_search_result import RecipeSearchResult
+from typing import Any, Dict, List, Optional, Sequence
 
 
 class InMemoryRecipeRepository(RecipeRepository):
@@ -17,5 +20,56 @@ class InMemoryRecipeRepository(RecipeRepository):
         self._recipes[recipe.id] = recipe
         return recipe
 
+    async def search_public_recipes(
+        self,
+        query: str,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[RecipeSearchResult]:
+        # Equivalente simples da busca textual: conta as ocorrências dos termos
+        terms = [term for term in query.lower().split() if term]
+        hits = []
+        for recipe in self._recipes.values():
+            if not recipe.is_public:
+                continue
+            text = " ".join([recipe.title, *recipe.ingredients, *recipe.instructions])
+            rank = float(sum(text.lower().count(term) for term in terms))
+            if rank > 0:
+                hits.append(RecipeSearchResult(self._project(recipe, fields), rank, self._snippet(text, terms)))
+        hits.sort(key=lambda hit: (-hit.rank, hit.recipe.id))
+
+        if cursor is not None:
+            if cursor.sort != "rank" or len(cursor.values) != 2:
+                raise InvalidCursorError("Cursor does not match the requested sort.")
+            last_rank, last_id = cursor.values
+            hits = [hit for hit in hits if (-hit.rank, hit.recipe.id) > (-last_rank, last_id)]
+
+        next_cursor = None
+        if len(hits) > limit:
+            last = hits[limit - 1]
+            next_cursor = Cursor("rank", [last.rank, last.recipe.id]).encode()
+        return Page(hits[:limit], next_cursor)
+
+    @staticmethod
+    def _project(recipe: Recipe, fields: Optional[Sequence[str]]) -> Recipe:
+        # Como no banco: campos fora da projeção ficam None (o id sempre vem)
+        if fields is None:
+            return recipe
+        names = {"id", *fields}
+        values: Dict[str, Any] = {
+            name: value if name in names else None for name, value in vars(recipe).items()
+        }
+        return Recipe(**values)
+
+    @staticmethod
+    def _snippet(text: str, terms: List[str], max_words: int = 20) -> str:
+        # Trecho em volta da primeira ocorrência, com os termos entre «» (como o ts_headline)
+        words = text.split()
+        matched = [any(term in word.lower() for term in terms) for word in words]
+        start = max(matched.index(True) - 2, 0) if any(matched) else 0
+        window = range(start, min(start + max_words, len(words)))
+        return " ".join(f"«{words[i]}»" if matched[i] else words[i] for i in window)
+
     def delete(self, post_id: str) -> None:
-        self._recipes.pop(post_id, None)
\ No newline at end of file
+        self._recipes.pop(post_id, None)
@@ -38,7 +38,7 @@ class InMemoryUserRepository(UserRepository): # Herda da interface
         self._current_user_id = user.id
 
     # O retorno agora é 'Optional[User]' para consistência com a interface
-    def update(self, user: User) -> Optional[User]:
+    async def update(self, user: User) -> Optional[User]:
         if user.id in self._users:
             self._users[user.id] = user
             return user
@@ -46,4 +46,9 @@ class InMemoryUserRepository(UserRepository): # Herda da interface
 
     # get_by_id adicionado e consistente com a interface
     def get_by_id(self, user_id: str) -> Optional[User]:
-        return self._users.get(user_id)
\ No newline at end of file
+        return self._users.get(user_id)
+
+    async def delete(self, user_id: str) -> bool:
+        if self._current_user_id == user_id:
+            self._current_user_id = None
+        return self._users.pop(user_id, None) is not None
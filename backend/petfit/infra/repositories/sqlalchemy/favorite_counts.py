@@ -0,0 +1,41 @@
+# petfit/infra/repositories/sqlalchemy/favorite_counts.py
+
+import zlib
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.future import select
+
+from petfit.infra.models.recipe_user_model import FAVORITE_COUNT_SHARDS, recipe_favorite_count_shards_table
+
+
+def favorite_count_shard(user_id: str) -> int:
+    # Shard fixo por usuário: usuários diferentes se espalham e o -1 cai no shard do +1
+    return zlib.crc32(user_id.encode()) % FAVORITE_COUNT_SHARDS
+
+
+def count_favorite_changes(changed: sa.CTE, user_id: str, delta: int, *also: sa.CTE) -> sa.Insert:
+    """INSERT ... ON CONFLICT que soma `delta` no shard do usuário para cada receita em `changed`.
+
+    `changed` é o CTE (INSERT/DELETE ... RETURNING recipe_id) que mexeu nos favoritos;
+    `also`: outros CTEs que devem rodar no mesmo comando (ex: o registro do evento).
+    Todo caminho que cria ou apaga linhas de favoritos passa por aqui, senão o
+    contador consolidado diverge.
+    """
+    shards = recipe_favorite_count_shards_table
+    stmt = pg_insert(shards).from_select(
+        ["recipe_id", "shard", "delta"],
+        select(
+            changed.c.recipe_id,
+            sa.literal(favorite_count_shard(user_id), sa.SmallInteger),
+            sa.literal(delta, sa.Integer),
+        ),
+    )
+    return (
+        stmt.on_conflict_do_update(
+            index_elements=[shards.c.recipe_id, shards.c.shard],
+            set_={"delta": shards.c.delta + stmt.excluded.delta},
+        )
+        .returning(shards.c.recipe_id)
+        .add_cte(changed, *also)
+    )
@@ -1,25 +1,38 @@
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+import sqlalchemy as sa
 
 from petfit.domain.entities.user import User
 from petfit.domain.repositories.user_repository import UserRepository
+from petfit.domain.services.unit_of_work import UnitOfWork
 from petfit.domain.value_objects.email_vo import Email
 from petfit.domain.value_objects.password import Password
 from petfit.infra.models.user_model import UserModel
+from petfit.infra.models.recipe_user_model import user_favorite_recipes_table
+from petfit.infra.cache.principal_cache import PrincipalCache
+from petfit.infra.repositories.sqlalchemy.favorite_counts import count_favorite_changes
 
 from petfit.infra.database import async_session
 
 
 class SQLAlchemyUserRepository(UserRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        principal_cache: Optional[PrincipalCache] = None,
+        unit_of_work: Optional[UnitOfWork] = None,
+    ):
         self._session = session
         self._current_user: Optional[User] = None
+        # Cache de usuários autenticados a ser invalidado quando o usuário muda
+        self._principal_cache = principal_cache
+        self._unit_of_work = unit_of_work
 
     async def register(self, user: User) -> User:
         model = UserModel.from_entity(user)
         self._session.add(model)
-        await self._session.commit()
+        await self._session.flush()
         await self._session.refresh(model)
         user.id = model.id
         return model.to_entity()
@@ -62,7 +75,38 @@ class SQLAlchemyUserRepository(UserRepository):
         user_model = result.scalar_one_or_none()
         return user_model.to_entity() if user_model else None
     
-    async def update(self, user):
-        return super().update(user)
-    
-    
\ No newline at end of file
+    async def update(self, user: User) -> Optional[User]:
+        model = await self._session.get(UserModel, user.id)
+        if not model:
+            return None
+        model.name = user.name
+        model.email = str(user.email)
+        model.password = user.password.hashed_value()
+        await self._session.flush()
+        self._invalidate(user.id)
+        return model.to_entity()
+
+    async def delete(self, id: str) -> bool:
+        # Os favoritos do usuário saem com o -1 no shard do contador de cada receita
+        removed_rows = (
+            sa.delete(user_favorite_recipes_table)
+            .where(user_favorite_recipes_table.c.user_id == id)
+            .returning(user_favorite_recipes_table.c.recipe_id)
+            .cte("removed")
+        )
+        await self._session.execute(count_favorite_changes(removed_rows, id, -1))
+        result = await self._session.execute(
+            sa.delete(UserModel).where(UserModel.id == id).returning(UserModel.id)
+        )
+        self._invalidate(id)
+        return result.scalar_one_or_none() is not None
+
+    def _invalidate(self, user_id: str) -> None:
+        # Na hora e de novo depois do commit: uma autenticação concorrente pode ter
+        # recolocado no cache o usuário de antes do commit
+        if self._principal_cache is None:
+            return
+        principal_cache = self._principal_cache
+        principal_cache.invalidate_user(user_id)
+        if self._unit_of_work is not None:
+            self._unit_of_work.after_commit(lambda: principal_cache.invalidate_user(user_id))
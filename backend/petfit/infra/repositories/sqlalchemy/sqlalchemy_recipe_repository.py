@@ -1,17 +1,43 @@
 # petfit/infra/repositories/sqlalchemy/sqlalchemy_recipe_repository.py
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Set, Tuple, cast
+import sqlalchemy as sa
+from sqlalchemy.engine import CursorResult, RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.future import select
 from sqlalchemy import exc # Para tratamento de exceções de DB
-from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from petfit.domain.entities.recipe import Recipe
 from petfit.domain.entities.user import User
 from petfit.domain.repositories.recipe_repository import RecipeRepository
-from petfit.infra.models.recipe_model import RecipeModel
-from petfit.infra.models.user_model import UserModel # Necessário para carregar usuários e seus favoritos
-# Não precisa importar user_favorite_recipes_table aqui diretamente para relacionamentos.
+from petfit.domain.services.trending import TrendingDecay, log_add_exp
+from petfit.domain.value_objects.cursor import Cursor, InvalidCursorError
+from petfit.domain.value_objects.page import Page
+from petfit.domain.value_objects.recipe_sort import RecipeSort
+from petfit.domain.value_objects.recipe_search_result import RecipeSearchResult
+from petfit.domain.value_objects.recipe_ingredient_match import RecipeIngredientMatch
+from petfit.domain.value_objects.recipe_popularity import RecipePopularity
+from petfit.domain.value_objects.favorite_changes import FavoriteChanges
+from petfit.infra.models.recipe_model import RecipeModel, RECIPE_COLUMNS, SEARCH_CONFIG
+from petfit.infra.models.recipe_user_model import (
+    recipe_favorite_count_shards_table,
+    recipe_favorite_events_table,
+    recipe_trending_scores_table,
+    user_favorite_recipes_table,
+)
+from petfit.infra.repositories.sqlalchemy.favorite_counts import count_favorite_changes
+
+# Nomes (padrão do Postgres) das FKs para recipes.id nas tabelas tocadas ao favoritar
+RECIPE_FOREIGN_KEYS = frozenset({
+    "user_favorite_recipes_recipe_id_fkey",
+    "recipe_favorite_events_recipe_id_fkey",
+    "recipe_favorite_count_shards_recipe_id_fkey",
+})
+FOREIGN_KEY_VIOLATION = "23503"
 
 class SQLAlchemyRecipeRepository(RecipeRepository):
     def __init__(self, session: AsyncSession):
@@ -20,78 +46,543 @@ class SQLAlchemyRecipeRepository(RecipeRepository):
     async def create(self, recipe: Recipe) -> Recipe:
         model = RecipeModel.from_entity(recipe)
         self._session.add(model)
-        await self._session.commit()
-        await self._session.refresh(model)
+        await self._session.flush()
+        await self._session.refresh(model) # created_at/updated_at vêm do banco
         recipe.id = model.id # Atualiza o ID da entidade
         return model.to_entity()
 
+    async def create_many(self, recipes: List[Recipe]) -> int:
+        if not recipes:
+            return 0
+        # INSERT Core na tabela com lista de parâmetros: o SQLAlchemy agrupa em
+        # INSERTs multi-linhas (insertmanyvalues), sem criar objetos ORM
+        rows = [
+            {
+                "id": recipe.id,
+                "title": recipe.title,
+                "ingredients": recipe.ingredients,
+                "instructions": recipe.instructions,
+                "is_public": recipe.is_public,
+            }
+            for recipe in recipes
+        ]
+        # SAVEPOINT: um lote que falha é desfeito sozinho, sem abortar a transação da requisição
+        try:
+            async with self._session.begin_nested():
+                await self._session.execute(sa.insert(RecipeModel.__table__), rows)
+        except exc.DBAPIError as e: # ex: ID duplicado, valor grande demais para a coluna
+            raise ValueError(self._db_error_message(e)) from e
+        return len(rows)
+
     async def get_by_id(self, recipe_id: str) -> Optional[Recipe]:
         stmt = select(RecipeModel).where(RecipeModel.id == recipe_id)
         result = await self._session.execute(stmt)
         recipe_model = result.scalar_one_or_none()
         return recipe_model.to_entity() if recipe_model else None
 
+    async def get_many(self, recipe_ids: List[str]) -> List[Recipe]:
+        if not recipe_ids:
+            return []
+        # Um único parâmetro array: WHERE id = ANY(:ids)
+        ids_param = sa.literal(list(recipe_ids), postgresql.ARRAY(sa.String))
+        stmt = select(RecipeModel).where(RecipeModel.id == sa.any_(ids_param))
+        result = await self._session.execute(stmt)
+        by_id = {model.id: model.to_entity() for model in result.scalars().all()}
+        return [by_id[recipe_id] for recipe_id in recipe_ids if recipe_id in by_id]
+
     async def get_all_public_recipes(self) -> List[Recipe]:
         stmt = select(RecipeModel).where(RecipeModel.is_public == True)
         result = await self._session.execute(stmt)
         return [model.to_entity() for model in result.scalars().all()]
 
-    async def add_favorite(self, user: User, recipe: Recipe) -> bool:
-        # Carregar o UserModel completo (com favorite_recipes populadas)
-        user_model_stmt = select(UserModel).where(UserModel.id == user.id)
-        user_model_result = await self._session.execute(user_model_stmt)
-        user_model = user_model_result.scalar_one_or_none()
-        if not user_model:
-            return False # Usuário não encontrado
-
-        # Carregar o RecipeModel
-        recipe_model_stmt = select(RecipeModel).where(RecipeModel.id == recipe.id)
-        recipe_model_result = await self._session.execute(recipe_model_stmt)
-        recipe_model = recipe_model_result.scalar_one_or_none()
-        if not recipe_model:
-            return False # Receita não encontrada
-
-        if recipe_model not in user_model.favorite_recipes: # Verifica se já é favorito
-            user_model.favorite_recipes.append(recipe_model)
+    async def get_public_recipes_page(
+        self,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+        sort: RecipeSort = RecipeSort.NEWEST,
+        title: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[Recipe]:
+        # Lê só as colunas pedidas, mais a da ordenação (cursor) e updated_at (ETag)
+        columns = self._columns(fields, sort.field, "updated_at")
+        stmt = self._public_recipes_stmt(select(*columns), sort, cursor, title, ingredient)
+
+        # Busca um item a mais só para saber se existe próxima página
+        result = await self._session.execute(stmt.limit(limit + 1))
+        rows = result.mappings().all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = Cursor(sort.value, [self._encode_key(last[sort.field]), last["id"]]).encode()
+        return Page([self._row_to_entity(row) for row in rows], next_cursor)
+
+    async def search_public_recipes(
+        self,
+        query: str,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[RecipeSearchResult]:
+        config = sa.literal(SEARCH_CONFIG, postgresql.REGCONFIG)
+        ts_query = sa.func.websearch_to_tsquery(config, query)
+        rank = sa.func.ts_rank_cd(RecipeModel.search_vector, ts_query).label("rank")
+
+        # O @@ na coluna gerada usa o índice GIN; a ordem (rank desc, id asc) é estável.
+        # A subconsulta sempre tem o texto (para o trecho); só as colunas pedidas saem do banco
+        matches = (
+            select(*self._columns(fields, "title", "ingredients", "instructions"), rank)
+            .where(RecipeModel.is_public == True, RecipeModel.search_vector.op("@@")(ts_query))
+        )
+        if cursor is not None:
+            last_rank, last_id = self._decode_search_cursor(cursor)
+            last_rank = sa.literal(last_rank, sa.Float)
+            matches = matches.where(
+                sa.or_(rank < last_rank, sa.and_(rank == last_rank, RecipeModel.id > last_id))
+            )
+        page = matches.order_by(rank.desc(), RecipeModel.id.asc()).limit(limit + 1).subquery()
+
+        # ts_headline é caro: roda só sobre as linhas da página, fora da subconsulta
+        document = sa.func.concat_ws(
+            " ",
+            page.c.title,
+            sa.func.array_to_string(page.c.ingredients, " "),
+            sa.func.array_to_string(page.c.instructions, " "),
+        )
+        snippet = sa.func.ts_headline(
+            config, document, ts_query, "StartSel=«, StopSel=», MaxFragments=2, MaxWords=20, MinWords=5"
+        ).label("snippet")
+        output = [page.c[column.key] for column in self._columns(fields)]
+        stmt = select(*output, page.c.rank, snippet).order_by(page.c.rank.desc(), page.c.id.asc())
+
+        result = await self._session.execute(stmt)
+        rows = result.mappings().all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = Cursor("rank", [last["rank"], last["id"]]).encode()
+        items = [
+            RecipeSearchResult(self._row_to_entity(row), rank=row["rank"], snippet=row["snippet"])
+            for row in rows
+        ]
+        return Page(items, next_cursor)
+
+    async def find_public_recipes_by_ingredients(
+        self,
+        ingredients: List[str],
+        match_all: bool,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+    ) -> Page[RecipeIngredientMatch]:
+        wanted = sa.literal(list(ingredients), postgresql.ARRAY(sa.Text))
+        normalized = RecipeModel.ingredients_normalized
+        # @> / && na coluna normalizada usam o índice GIN; o ranking conta quantos casaram
+        matched = sum(
+            (
+                sa.case((normalized.contains(sa.literal([item], postgresql.ARRAY(sa.Text))), 1), else_=0)
+                for item in ingredients
+            ),
+            sa.literal(0),
+        ).label("matched")
+        total = sa.func.cardinality(RecipeModel.ingredients).label("total")
+
+        stmt = select(*RECIPE_COLUMNS, matched, total).where(
+            RecipeModel.is_public == True,
+            normalized.contains(wanted) if match_all else normalized.overlap(wanted),
+        )
+        # Mais ingredientes em comum primeiro; no empate, as receitas com menos ingredientes
+        keyset = sa.tuple_(-matched, total, RecipeModel.id)
+        if cursor is not None:
+            last_matched, last_total, last_id = self._decode_ingredients_cursor(cursor)
+            stmt = stmt.where(keyset > sa.tuple_(-last_matched, last_total, last_id))
+        stmt = stmt.order_by(matched.desc(), total.asc(), RecipeModel.id.asc())
+
+        result = await self._session.execute(stmt.limit(limit + 1))
+        rows = result.mappings().all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = Cursor("ingredients", [last["matched"], last["total"], last["id"]]).encode()
+        items = [RecipeIngredientMatch(self._row_to_entity(row), matched=row["matched"]) for row in rows]
+        return Page(items, next_cursor)
+
+    async def get_popular_recipes(self, limit: int) -> List[RecipePopularity]:
+        # Top-K pelo índice parcial (favorite_count, id); deltas ainda não consolidados ficam de fora
+        stmt = (
+            select(*RECIPE_COLUMNS, RecipeModel.updated_at, RecipeModel.favorite_count)
+            .where(RecipeModel.is_public == True)
+            .order_by(RecipeModel.favorite_count.desc(), RecipeModel.id.desc())
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            RecipePopularity(self._row_to_entity(row), favorite_count=row["favorite_count"])
+            for row in result.mappings().all()
+        ]
+
+    async def fold_favorite_counts(self) -> int:
+        """Consolida os deltas dos shards em recipes.favorite_count. Retorna quantas receitas mudaram.
+
+        Um comando só: o DELETE ... RETURNING esvazia os shards e o UPDATE aplica a soma,
+        então favorite_count + deltas pendentes é sempre o total exato.
+        """
+        shards = recipe_favorite_count_shards_table
+        drained = sa.delete(shards).returning(shards.c.recipe_id, shards.c.delta).cte("drained")
+        summed = (
+            select(drained.c.recipe_id, sa.func.sum(drained.c.delta).label("delta"))
+            .group_by(drained.c.recipe_id)
+            .cte("summed")
+        )
+        stmt = (
+            sa.update(RecipeModel)
+            .where(RecipeModel.id == summed.c.recipe_id, summed.c.delta != 0)
+            # updated_at explícito: o contador não muda a representação da receita (nem o ETag dela)
+            .values(favorite_count=RecipeModel.favorite_count + summed.c.delta, updated_at=RecipeModel.updated_at)
+            .add_cte(drained)
+            .execution_options(synchronize_session=False)
+        )
+        result = cast(CursorResult, await self._session.execute(stmt))
+        return result.rowcount
+
+    async def get_trending_scores(self, limit: int) -> List[Tuple[str, float]]:
+        # Percorre o índice de log_score do maior para o menor, parando nas `limit` públicas
+        scores = recipe_trending_scores_table
+        stmt = (
+            select(scores.c.recipe_id, scores.c.log_score)
+            .join(RecipeModel, RecipeModel.id == scores.c.recipe_id)
+            .where(RecipeModel.is_public == True)
+            .order_by(scores.c.log_score.desc())
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [(row.recipe_id, row.log_score) for row in result.all()]
+
+    async def aggregate_favorite_events(self, decay: TrendingDecay, batch_size: int = 10_000) -> int:
+        """Consome um lote do log de favoritos e soma os pesos nos escores de tendência. Retorna quantos eventos consumiu.
+
+        Incremental: cada evento é lido uma vez só (DELETE ... RETURNING com SKIP LOCKED,
+        então agregadores simultâneos pegam lotes disjuntos) e a soma em escala log é
+        comutativa, então a ordem de aplicação não importa.
+        """
+        events = recipe_favorite_events_table
+        batch = select(events.c.id).order_by(events.c.id).limit(batch_size).with_for_update(skip_locked=True)
+        drained = await self._session.execute(
+            sa.delete(events).where(events.c.id.in_(batch.scalar_subquery())).returning(events.c.recipe_id, events.c.created_at)
+        )
+        totals: Dict[str, float] = {}
+        rows = drained.all()
+        for recipe_id, created_at in rows:
+            weight = decay.log_weight(created_at)
+            totals[recipe_id] = log_add_exp(totals[recipe_id], weight) if recipe_id in totals else weight
+        if totals:
+            scores = recipe_trending_scores_table
+            stmt = pg_insert(scores).values(
+                [{"recipe_id": recipe_id, "log_score": log_score} for recipe_id, log_score in totals.items()]
+            )
+            # ln(e^a + e^b) no banco, somando ao escore já existente
+            high = sa.func.greatest(scores.c.log_score, stmt.excluded.log_score)
+            low = sa.func.least(scores.c.log_score, stmt.excluded.log_score)
+            await self._session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[scores.c.recipe_id],
+                    set_={"log_score": high + sa.func.ln(1 + sa.func.exp(low - high))},
+                )
+            )
+        return len(rows)
+
+    async def stream_public_recipes(
+        self,
+        sort: RecipeSort = RecipeSort.NEWEST,
+        cursor: Optional[Cursor] = None,
+        title: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        batch_size: int = 500,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Sequence[Mapping[str, Any]]]:
+        # Seleciona só as colunas (sem identity map/ORM) e lê por cursor no servidor,
+        # entregando lotes de `batch_size` linhas conforme chegam do banco
+        stmt = self._public_recipes_stmt(select(*self._columns(fields)), sort, cursor, title, ingredient)
+        result = await self._session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.mappings().partitions():
+            yield cast(Sequence[Mapping[str, Any]], partition)
+
+    async def stream_recipes(
+        self,
+        is_public: Optional[bool] = None,
+        title: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Mapping[str, Any]]]:
+        # Exportação: sem ORDER BY, o banco entrega as linhas na ordem mais barata
+        stmt = self._filter_stmt(select(*RECIPE_COLUMNS), is_public, title, ingredient)
+        result = await self._session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.mappings().partitions():
+            yield cast(Sequence[Mapping[str, Any]], partition)
+
+    @staticmethod
+    def _columns(fields: Optional[Sequence[str]], *required: str) -> List[InstrumentedAttribute[Any]]:
+        """Colunas da projeção `fields` (todas, se None) mais as `required` pela própria consulta."""
+        columns = RECIPE_COLUMNS + (RecipeModel.updated_at,)
+        if fields is None:
+            names = {column.key for column in RECIPE_COLUMNS} | set(required)
+        else:
+            names = {"id", *fields, *required}
+        return [column for column in columns if column.key in names]
+
+    @staticmethod
+    def _row_to_entity(row: RowMapping) -> Recipe:
+        # Colunas fora da projeção ficam None na entidade
+        values: Dict[str, Any] = {
+            column.key: row.get(column.key) for column in RECIPE_COLUMNS + (RecipeModel.updated_at,)
+        }
+        return Recipe(**values)
+
+    @staticmethod
+    def _violated_foreign_key(error: exc.DBAPIError) -> Optional[str]:
+        """Nome da FK violada (SQLSTATE 23503) pelo comando, ou None se o erro for outro."""
+        orig = error.orig if error.orig is not None else error
+        cause = orig.__cause__ or orig
+        if getattr(cause, "sqlstate", None) != FOREIGN_KEY_VIOLATION:
+            return None
+        return getattr(cause, "constraint_name", None)
+
+    @staticmethod
+    def _db_error_message(error: exc.DBAPIError) -> str:
+        # Só a mensagem do Postgres (e o DETAIL), sem o SQL e os parâmetros que o SQLAlchemy anexa
+        orig = error.orig if error.orig is not None else error
+        cause = orig.__cause__ or orig
+        message = str(cause).splitlines()[0] if str(cause) else type(cause).__name__
+        detail = getattr(cause, "detail", None)
+        return f"{message} ({detail})" if detail else message
+
+    @staticmethod
+    def _filter_stmt(
+        stmt: sa.Select,
+        is_public: Optional[bool],
+        title: Optional[str],
+        ingredient: Optional[str],
+    ) -> sa.Select:
+        if is_public is not None:
+            stmt = stmt.where(RecipeModel.is_public == is_public)
+        if title:
+            stmt = stmt.where(RecipeModel.title.icontains(title, autoescape=True))
+        if ingredient:
+            stmt = stmt.where(sa.literal(ingredient) == sa.any_(RecipeModel.ingredients))
+        return stmt
+
+    def _public_recipes_stmt(
+        self,
+        stmt: sa.Select,
+        sort: RecipeSort,
+        cursor: Optional[Cursor],
+        title: Optional[str],
+        ingredient: Optional[str],
+    ) -> sa.Select:
+        sort_column = getattr(RecipeModel, sort.field)
+        stmt = self._filter_stmt(stmt, True, title, ingredient)
+
+        if cursor is not None:
+            # Keyset: continua estritamente depois da chave (coluna, id) do último item
+            last_key, last_id = self._decode_cursor(cursor, sort)
+            keyset = sa.tuple_(sort_column, RecipeModel.id)
+            if sort.descending:
+                stmt = stmt.where(keyset < sa.tuple_(last_key, last_id))
+            else:
+                stmt = stmt.where(keyset > sa.tuple_(last_key, last_id))
+
+        if sort.descending:
+            return stmt.order_by(sort_column.desc(), RecipeModel.id.desc())
+        return stmt.order_by(sort_column.asc(), RecipeModel.id.asc())
+
+    @staticmethod
+    def _encode_key(value: Any) -> Any:
+        return value.isoformat() if isinstance(value, datetime) else value
+
+    @staticmethod
+    def _decode_cursor(cursor: Cursor, sort: RecipeSort) -> tuple:
+        if cursor.sort != sort.value or len(cursor.values) != 2:
+            raise InvalidCursorError("Cursor does not match the requested sort.")
+        key, last_id = cursor.values
+        if not isinstance(key, str) or not isinstance(last_id, str):
+            raise InvalidCursorError("Invalid pagination cursor.")
+        if sort.field == "created_at":
             try:
-                await self._session.commit()
-                await self._session.refresh(user_model) # Opcional: refresh para garantir o estado
-                return True
-            except exc.IntegrityError: # Caso haja uma violação de unicidade (já favoritou)
-                await self._session.rollback()
-                return False
-        return False # Já era favorito
-
-    async def remove_favorite(self, user: User, recipe: Recipe) -> bool:
-        user_model_stmt = select(UserModel).where(UserModel.id == user.id)
-        user_model_result = await self._session.execute(user_model_stmt)
-        user_model = user_model_result.scalar_one_or_none()
-        if not user_model:
-            return False
-
-        recipe_model_stmt = select(RecipeModel).where(RecipeModel.id == recipe.id)
-        recipe_model_result = await self._session.execute(recipe_model_stmt)
-        recipe_model = recipe_model_result.scalar_one_or_none()
-        if not recipe_model:
-            return False
-
-        if recipe_model in user_model.favorite_recipes:
-            user_model.favorite_recipes.remove(recipe_model)
-            await self._session.commit()
-            await self._session.refresh(user_model) # Opcional: refresh para garantir o estado
-            return True
-        return False # Não era favorito para ser removido
-
-    async def get_user_favorite_recipes(self, user: User) -> List[Recipe]:
-        # Para carregar os favoritos, precisamos carregar o UserModel com a relação populada
-        # Usa `selectinload` para carregar a relação `favorite_recipes` na mesma consulta
-        stmt = select(UserModel).options(selectinload(UserModel.favorite_recipes)).where(UserModel.id == user.id)
+                key = datetime.fromisoformat(key)
+            except ValueError:
+                raise InvalidCursorError("Invalid pagination cursor.")
+        return key, last_id
+
+    @staticmethod
+    def _decode_search_cursor(cursor: Cursor) -> tuple:
+        if cursor.sort != "rank" or len(cursor.values) != 2:
+            raise InvalidCursorError("Cursor does not match the requested sort.")
+        last_rank, last_id = cursor.values
+        if isinstance(last_rank, bool) or not isinstance(last_rank, (int, float)) or not isinstance(last_id, str):
+            raise InvalidCursorError("Invalid pagination cursor.")
+        return float(last_rank), last_id
+
+    @staticmethod
+    def _decode_ingredients_cursor(cursor: Cursor) -> tuple:
+        if cursor.sort != "ingredients" or len(cursor.values) != 3:
+            raise InvalidCursorError("Cursor does not match the requested sort.")
+        last_matched, last_total, last_id = cursor.values
+        if not all(isinstance(v, int) and not isinstance(v, bool) for v in (last_matched, last_total)):
+            raise InvalidCursorError("Invalid pagination cursor.")
+        if not isinstance(last_id, str):
+            raise InvalidCursorError("Invalid pagination cursor.")
+        return last_matched, last_total, last_id
+
+    @staticmethod
+    def _decode_favorites_cursor(cursor: Cursor) -> tuple:
+        if cursor.sort != "favorited_at" or len(cursor.values) != 2:
+            raise InvalidCursorError("Cursor does not match the requested sort.")
+        key, last_id = cursor.values
+        if not isinstance(key, str) or not isinstance(last_id, str):
+            raise InvalidCursorError("Invalid pagination cursor.")
+        try:
+            return datetime.fromisoformat(key), last_id
+        except ValueError:
+            raise InvalidCursorError("Invalid pagination cursor.")
+
+    async def add_favorite(self, user: User, recipe_id: str) -> bool:
+        # Um único comando: o INSERT na tabela de associação (o ON CONFLICT cobre o "já era
+        # favorito") e, só se inseriu, o +1 no shard do contador e o evento para as tendências
+        added_rows = (
+            pg_insert(user_favorite_recipes_table)
+            .values(user_id=user.id, recipe_id=recipe_id)
+            .on_conflict_do_nothing()
+            .returning(user_favorite_recipes_table.c.recipe_id)
+            .cte("added")
+        )
+        logged = (
+            pg_insert(recipe_favorite_events_table)
+            .from_select(["recipe_id"], select(added_rows.c.recipe_id))
+            .cte("logged")
+        )
+        stmt = count_favorite_changes(added_rows, user.id, 1, logged)
+        try:
+            result = await self._session.execute(stmt)
+        except exc.IntegrityError as e:
+            # Só a FK da receita vira "não encontrada"; o resto (ex: usuário inexistente) sobe como está
+            if self._violated_foreign_key(e) in RECIPE_FOREIGN_KEYS:
+                raise ValueError(f"Recipe with ID {recipe_id} not found.") from e
+            raise
+        return result.scalar_one_or_none() is not None
+
+    async def remove_favorite(self, user: User, recipe_id: str) -> bool:
+        removed_rows = (
+            sa.delete(user_favorite_recipes_table)
+            .where(
+                user_favorite_recipes_table.c.user_id == user.id,
+                user_favorite_recipes_table.c.recipe_id == recipe_id,
+            )
+            .returning(user_favorite_recipes_table.c.recipe_id)
+            .cte("removed")
+        )
+        stmt = count_favorite_changes(removed_rows, user.id, -1)
         result = await self._session.execute(stmt)
-        user_model = result.scalar_one_or_none()
-        if user_model:
-            # Converte os RecipeModel para entidades Recipe
-            return [recipe_model.to_entity() for recipe_model in user_model.favorite_recipes]
-        return []
+        return result.scalar_one_or_none() is not None # False: não era favorito (ou a receita não existe)
+
+    async def update_favorites(self, user: User, add: Sequence[str], remove: Sequence[str]) -> FavoriteChanges:
+        # Dois comandos: um INSERT multi-linhas (ON CONFLICT DO NOTHING) e um
+        # DELETE ... = ANY, cada um já levando o contador e o log de tendências junto
+        favorites = user_favorite_recipes_table
+        added: Set[str] = set()
+        removed: Set[str] = set()
+        if add:
+            # O SELECT em recipes descarta IDs inexistentes (sem violar a FK e abortar o lote)
+            added_rows = (
+                pg_insert(favorites)
+                .from_select(
+                    ["user_id", "recipe_id"],
+                    select(sa.literal(user.id, sa.String), RecipeModel.id).where(
+                        RecipeModel.id == sa.any_(sa.literal(list(add), postgresql.ARRAY(sa.String)))
+                    ),
+                )
+                .on_conflict_do_nothing()
+                .returning(favorites.c.recipe_id)
+                .cte("added")
+            )
+            logged = (
+                pg_insert(recipe_favorite_events_table)
+                .from_select(["recipe_id"], select(added_rows.c.recipe_id))
+                .cte("logged")
+            )
+            result = await self._session.execute(count_favorite_changes(added_rows, user.id, 1, logged))
+            added = set(result.scalars().all())
+        if remove:
+            removed_rows = (
+                sa.delete(favorites)
+                .where(
+                    favorites.c.user_id == user.id,
+                    favorites.c.recipe_id == sa.any_(sa.literal(list(remove), postgresql.ARRAY(sa.String))),
+                )
+                .returning(favorites.c.recipe_id)
+                .cte("removed")
+            )
+            result = await self._session.execute(count_favorite_changes(removed_rows, user.id, -1))
+            removed = set(result.scalars().all())
+        # Na ordem em que foram pedidos
+        return FavoriteChanges(
+            added=[recipe_id for recipe_id in add if recipe_id in added],
+            removed=[recipe_id for recipe_id in remove if recipe_id in removed],
+        )
+
+    async def get_user_favorite_recipes(self, user: User, fields: Optional[Sequence[str]] = None) -> List[Recipe]:
+        # Uma consulta só: receitas unidas à tabela de associação, com as colunas pedidas
+        favorites = user_favorite_recipes_table
+        stmt = (
+            select(*self._columns(fields, "updated_at"))
+            .join(favorites, favorites.c.recipe_id == RecipeModel.id)
+            .where(favorites.c.user_id == user.id)
+            .order_by(favorites.c.created_at.desc(), favorites.c.recipe_id.desc())
+        )
+        result = await self._session.execute(stmt)
+        return [self._row_to_entity(row) for row in result.mappings().all()]
+
+    async def get_user_favorite_recipes_page(
+        self,
+        user: User,
+        limit: int,
+        cursor: Optional[Cursor] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[Recipe]:
+        # Parte da tabela de associação pelo índice (user_id, created_at, recipe_id) e só
+        # então busca as receitas da página; o usuário em si nunca é carregado
+        favorites = user_favorite_recipes_table
+        favorited_at = favorites.c.created_at.label("favorited_at")
+        stmt = (
+            select(*self._columns(fields, "updated_at"), favorited_at)
+            .select_from(favorites)
+            .join(RecipeModel, RecipeModel.id == favorites.c.recipe_id)
+            .where(favorites.c.user_id == user.id)
+        )
+        if cursor is not None:
+            last_favorited_at, last_id = self._decode_favorites_cursor(cursor)
+            stmt = stmt.where(
+                sa.tuple_(favorites.c.created_at, favorites.c.recipe_id) < sa.tuple_(last_favorited_at, last_id)
+            )
+        stmt = stmt.order_by(favorites.c.created_at.desc(), favorites.c.recipe_id.desc())
+
+        result = await self._session.execute(stmt.limit(limit + 1))
+        rows = result.mappings().all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = Cursor("favorited_at", [self._encode_key(last["favorited_at"]), last["id"]]).encode()
+        return Page([self._row_to_entity(row) for row in rows], next_cursor)
 
     async def update(self, recipe: Recipe) -> Optional[Recipe]:
         # Implementação para atualizar uma receita
@@ -105,34 +596,35 @@ class SQLAlchemyRecipeRepository(RecipeRepository):
         existing_recipe.instructions = recipe.instructions
         existing_recipe.is_public = recipe.is_public
         
-        await self._session.commit()
-        await self._session.refresh(existing_recipe)
+        await self._session.flush()
+        await self._session.refresh(existing_recipe) # updated_at vem do banco
         return existing_recipe.to_entity()
 
     async def delete(self, recipe_id: str) -> bool:
-        # Implementação para deletar uma receita
-        recipe_to_delete = await self._session.get(RecipeModel, recipe_id)
-        if not recipe_to_delete:
-            return False
-        
-        await self._session.delete(recipe_to_delete)
-        await self._session.commit()
-        return True
+        # Remove primeiro os vínculos de favoritos (sem carregar a coleção) e depois a receita;
+        # os shards do contador saem junto por ON DELETE CASCADE
+        await self._session.execute(
+            sa.delete(user_favorite_recipes_table).where(
+                user_favorite_recipes_table.c.recipe_id == recipe_id
+            )
+        )
+        result = await self._session.execute(
+            sa.delete(RecipeModel).where(RecipeModel.id == recipe_id).returning(RecipeModel.id)
+        )
+        return result.scalar_one_or_none() is not None
     
     async def is_favorite(self, user: User, recipe: Recipe) -> bool:
-            """Verifica se uma receita é favorita de um usuário."""
-            # Carregar o UserModel com suas receitas favoritas
-            stmt = select(UserModel).options(selectinload(UserModel.favorite_recipes)).where(UserModel.id == user.id)
-            result = await self._session.execute(stmt)
-            user_model = result.scalar_one_or_none()
-
-            if user_model:
-                # Verificar se a receita está na lista de favoritos do usuário
-                # Precisamos do RecipeModel para fazer a comparação direta no relacionamento
-                recipe_model_stmt = select(RecipeModel).where(RecipeModel.id == recipe.id)
-                recipe_model_result = await self._session.execute(recipe_model_stmt)
-                recipe_model = recipe_model_result.scalar_one_or_none()
-
-                if recipe_model and recipe_model in user_model.favorite_recipes:
-                    return True
-            return False
\ No newline at end of file
+        """Verifica se uma receita é favorita de um usuário."""
+        return recipe.id in await self.get_favorite_recipe_ids(user, [recipe.id])
+
+    async def get_favorite_recipe_ids(self, user: User, recipe_ids: Sequence[str]) -> Set[str]:
+        if not recipe_ids:
+            return set()
+        # Busca pela chave primária (user_id, recipe_id) com um único parâmetro array
+        favorites = user_favorite_recipes_table
+        ids_param = sa.literal(list(recipe_ids), postgresql.ARRAY(sa.String))
+        stmt = select(favorites.c.recipe_id).where(
+            favorites.c.user_id == user.id, favorites.c.recipe_id == sa.any_(ids_param)
+        )
+        result = await self._session.execute(stmt)
+        return set(result.scalars().all())
@@ -0,0 +1,60 @@
+# petfit/infra/unit_of_work.py
+
+from typing import Callable, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from petfit.domain.services.unit_of_work import UnitOfWork
+
+
+class SQLAlchemyUnitOfWork(UnitOfWork):
+    """Unidade de trabalho sobre uma AsyncSession: um único COMMIT para todas as escritas.
+
+    Só faz COMMIT se algo foi escrito (flush do ORM ou INSERT/UPDATE/DELETE via
+    execute): requisições só de leitura terminam sem ida extra ao banco, e um
+    stream ainda aberto na sessão (export NDJSON/CSV) não é interrompido.
+    Pode ser reutilizada em vários blocos `async with` (um commit por bloco).
+    Fica registrada em `session.info`: quem só tem a sessão a encontra com `of(session)`.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self._has_writes = False
+        self._after_commit: List[Callable[[], None]] = []
+        session.info["unit_of_work"] = self
+        event.listen(session.sync_session, "do_orm_execute", self._on_execute)
+        event.listen(session.sync_session, "after_flush", self._on_flush)
+
+    @classmethod
+    def of(cls, session: AsyncSession) -> Optional["SQLAlchemyUnitOfWork"]:
+        """A unidade de trabalho que envolve `session`, se houver."""
+        return session.info.get("unit_of_work")
+
+    @property
+    def has_writes(self) -> bool:
+        return self._has_writes
+
+    def _on_execute(self, orm_execute_state) -> None:
+        if not orm_execute_state.is_select:
+            self._has_writes = True
+
+    def _on_flush(self, session, flush_context) -> None:
+        self._has_writes = True
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        # Tira os callbacks antes: se o COMMIT falhar, eles são descartados junto
+        callbacks, self._after_commit = self._after_commit, []
+        if self._has_writes:
+            self._has_writes = False
+            await self._session.commit()
+        for callback in callbacks:
+            callback()
+
+    async def rollback(self) -> None:
+        await self._session.rollback()
+        self._has_writes = False
+        self._after_commit = []
@@ -0,0 +1,20 @@
+# petfit/usecases/recipe/export_recipes.py
+
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from typing import Any, AsyncIterator, Mapping, Optional, Sequence
+
+class ExportRecipesUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    def execute(
+        self,
+        is_public: Optional[bool] = None,
+        title: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Mapping[str, Any]]]:
+        """Itera sobre todas as receitas (ou as filtradas) em lotes, para exportação."""
+        return self.repository.stream_recipes(
+            is_public=is_public, title=title, ingredient=ingredient, batch_size=batch_size
+        )
@@ -0,0 +1,27 @@
+# petfit/usecases/recipe/find_recipes_by_ingredients.py
+
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.page import Page
+from petfit.domain.value_objects.recipe_ingredient_match import RecipeIngredientMatch
+from typing import List, Optional
+
+class FindRecipesByIngredientsUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(
+        self,
+        ingredients: List[str],
+        match_all: bool,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> Page[RecipeIngredientMatch]:
+        """Receitas públicas com todos (ou algum) dos ingredientes, comparados sem caixa e sem espaços nas pontas."""
+        normalized = list(dict.fromkeys(item.strip().lower() for item in ingredients if item.strip()))
+        if not normalized:
+            raise ValueError("At least one ingredient is required.")
+        decoded = Cursor.decode(cursor) if cursor else None
+        return await self.repository.find_public_recipes_by_ingredients(
+            normalized, match_all, limit, cursor=decoded
+        )
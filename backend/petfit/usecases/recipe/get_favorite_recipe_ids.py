@@ -0,0 +1,13 @@
+# petfit/usecases/recipe/get_favorite_recipe_ids.py
+
+from petfit.domain.entities.user import User
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from typing import Sequence, Set
+
+class GetFavoriteRecipeIdsUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(self, user: User, recipe_ids: Sequence[str]) -> Set[str]:
+        """Quais das receitas (ex: as de uma página) são favoritas do usuário."""
+        return await self.repository.get_favorite_recipe_ids(user, list(dict.fromkeys(recipe_ids)))
@@ -0,0 +1,13 @@
+# petfit/usecases/recipe/get_popular_recipes.py
+
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.value_objects.recipe_popularity import RecipePopularity
+from typing import List
+
+class GetPopularRecipesUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(self, limit: int) -> List[RecipePopularity]:
+        """As receitas públicas mais favoritadas, da mais para a menos favoritada."""
+        return await self.repository.get_popular_recipes(limit)
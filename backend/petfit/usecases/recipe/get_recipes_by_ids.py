@@ -0,0 +1,19 @@
+# petfit/usecases/recipe/get_recipes_by_ids.py
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from typing import List, Tuple
+
+class GetRecipesByIdsUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(self, recipe_ids: List[str]) -> Tuple[List[Recipe], List[str]]:
+        """Obtém várias receitas numa só consulta.
+        Retorna as encontradas na ordem pedida (sem repetições) e os IDs que não existem.
+        """
+        unique_ids = list(dict.fromkeys(recipe_ids))
+        recipes = await self.repository.get_many(unique_ids)
+        found = {recipe.id for recipe in recipes}
+        missing = [recipe_id for recipe_id in unique_ids if recipe_id not in found]
+        return recipes, missing
@@ -0,0 +1,33 @@
+# petfit/usecases/recipe/get_trending_recipes.py
+
+from datetime import datetime, timezone
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.services.trending import TrendingDecay
+from petfit.domain.value_objects.recipe_trend import RecipeTrend
+from typing import List, Optional, Sequence, Tuple
+
+class GetTrendingRecipesUseCase:
+    def __init__(self, repository: RecipeRepository, decay: TrendingDecay):
+        self.repository = repository
+        self.decay = decay
+
+    async def execute(
+        self,
+        limit: int,
+        precomputed: Optional[Sequence[Tuple[str, float]]] = None,
+        now: Optional[datetime] = None,
+    ) -> List[RecipeTrend]:
+        """Receitas públicas em alta, da maior para a menor.
+
+        Usa o ranking pré-calculado quando houver (`precomputed`); senão consulta os escores no repositório.
+        """
+        entries = precomputed if precomputed is not None else await self.repository.get_trending_scores(limit)
+        entries = list(entries)[:limit]
+        recipes = {recipe.id: recipe for recipe in await self.repository.get_many([rid for rid, _ in entries])}
+        now = now or datetime.now(timezone.utc)
+        return [
+            RecipeTrend(recipes[recipe_id], self.decay.score(log_score, now))
+            for recipe_id, log_score in entries
+            # A receita pode ter sido apagada ou ficado privada depois do cálculo do ranking
+            if recipe_id in recipes and recipes[recipe_id].is_public
+        ]
@@ -3,12 +3,12 @@
 from petfit.domain.entities.recipe import Recipe
 from petfit.domain.entities.user import User
 from petfit.domain.repositories.recipe_repository import RecipeRepository
-from typing import List
+from typing import List, Optional, Sequence
 
 class GetUserFavoriteRecipesUseCase:
     def __init__(self, repository: RecipeRepository):
         self.repository = repository
 
-    async def execute(self, user: User) -> List[Recipe]:
-        """Obtém todas as receitas favoritas de um usuário."""
-        return await self.repository.get_user_favorite_recipes(user)
\ No newline at end of file
+    async def execute(self, user: User, fields: Optional[Sequence[str]] = None) -> List[Recipe]:
+        """Obtém todas as receitas favoritas de um usuário (só os campos `fields`, se informados)."""
+        return await self.repository.get_user_favorite_recipes(user, fields=fields)
\ No newline at end of file
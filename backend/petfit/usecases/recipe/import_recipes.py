@@ -0,0 +1,46 @@
+# petfit/usecases/recipe/import_recipes.py
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from typing import AsyncIterable, List, Tuple
+
+class RecipeImportResult:
+    def __init__(self):
+        self.imported = 0
+        self.errors: List[Tuple[int, str]] = [] # (posição da linha na entrada, erro)
+
+class ImportRecipesUseCase:
+    def __init__(self, repository: RecipeRepository, chunk_size: int = 1000):
+        self.repository = repository
+        self.chunk_size = chunk_size
+
+    async def execute(self, rows: AsyncIterable[Tuple[int, Recipe]]) -> RecipeImportResult:
+        """Importa receitas já validadas em lotes de `chunk_size` (um INSERT multi-linhas por lote).
+        Um lote rejeitado pelo banco é refeito linha a linha, para importar as linhas boas e
+        reportar só as que falham de fato, com o motivo; os demais lotes seguem normalmente.
+        """
+        result = RecipeImportResult()
+        chunk: List[Tuple[int, Recipe]] = []
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                await self._flush(chunk, result)
+                chunk = []
+        if chunk:
+            await self._flush(chunk, result)
+        return result
+
+    async def _flush(self, chunk: List[Tuple[int, Recipe]], result: RecipeImportResult) -> None:
+        try:
+            result.imported += await self.repository.create_many([recipe for _, recipe in chunk])
+            return
+        except ValueError as e:
+            if len(chunk) == 1:
+                result.errors.append((chunk[0][0], str(e)))
+                return
+        # Cada linha no seu próprio SAVEPOINT (create_many de uma receita só)
+        for index, recipe in chunk:
+            try:
+                result.imported += await self.repository.create_many([recipe])
+            except ValueError as e:
+                result.errors.append((index, str(e)))
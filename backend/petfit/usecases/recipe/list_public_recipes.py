@@ -0,0 +1,27 @@
+# petfit/usecases/recipe/list_public_recipes.py
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.page import Page
+from petfit.domain.value_objects.recipe_sort import RecipeSort
+from typing import Optional, Sequence
+
+class ListPublicRecipesUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort: RecipeSort = RecipeSort.NEWEST,
+        title: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[Recipe]:
+        """Obtém uma página de receitas públicas. O cursor é o token opaco devolvido pela página anterior."""
+        decoded = Cursor.decode(cursor) if cursor else None
+        return await self.repository.get_public_recipes_page(
+            limit, cursor=decoded, sort=sort, title=title, ingredient=ingredient, fields=fields
+        )
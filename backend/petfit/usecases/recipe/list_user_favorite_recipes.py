@@ -0,0 +1,23 @@
+# petfit/usecases/recipe/list_user_favorite_recipes.py
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.entities.user import User
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.page import Page
+from typing import Optional, Sequence
+
+class ListUserFavoriteRecipesUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(
+        self,
+        user: User,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[Recipe]:
+        """Obtém uma página dos favoritos do usuário, dos mais recentes. O cursor é o token opaco da página anterior."""
+        decoded = Cursor.decode(cursor) if cursor else None
+        return await self.repository.get_user_favorite_recipes_page(user, limit, cursor=decoded, fields=fields)
@@ -1,6 +1,5 @@
 # petfit/usecases/recipe/remove_favorite_recipe.py
 
-from petfit.domain.entities.recipe import Recipe
 from petfit.domain.entities.user import User
 from petfit.domain.repositories.recipe_repository import RecipeRepository
 
@@ -12,9 +11,4 @@ class RemoveFavoriteRecipeUseCase:
         """Remove uma receita dos favoritos de um usuário.
         Retorna True se removido com sucesso, False caso contrário (ex: não era favorito ou receita não existe).
         """
-        # Obtenha a entidade Recipe completa
-        recipe = await self.repository.get_by_id(recipe_id)
-        if not recipe:
-            raise ValueError(f"Recipe with ID {recipe_id} not found.")
-
-        return await self.repository.remove_favorite(user, recipe)
\ No newline at end of file
+        return await self.repository.remove_favorite(user, recipe_id)
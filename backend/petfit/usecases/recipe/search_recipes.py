@@ -0,0 +1,22 @@
+# petfit/usecases/recipe/search_recipes.py
+
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.page import Page
+from petfit.domain.value_objects.recipe_search_result import RecipeSearchResult
+from typing import Optional, Sequence
+
+class SearchRecipesUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(
+        self,
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page[RecipeSearchResult]:
+        """Busca receitas públicas por texto, da mais para a menos relevante."""
+        decoded = Cursor.decode(cursor) if cursor else None
+        return await self.repository.search_public_recipes(query.strip(), limit, cursor=decoded, fields=fields)
@@ -0,0 +1,25 @@
+# petfit/usecases/recipe/stream_public_recipes.py
+
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.recipe_sort import RecipeSort
+from typing import Any, AsyncIterator, Mapping, Optional, Sequence
+
+class StreamPublicRecipesUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    def execute(
+        self,
+        sort: RecipeSort = RecipeSort.NEWEST,
+        cursor: Optional[str] = None,
+        title: Optional[str] = None,
+        ingredient: Optional[str] = None,
+        batch_size: int = 500,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Sequence[Mapping[str, Any]]]:
+        """Itera sobre todas as receitas públicas em lotes, para consumidores em massa (sync, prefetch)."""
+        decoded = Cursor.decode(cursor) if cursor else None
+        return self.repository.stream_public_recipes(
+            sort=sort, cursor=decoded, title=title, ingredient=ingredient, batch_size=batch_size, fields=fields
+        )
@@ -0,0 +1,23 @@
+# petfit/usecases/recipe/update_favorite_recipes.py
+
+from petfit.domain.entities.user import User
+from petfit.domain.repositories.recipe_repository import RecipeRepository
+from petfit.domain.value_objects.favorite_changes import FavoriteChanges
+from typing import List
+
+class UpdateFavoriteRecipesUseCase:
+    def __init__(self, repository: RecipeRepository):
+        self.repository = repository
+
+    async def execute(self, user: User, add: List[str], remove: List[str]) -> FavoriteChanges:
+        """Adiciona e remove vários favoritos de uma vez, numa só transação.
+        Retorna só os IDs que mudaram. Levanta ValueError se um ID estiver nas duas listas.
+        """
+        add = list(dict.fromkeys(add))
+        remove = list(dict.fromkeys(remove))
+        both = set(add) & set(remove)
+        if both:
+            raise ValueError(f"Recipe IDs cannot be both added and removed: {', '.join(sorted(both))}.")
+        if not add and not remove:
+            return FavoriteChanges(added=[], removed=[])
+        return await self.repository.update_favorites(user, add, remove)
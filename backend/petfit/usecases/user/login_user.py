@@ -2,11 +2,13 @@ from petfit.domain.value_objects.email_vo import Email
 from petfit.domain.value_objects.password import Password
 from petfit.domain.entities.user import User
 from petfit.domain.repositories.user_repository import UserRepository
+from petfit.domain.services.password_hasher import PasswordHasher
 from typing import Optional
 
 class LoginUserUseCase:
-    def __init__(self, repository: UserRepository):
+    def __init__(self, repository: UserRepository, hasher: PasswordHasher):
         self.repository = repository
+        self.hasher = hasher
 
     async def execute(self, email: Email, plain_password: str) -> Optional[User]:
         user = await self.repository.login(email) 
@@ -14,7 +16,8 @@ class LoginUserUseCase:
         if not user:
             return None  # Usuário não encontrado
 
-        if user.password.verify(plain_password):
+        # bcrypt.checkpw roda no pool do hasher, sem travar o event loop
+        if await self.hasher.verify(user.password, plain_password):
             return user
         
-        return None  # Credenciais inválidas (senha incorreta)
\ No newline at end of file
+        return None  # Credenciais inválidas (senha incorreta)
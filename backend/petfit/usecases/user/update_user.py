@@ -7,5 +7,5 @@ class UpdateUserUseCase:
     def __init__(self, repository: UserRepository):
         self.repository = repository
 
-    def execute(self, user: User) -> Optional[User]:
-        return self.repository.update(user)
\ No newline at end of file
+    async def execute(self, user: User) -> Optional[User]:
+        return await self.repository.update(user)
\ No newline at end of file
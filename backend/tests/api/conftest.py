@@ -0,0 +1,34 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from petfit.api import deps
+from petfit.api.main import app
+from petfit.api.routes import recipe_route
+from petfit.api.settings import settings
+
+
+@pytest.fixture
+def api_client(monkeypatch):
+    """Cliente da API com um repositório de receitas falso, sem banco.
+
+    `make(recipe_repo, user=None)`: as rotas de receitas usam `recipe_repo`; com
+    `user`, as rotas autenticadas o recebem como usuário logado.
+    """
+
+    def make(recipe_repo, user=None):
+        async def open_db_session():
+            async with AsyncSession() as session: # sem bind: nenhuma consulta chega ao banco
+                yield session
+
+        async def get_recipe_repository(db):
+            return recipe_repo
+
+        monkeypatch.setattr(recipe_route, "get_recipe_repository", get_recipe_repository)
+        monkeypatch.setattr(settings, "FEED_SNAPSHOT_ENABLED", False)
+        monkeypatch.setitem(app.dependency_overrides, deps.open_db_session, open_db_session)
+        if user is not None:
+            monkeypatch.setitem(app.dependency_overrides, deps.get_current_user, lambda: user)
+        return TestClient(app)
+
+    return make
@@ -0,0 +1,85 @@
+import gzip
+
+import brotli
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from petfit.api.compression import CompressionMiddleware
+from petfit.infra.cache.lru_ttl_cache import LRUTTLCache
+
+BIG = {"items": [{"id": str(i), "title": "Pão de queijo"} for i in range(200)]}
+
+
+def make_client(cache=None):
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024, cache=cache)
+
+    @app.get("/big")
+    def big():
+        return JSONResponse(BIG, headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/encoded")
+    def encoded():
+        return Response(gzip.compress(b"{}" * 1000), media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    def stream():
+        lines = (f'{{"n": {i}}}\n'.encode() for i in range(500))
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    return TestClient(app)
+
+
+def test_negotiates_brotli_and_gzip():
+    client = make_client()
+    br = client.get("/big", headers={"Accept-Encoding": "gzip, br"})
+    assert br.headers["content-encoding"] == "br"
+    assert "Accept-Encoding" in br.headers["vary"]
+
+    gz = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert gz.headers["content-encoding"] == "gzip"
+    assert gz.json() == BIG
+
+
+def test_compressed_body_gets_its_own_etag():
+    client = make_client()
+    assert client.get("/big", headers={"Accept-Encoding": "br"}).headers["etag"] == '"v1-br"'
+    assert client.get("/big", headers={"Accept-Encoding": "gzip"}).headers["etag"] == '"v1-gzip"'
+    assert client.get("/big", headers={"Accept-Encoding": "identity"}).headers["etag"] == '"v1"'
+
+
+def test_small_and_already_encoded_responses_pass_through():
+    client = make_client()
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    assert small.json() == {"ok": True}
+
+    encoded = client.get("/encoded", headers={"Accept-Encoding": "br"})
+    assert encoded.headers["content-encoding"] == "gzip"
+
+    identity = client.get("/big", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+
+
+def test_streaming_ndjson_is_compressed_incrementally():
+    client = make_client()
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "br"}) as response:
+        assert response.headers["content-encoding"] == "br"
+        assert "content-length" not in response.headers
+        raw = b"".join(response.iter_raw())
+    lines = brotli.decompress(raw).decode().splitlines()
+    assert len(lines) == 500 and lines[-1] == '{"n": 499}'
+
+
+def test_compressed_body_is_cached_by_etag():
+    cache = LRUTTLCache(max_size=10, ttl_seconds=60)
+    client = make_client(cache)
+    first = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    second = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert first.content == second.content
+    assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 1
@@ -0,0 +1,100 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from petfit.api import deps
+from petfit.api.main import app
+from petfit.api.settings import settings
+from petfit.api.streaming import csv_header, encode_csv_batch
+from petfit.domain.entities.user import User
+from petfit.domain.value_objects.email_vo import Email
+from petfit.domain.value_objects.password import Password
+
+COLUMNS = ["id", "title", "ingredients", "instructions", "is_public", "created_at"]
+CREATED_AT = datetime(2026, 5, 1, 12, 0, tzinfo=timezone.utc)
+AUTH = {"Authorization": "Bearer token"}
+
+
+def make_row(i, is_public=True):
+    return {
+        "id": f"r{i}",
+        "title": f"Pão, versão {i}",
+        "ingredients": ["farinha", "água"],
+        "instructions": ["Misture", "Asse"],
+        "is_public": is_public,
+        "created_at": CREATED_AT,
+    }
+
+
+class StreamingRecipeRepository:
+    """Repositório falso que entrega as linhas em lotes, registrando cada lote em `log`."""
+
+    def __init__(self, rows, log):
+        self.rows = rows
+        self.log = log
+        self.filters = None
+
+    async def stream_recipes(self, is_public=None, title=None, ingredient=None, batch_size=1000):
+        self.filters = (is_public, title, ingredient)
+        rows = [r for r in self.rows if is_public is None or r["is_public"] == is_public]
+        for start in range(0, len(rows), batch_size):
+            self.log.append(f"batch {start // batch_size}")
+            yield rows[start:start + batch_size]
+
+
+def test_csv_header_and_rows_follow_column_order():
+    assert csv_header(COLUMNS) == b"id,title,ingredients,instructions,is_public,created_at\r\n"
+    row = next(csv.reader(io.StringIO(encode_csv_batch([make_row(1)], COLUMNS).decode("utf-8"))))
+    assert row[0] == "r1"
+    assert row[1] == "Pão, versão 1" # vírgula dentro da célula: campo entre aspas
+    assert json.loads(row[2]) == ["farinha", "água"] # listas viram JSON (sem escapar acentos)
+    assert "água" in row[2]
+    assert row[4] == "True"
+    assert row[5] == CREATED_AT.isoformat()
+
+
+def test_csv_batch_has_no_header_and_one_line_per_row():
+    body = encode_csv_batch([make_row(1), make_row(2)], COLUMNS).decode("utf-8")
+    rows = list(csv.reader(io.StringIO(body)))
+    assert [r[0] for r in rows] == ["r1", "r2"]
+
+
+def test_export_streams_every_batch_after_the_unit_of_work_exits(api_client, monkeypatch):
+    log = []
+    user = User("u1", "User", Email("u1@example.com"), Password("$2b$12$hash", hashed=True))
+    repo = StreamingRecipeRepository([make_row(i) for i in range(5)], log)
+    client = api_client(repo, user=user)
+
+    async def open_db_session():
+        async with AsyncSession() as session:
+            yield session
+        log.append("session closed")
+
+    monkeypatch.setitem(app.dependency_overrides, deps.open_db_session, open_db_session)
+    monkeypatch.setattr(settings, "RECIPES_EXPORT_BATCH_SIZE", 2)
+
+    response = client.get("/recipes/recipes/export?format=csv", headers=AUTH)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="recipes.csv"'
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == COLUMNS
+    assert [r[0] for r in rows[1:]] == [f"r{i}" for i in range(5)]
+    # A sessão da requisição só fecha depois do último lote
+    assert log == ["batch 0", "batch 1", "batch 2", "session closed"]
+
+
+def test_export_ndjson_applies_filters(api_client):
+    user = User("u1", "User", Email("u1@example.com"), Password("$2b$12$hash", hashed=True))
+    repo = StreamingRecipeRepository([make_row(1), make_row(2, is_public=False)], [])
+    client = api_client(repo, user=user)
+
+    response = client.get("/recipes/recipes/export?is_public=false&title=P%C3%A3o&ingredient=farinha", headers=AUTH)
+    assert response.status_code == 200
+    assert repo.filters == (False, "Pão", "farinha")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == ["r2"]
+    assert lines[0]["ingredients"] == ["farinha", "água"]
@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+
+from petfit.api.fast_json import FastJSONResponse
+from petfit.api.schemas.recipe_schema import (
+    RecipeIngredientMatchOutput,
+    RecipeOutput,
+    RecipeSearchHitOutput,
+    ingredient_match_payload,
+    project_recipe,
+    search_hit_payload,
+)
+from petfit.api.schemas.user_schema import UserOutput, user_payload
+from petfit.api.streaming import encode_ndjson_batch
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.entities.user import User
+from petfit.domain.value_objects.email_vo import Email
+from petfit.domain.value_objects.password import Password
+from petfit.domain.value_objects.recipe_ingredient_match import RecipeIngredientMatch
+from petfit.domain.value_objects.recipe_search_result import RecipeSearchResult
+
+
+def make_recipe(created_at):
+    return Recipe("r1", "Pão de queijo", ["polvilho", "queijo"], ["Misture", "Asse"], True, created_at)
+
+
+def test_fast_path_matches_pydantic_bytes():
+    # O caminho rápido tem que produzir exatamente o JSON do response_model
+    for created_at in (
+        datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+        datetime(2026, 1, 2, 3, 4, 5),
+        None,
+    ):
+        recipe = make_recipe(created_at)
+        assert FastJSONResponse(project_recipe(recipe)).body == RecipeOutput.from_entity(recipe).model_dump_json().encode()
+
+
+def test_fast_path_matches_pydantic_for_hits_and_users():
+    recipe = make_recipe(datetime(2026, 1, 2, tzinfo=timezone.utc))
+    hit = RecipeSearchResult(recipe, 0.25, "«Pão» de queijo")
+    match = RecipeIngredientMatch(recipe, 2)
+    user = User("u1", "Maria", Email("maria@example.com"), Password("$2b$12$hash", hashed=True))
+
+    assert FastJSONResponse(search_hit_payload(hit)).body == RecipeSearchHitOutput.from_result(hit).model_dump_json().encode()
+    assert FastJSONResponse(ingredient_match_payload(match)).body == RecipeIngredientMatchOutput.from_match(match).model_dump_json().encode()
+    assert FastJSONResponse(user_payload(user)).body == UserOutput.from_entity(user).model_dump_json().encode()
+
+
+def test_ndjson_rows_use_the_same_encoding():
+    row = {"id": "r1", "created_at": datetime(2026, 1, 2, tzinfo=timezone.utc)}
+    assert encode_ndjson_batch([row, row]) == b'{"id":"r1","created_at":"2026-01-02T00:00:00Z"}\n' * 2
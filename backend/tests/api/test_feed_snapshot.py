@@ -0,0 +1,83 @@
+import asyncio
+import gzip
+
+import pytest
+
+from petfit.api.feed_snapshot import FeedSnapshotPublisher, FeedSnapshotReader, snapshot_response, write_snapshot
+
+
+def test_reader_maps_published_snapshot_and_follows_replacements(tmp_path):
+    path = str(tmp_path / "feed.snapshot")
+    reader = FeedSnapshotReader(path, max_age_seconds=60)
+    assert reader.current() is None
+
+    write_snapshot(path, '"v1"', {"identity": b'{"items":[]}', "gzip": gzip.compress(b'{"items":[]}')})
+    snapshot = reader.current()
+    assert snapshot.etag == '"v1"'
+    assert bytes(snapshot.variants["identity"]) == b'{"items":[]}'
+    assert reader.current() is snapshot # mesmo arquivo: não remapeia
+
+    write_snapshot(path, '"v2"', {"identity": b'{"items":[1]}'})
+    assert reader.current().etag == '"v2"'
+    assert bytes(snapshot.variants["identity"]) == b'{"items":[]}' # bytes antigos seguem válidos
+
+
+def test_reader_ignores_stale_snapshot(tmp_path):
+    path = str(tmp_path / "feed.snapshot")
+    write_snapshot(path, '"v1"', {"identity": b"{}"}, built_at=1000.0)
+    assert FeedSnapshotReader(path, max_age_seconds=60, clock=lambda: 1030.0).current() is not None
+    assert FeedSnapshotReader(path, max_age_seconds=60, clock=lambda: 1100.0).current() is None
+
+
+def test_reader_treats_truncated_or_corrupt_files_as_absent(tmp_path):
+    path = str(tmp_path / "feed.snap")
+    write_snapshot(path, '"v1"', {"identity": b'{"items":[]}', "gzip": b"gz"})
+    with open(path, "rb") as f:
+        full = f.read()
+    header_end = len(full) - len(b'{"items":[]}gz')
+
+    # Cortado no tamanho do cabeçalho, no meio do cabeçalho e no meio dos corpos; magic errado
+    for content in (full[:10], full[:header_end - 5], full[:-1], b"XXXXXXX\n" + full[8:]):
+        with open(path, "wb") as f:
+            f.write(content)
+        assert FeedSnapshotReader(path, max_age_seconds=60).current() is None
+
+    write_snapshot(path, '"v2"', {"identity": b"{}"}) # o próximo snapshot inteiro volta a valer
+    assert FeedSnapshotReader(path, max_age_seconds=60).current().etag == '"v2"'
+
+
+def test_snapshot_response_negotiates_gzip_and_revalidates(tmp_path):
+    path = str(tmp_path / "feed.snapshot")
+    body = b'{"items":[],"next_cursor":null}'
+    write_snapshot(path, '"v1"', {"identity": body, "gzip": gzip.compress(body)})
+    snapshot = FeedSnapshotReader(path, max_age_seconds=60).current()
+
+    plain = snapshot_response(snapshot, None, None, max_age=30)
+    assert bytes(plain.body) == body and "content-encoding" not in plain.headers
+
+    compressed = snapshot_response(snapshot, None, "br;q=1, gzip;q=0.8", max_age=30)
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] == '"v1-gzip"' # outra representação, outro validador forte
+    assert plain.headers["etag"] == '"v1"'
+    assert gzip.decompress(bytes(compressed.body)) == body
+
+    assert snapshot_response(snapshot, '"v1"', "gzip", max_age=30).status_code == 304
+    assert snapshot_response(snapshot, '"v1-gzip"', "gzip", max_age=30).status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_publisher_debounces_bursts_of_writes():
+    builds = []
+
+    async def build():
+        builds.append(1)
+
+    publisher = FeedSnapshotPublisher(build, debounce_seconds=0.01)
+    for _ in range(5):
+        publisher.request_rebuild()
+    await asyncio.sleep(0.05)
+    assert len(builds) == 1
+
+    publisher.request_rebuild()
+    await asyncio.sleep(0.05)
+    assert publisher.stats() == {"requests": 6, "builds": 2}
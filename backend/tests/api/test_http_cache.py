@@ -0,0 +1,118 @@
+from datetime import datetime, timezone
+
+from petfit.api.http_cache import cache_headers, encoded_etag, etag_matches, page_etag, recipe_etag
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.entities.user import User
+from petfit.domain.value_objects.email_vo import Email
+from petfit.domain.value_objects.page import Page
+from petfit.domain.value_objects.password import Password
+
+UPDATED_AT = datetime(2026, 5, 1, 12, 0, tzinfo=timezone.utc)
+AUTH = {"Authorization": "Bearer token"}
+
+
+def make_recipe(recipe_id="r1", title="Bolo", updated_at=UPDATED_AT):
+    return Recipe(recipe_id, title, ["ovo"], ["asse"], True, created_at=UPDATED_AT, updated_at=updated_at)
+
+
+class FakeRecipeRepository:
+    def __init__(self, recipes):
+        self.recipes = {r.id: r for r in recipes}
+
+    async def get_by_id(self, recipe_id):
+        return self.recipes.get(recipe_id)
+
+    async def get_public_recipes_page(self, limit, cursor=None, sort=None, title=None, ingredient=None, fields=None):
+        return Page(list(self.recipes.values())[:limit], None)
+
+    async def get_user_favorite_recipes_page(self, user, limit, cursor=None, fields=None):
+        return Page(list(self.recipes.values())[:limit], None)
+
+
+# Unidade: ETags e If-None-Match
+
+
+def test_recipe_etag_is_stable_and_follows_the_version():
+    assert recipe_etag(make_recipe()) == recipe_etag(make_recipe())
+    assert recipe_etag(make_recipe()) != recipe_etag(make_recipe(updated_at=datetime(2026, 5, 2, tzinfo=timezone.utc)))
+
+
+def test_recipe_etag_changes_with_content_in_the_same_transaction():
+    # Duas escritas na mesma transação repetem o updated_at (now()): o conteúdo diferencia
+    assert recipe_etag(make_recipe()) != recipe_etag(make_recipe(title="Outro título"))
+    assert recipe_etag(make_recipe()).startswith('"') # forte
+
+
+def test_recipe_etag_without_version_uses_the_content():
+    assert recipe_etag(make_recipe(updated_at=None)) == recipe_etag(make_recipe(updated_at=None))
+    assert recipe_etag(make_recipe(updated_at=None)) != recipe_etag(make_recipe(title="Outro", updated_at=None))
+
+
+def test_page_etag_covers_items_cursor_and_variant():
+    page = Page([make_recipe("r1"), make_recipe("r2")], None)
+    assert page_etag(page) == page_etag(Page([make_recipe("r1"), make_recipe("r2")], None))
+    assert page_etag(page) != page_etag(Page([make_recipe("r2"), make_recipe("r1")], None)) # ordem
+    assert page_etag(page) != page_etag(Page(page.items, "cursor"))
+    assert page_etag(page) != page_etag(page, ("id", "title"))
+
+
+def test_etag_matches_handles_star_lists_and_weak_validators():
+    etag = '"abc"'
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"outro"', etag)
+    assert etag_matches("*", etag)
+    assert etag_matches('"outro", "abc"', etag)
+    assert etag_matches('W/"abc"', etag)
+
+
+def test_encoded_etags_differ_but_still_match():
+    assert encoded_etag('"abc"', "gzip") == '"abc-gzip"'
+    assert encoded_etag('W/"abc"', "br") == 'W/"abc"' # fraco: já não promete bytes iguais
+    assert etag_matches('"abc-gzip"', '"abc"')
+    assert etag_matches('"abc"', '"abc-br"')
+    assert not etag_matches('"abd-gzip"', '"abc"')
+
+
+def test_cache_headers_scope():
+    assert cache_headers('"a"', 30)["Cache-Control"] == "public, max-age=30, must-revalidate"
+    assert cache_headers('"a"', 30, public=False)["Cache-Control"].startswith("private")
+
+
+# API: 304 e Cache-Control
+
+
+def test_get_recipe_revalidates_with_if_none_match(api_client):
+    client = api_client(FakeRecipeRepository([make_recipe()]))
+    first = client.get("/recipes/recipes/r1")
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "public, max-age=30, must-revalidate"
+    etag = first.headers["etag"]
+
+    again = client.get("/recipes/recipes/r1", headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.content == b""
+    assert again.headers["etag"] == etag
+
+    assert client.get("/recipes/recipes/r1", headers={"If-None-Match": '"velho"'}).status_code == 200
+
+
+def test_public_listing_revalidates_with_if_none_match(api_client):
+    client = api_client(FakeRecipeRepository([make_recipe("r1"), make_recipe("r2")]))
+    first = client.get("/recipes/recipes")
+    assert first.status_code == 200 and first.headers["cache-control"].startswith("public")
+    assert client.get("/recipes/recipes", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+    projected = client.get("/recipes/recipes?fields=title", headers={"If-None-Match": first.headers["etag"]})
+    assert projected.status_code == 200 # outra projeção, outro ETag
+
+
+def test_favorites_page_is_private_and_revalidates(api_client):
+    user = User("u1", "User", Email("u1@example.com"), Password("$2b$12$hash", hashed=True))
+    client = api_client(FakeRecipeRepository([make_recipe()]), user=user)
+    first = client.get("/recipes/users/me/favorites/recipes/page", headers=AUTH)
+    assert first.status_code == 200
+    assert first.headers["cache-control"].startswith("private")
+
+    again = client.get(
+        "/recipes/users/me/favorites/recipes/page", headers={**AUTH, "If-None-Match": first.headers["etag"]}
+    )
+    assert again.status_code == 304
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from petfit.api.settings import settings
+from petfit.api.streaming import PayloadTooLargeError, iter_ndjson_lines
+from petfit.domain.entities.user import User
+from petfit.domain.value_objects.email_vo import Email
+from petfit.domain.value_objects.password import Password
+
+AUTH = {"Authorization": "Bearer token"}
+RECIPE = {"title": "Bolo", "ingredients": ["ovo"], "instructions": ["asse"]}
+
+
+async def chunks(*parts):
+    for part in parts:
+        yield part
+
+
+async def lines(*parts, max_line_bytes=100):
+    return [line async for line in iter_ndjson_lines(chunks(*parts), max_line_bytes)]
+
+
+class ImportingRecipeRepository:
+    def __init__(self):
+        self.created = []
+
+    async def create_many(self, recipes):
+        self.created.extend(recipes)
+        return len(recipes)
+
+
+def make_user():
+    return User("u1", "User", Email("u1@example.com"), Password("$2b$12$hash", hashed=True))
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_split_across_chunks():
+    assert await lines(b'{"a":', b'1}\n\n{"b"', b":2}\n", b'{"c":3}') == [b'{"a":1}', b'{"b":2}', b'{"c":3}']
+
+
+@pytest.mark.asyncio
+async def test_ndjson_line_over_the_limit_is_rejected_without_a_newline():
+    with pytest.raises(PayloadTooLargeError):
+        await lines(b"x" * 60, b"x" * 60, max_line_bytes=100) # nunca chega um \n
+    with pytest.raises(PayloadTooLargeError):
+        await lines(b"x" * 101 + b"\n", max_line_bytes=100)
+    assert await lines(b"x" * 100 + b"\n", max_line_bytes=100) == [b"x" * 100]
+
+
+def test_import_rejects_oversized_ndjson_line_with_413(api_client, monkeypatch):
+    repo = ImportingRecipeRepository()
+    client = api_client(repo, user=make_user())
+    monkeypatch.setattr(settings, "RECIPES_IMPORT_MAX_LINE_BYTES", 100)
+
+    body = json.dumps(RECIPE) + "\n" + json.dumps({**RECIPE, "title": "x" * 200}) + "\n"
+    response = client.post(
+        "/recipes/recipes/import", content=body, headers={**AUTH, "Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 413
+
+
+def test_import_rejects_oversized_json_array_with_413(api_client, monkeypatch):
+    repo = ImportingRecipeRepository()
+    client = api_client(repo, user=make_user())
+    monkeypatch.setattr(settings, "RECIPES_IMPORT_MAX_BODY_BYTES", 200)
+
+    small = client.post("/recipes/recipes/import", json=[RECIPE], headers=AUTH)
+    assert small.status_code == 200 and small.json()["imported"] == 1
+
+    large = client.post("/recipes/recipes/import", json=[RECIPE] * 10, headers=AUTH)
+    assert large.status_code == 413
+    assert len(repo.created) == 1
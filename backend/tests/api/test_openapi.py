@@ -0,0 +1,31 @@
+from petfit.api.main import app
+
+
+def response_schemas(path, method="get"):
+    """Schemas (pelo nome) da resposta 200 de uma rota no documento OpenAPI."""
+    schema = app.openapi()["paths"][path][method]["responses"]["200"]["content"]["application/json"]["schema"]
+    options = schema.get("anyOf", [schema])
+    return [option.get("$ref", option.get("items", {}).get("$ref", "")).rsplit("/", 1)[-1] for option in options]
+
+
+def test_projected_listings_document_the_projection_schema():
+    assert response_schemas("/recipes/recipes") == ["RecipePageOutput", "RecipeProjectionPageOutput"]
+    assert response_schemas("/recipes/recipes/search") == ["RecipeSearchPageOutput", "RecipeSearchProjectionPageOutput"]
+    assert response_schemas("/recipes/users/me/favorites/recipes") == ["RecipeOutput", "RecipeProjectionOutput"]
+    assert response_schemas("/recipes/users/me/favorites/recipes/page") == [
+        "RecipePageOutput", "RecipeProjectionPageOutput"
+    ]
+
+    components = app.openapi()["components"]["schemas"]
+    assert components["RecipeProjectionOutput"]["required"] == ["id"] # só o id é garantido
+    assert components["RecipeSearchHitProjectionOutput"]["required"] == ["id", "rank", "snippet"]
+
+
+def test_favorite_marking_is_documented():
+    components = app.openapi()["components"]["schemas"]
+    for name in ("RecipeProjectionOutput", "RecipeSearchHitProjectionOutput"):
+        assert components[name]["properties"]["is_favorite"]["anyOf"] == [{"type": "boolean"}, {"type": "null"}]
+    assert response_schemas("/recipes/recipes/batch-get", "post") == [
+        "RecipeBatchGetOutput", "RecipeBatchGetWithFavoritesOutput"
+    ]
+    assert "is_favorite" in components["RecipeWithFavoriteOutput"]["required"]
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, Asyn
 from petfit.infra.database import Base
 from petfit.api.main import app
 from petfit.api import deps
+from petfit.api.settings import settings
 from asgi_lifespan import LifespanManager
 
 # URL para o banco de testes (deve bater com seu docker-compose)
@@ -55,15 +56,21 @@ async def db_session(setup_engine):
 
 
 @pytest_asyncio.fixture
-async def client(setup_engine):
+async def client(setup_engine, monkeypatch):
     """Cria cliente de teste com override de dependências."""
     _, async_session = setup_engine
 
-    async def override_get_db_session():
+    async def override_open_db_session():
         async with async_session() as session:
             yield session
 
-    app.dependency_overrides[deps.get_db_session] = override_get_db_session
+    # Só a abertura da sessão muda: a unidade de trabalho (commit por requisição) continua a de deps
+    app.dependency_overrides[deps.open_db_session] = override_open_db_session
+    # Os caches em processo sobrevivem entre testes; o banco não
+    deps.recipe_cache.clear()
+    deps.principal_cache.clear()
+    # O snapshot do feed é um arquivo compartilhado e reconstruído em segundo plano: fora dos testes de API
+    monkeypatch.setattr(settings, "FEED_SNAPSHOT_ENABLED", False)
 
     async with LifespanManager(app):
         transport = ASGITransport(app=app)
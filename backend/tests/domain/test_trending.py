@@ -0,0 +1,38 @@
+import math
+from datetime import datetime, timedelta, timezone
+
+from petfit.domain.services.trending import TRENDING_EPOCH, TrendingDecay, log_add_exp
+from petfit.infra.cache.trending_ranking import TrendingRanking
+
+HOUR = 3600
+
+
+def test_favorite_weight_halves_every_half_life():
+    decay = TrendingDecay(half_life_seconds=HOUR)
+    at = TRENDING_EPOCH + timedelta(days=400)
+    log_score = decay.log_weight(at)
+    assert math.isclose(decay.score(log_score, at), 1.0)
+    assert math.isclose(decay.score(log_score, at + timedelta(hours=2)), 0.25)
+
+
+def test_log_scores_accumulate_and_rank_like_decayed_sums():
+    decay = TrendingDecay(half_life_seconds=HOUR)
+    now = datetime(2027, 6, 1, tzinfo=timezone.utc)
+    # Dois favoritos de 2h atrás valem menos que um de agora
+    old = log_add_exp(decay.log_weight(now - timedelta(hours=2)), decay.log_weight(now - timedelta(hours=2)))
+    fresh = decay.log_weight(now)
+    assert math.isclose(decay.score(old, now), 0.5)
+    assert fresh > old
+    assert log_add_exp(1000.0, 1000.0) == 1000.0 + math.log(2) # sem overflow
+
+
+def test_trending_ranking_serves_only_what_it_covers():
+    ranking = TrendingRanking(capacity=2)
+    assert ranking.top(1) is None # ainda não carregado
+    ranking.replace([("a", 3.0), ("b", 2.0), ("c", 1.0)])
+    assert ranking.top(1) == [("a", 3.0)]
+    assert ranking.top(5) is None # truncado na capacidade
+
+    ranking.replace([("a", 3.0)])
+    assert ranking.top(5) == [("a", 3.0)] # cabem todas: a lista é completa
+    assert ranking.stats()["refreshes"] == 2
@@ -1,6 +1,8 @@
 import pytest
 from petfit.domain.value_objects.email_vo import Email
 from petfit.domain.value_objects.password import Password, PasswordValidationError
+from petfit.domain.value_objects.cursor import Cursor, InvalidCursorError
+from petfit.domain.value_objects.recipe_fields import InvalidFieldsError, parse_recipe_fields
 import bcrypt
 from pydantic import BaseModel, ValidationError
 
@@ -160,3 +162,27 @@ def test_pydantic_model_serialization():
     
     # Verificar que o hash exportado é o mesmo que o hash real da instância
     assert exported_data["password"] == user.password.hashed_value()
+
+
+# Testes para o cursor de paginação
+def test_cursor_roundtrip():
+    """Um cursor codificado deve ser decodificado para os mesmos valores."""
+    cursor = Cursor("-created_at", ["2025-07-17T19:46:17+00:00", "abc"])
+    token = cursor.encode()
+    assert "=" not in token
+    assert Cursor.decode(token) == cursor
+
+def test_cursor_invalid_token():
+    """Tokens malformados devem levantar InvalidCursorError (um ValueError)."""
+    with pytest.raises(InvalidCursorError):
+        Cursor.decode("nao-e-um-cursor")
+    with pytest.raises(ValueError):
+        Cursor.decode("")
+
+
+def test_parse_recipe_fields():
+    assert parse_recipe_fields(None) is None
+    assert parse_recipe_fields(" ") is None
+    assert parse_recipe_fields("created_at, title") == ("id", "title", "created_at")
+    with pytest.raises(InvalidFieldsError):
+        parse_recipe_fields("title,secret")
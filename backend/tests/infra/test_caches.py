@@ -0,0 +1,53 @@
+from petfit.domain.entities.user import User
+from petfit.domain.value_objects.email_vo import Email
+from petfit.domain.value_objects.password import Password
+from petfit.infra.cache.lru_ttl_cache import LRUTTLCache
+from petfit.infra.cache.principal_cache import PrincipalCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_ttl_cache_hits_and_misses():
+    cache = LRUTTLCache(max_size=10, ttl_seconds=30)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_lru_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache = LRUTTLCache(max_size=10, ttl_seconds=30, clock=clock)
+    cache.set("a", 1)
+    clock.now = 31
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_ttl_cache_evicts_least_recently_used():
+    cache = LRUTTLCache(max_size=2, ttl_seconds=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" passa a ser o menos usado
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.evictions == 1
+
+
+def test_principal_cache_invalidates_every_token_of_user():
+    user = User("1", "User", Email("user@example.com"), Password("$2b$12$hash", hashed=True))
+    cache = PrincipalCache()
+    cache.set("1", 100, user)
+    cache.set("1", 200, user)
+    cache.set("2", 100, user)
+    cache.invalidate_user("1")
+    assert cache.get("1", 100) is None
+    assert cache.get("1", 200) is None
+    assert cache.get("2", 100) is user
@@ -0,0 +1,193 @@
+import pytest
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.entities.user import User
+from petfit.domain.value_objects.email_vo import Email
+from petfit.domain.value_objects.password import Password
+from petfit.domain.services.unit_of_work import UnitOfWork
+from petfit.infra.cache.lru_ttl_cache import LRUTTLCache
+from petfit.infra.repositories.cached.caching_recipe_repository import CachingRecipeRepository
+
+
+class CountingRecipeRepository:
+    """Repositório falso que conta as leituras que chegam até ele."""
+
+    def __init__(self, recipes):
+        self.recipes = {r.id: r for r in recipes}
+        self.favorites = {}
+        self.reads = 0
+
+    async def get_by_id(self, recipe_id):
+        self.reads += 1
+        return self.recipes.get(recipe_id)
+
+    async def get_many(self, recipe_ids):
+        self.reads += 1
+        self.last_many = list(recipe_ids)
+        return [self.recipes[i] for i in recipe_ids if i in self.recipes]
+
+    async def get_all_public_recipes(self):
+        self.reads += 1
+        return [r for r in self.recipes.values() if r.is_public]
+
+    async def get_user_favorite_recipes(self, user, fields=None):
+        self.reads += 1
+        return [self.recipes[i] for i in self.favorites.get(user.id, [])]
+
+    async def get_favorite_recipe_ids(self, user, recipe_ids):
+        self.reads += 1
+        return set(self.favorites.get(user.id, [])) & set(recipe_ids)
+
+    async def update(self, recipe):
+        self.recipes[recipe.id] = recipe
+        return recipe
+
+    async def add_favorite(self, user, recipe_id):
+        self.favorites.setdefault(user.id, []).append(recipe_id)
+        return True
+
+
+class FakeUnitOfWork(UnitOfWork):
+    """Unidade de trabalho falsa: só guarda os callbacks de after_commit."""
+
+    has_writes = False
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after_commit(self, callback):
+        self.callbacks.append(callback)
+
+    async def commit(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+    async def rollback(self):
+        self.callbacks = []
+
+
+def make_user(user_id):
+    return User(user_id, "User", Email(f"{user_id}@example.com"), Password("$2b$12$hash", hashed=True))
+
+
+@pytest.fixture
+def inner():
+    return CountingRecipeRepository([Recipe("r1", "Bolo", ["ovo"], ["asse"]), Recipe("r2", "Pão", ["trigo"], ["asse"])])
+
+
+@pytest.fixture
+def repo(inner):
+    return CachingRecipeRepository(inner, LRUTTLCache(max_size=100, ttl_seconds=60))
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_is_read_through(repo, inner):
+    assert (await repo.get_by_id("r1")).title == "Bolo"
+    assert (await repo.get_by_id("r1")).title == "Bolo"
+    assert inner.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_update_invalidates_recipe_public_list_and_favorites(repo, inner):
+    alice, bob = make_user("alice"), make_user("bob")
+    await repo.add_favorite(alice, "r1")
+    await repo.add_favorite(bob, "r2")
+    await repo.get_by_id("r1")
+    await repo.get_all_public_recipes()
+    await repo.get_user_favorite_recipes(alice)
+    await repo.get_user_favorite_recipes(bob)
+    assert inner.reads == 4
+
+    await repo.update(Recipe("r1", "Bolo de cenoura", ["ovo"], ["asse"]))
+
+    assert (await repo.get_by_id("r1")).title == "Bolo de cenoura"
+    assert (await repo.get_all_public_recipes())[0].title == "Bolo de cenoura"
+    assert (await repo.get_user_favorite_recipes(alice))[0].title == "Bolo de cenoura"
+    await repo.get_user_favorite_recipes(bob) # não contém r1: continua em cache
+    assert inner.reads == 7
+
+
+@pytest.mark.asyncio
+async def test_add_favorite_invalidates_user_favorites(repo, inner):
+    alice = make_user("alice")
+    assert await repo.get_user_favorite_recipes(alice) == []
+    await repo.add_favorite(alice, "r2")
+    assert [r.id for r in await repo.get_user_favorite_recipes(alice)] == ["r2"]
+
+
+@pytest.mark.asyncio
+async def test_get_many_fetches_only_cache_misses(repo, inner):
+    await repo.get_by_id("r1")
+    recipes = await repo.get_many(["r2", "nope", "r1"])
+    assert [r.id for r in recipes] == ["r2", "r1"]
+    assert inner.last_many == ["r2", "nope"]
+
+
+@pytest.mark.asyncio
+async def test_projected_favorites_bypass_cold_cache_but_use_warm_one(repo, inner):
+    alice = make_user("alice")
+    await repo.add_favorite(alice, "r1")
+
+    await repo.get_user_favorite_recipes(alice, fields=("id", "title"))
+    await repo.get_user_favorite_recipes(alice, fields=("id", "title"))
+    assert inner.reads == 2 # projeção parcial não entra no cache
+
+    await repo.get_user_favorite_recipes(alice)
+    await repo.get_user_favorite_recipes(alice, fields=("id", "title"))
+    assert inner.reads == 3
+
+
+@pytest.mark.asyncio
+async def test_favorite_flags_use_warm_favorites_cache(repo, inner):
+    user = make_user("u1")
+    await repo.add_favorite(user, "r1")
+    assert await repo.get_favorite_recipe_ids(user, ["r1", "r2"]) == {"r1"}
+    assert inner.reads == 1 # cache frio: uma consulta no repositório
+
+    await repo.get_user_favorite_recipes(user) # aquece a lista de favoritos
+    assert await repo.get_favorite_recipe_ids(user, ["r1", "r2"]) == {"r1"}
+    assert await repo.is_favorite(user, inner.recipes["r2"]) is False
+    assert inner.reads == 2 # só a leitura da lista
+
+
+@pytest.mark.asyncio
+async def test_invalidation_is_repeated_after_commit(inner):
+    unit_of_work = FakeUnitOfWork()
+    cache = LRUTTLCache(max_size=100, ttl_seconds=60)
+    repo = CachingRecipeRepository(inner, cache, unit_of_work)
+    await repo.update(Recipe("r1", "Bolo de cenoura", ["ovo"], ["asse"]))
+    assert (await repo.get_by_id("r1")).title == "Bolo de cenoura" # a própria requisição lê o que escreveu
+
+    # Outra requisição recoloca no cache a linha de antes do commit...
+    inner.recipes["r1"] = Recipe("r1", "Bolo", ["ovo"], ["asse"])
+    cache.delete(("recipe", "r1"))
+    await repo.get_by_id("r1")
+    inner.recipes["r1"] = Recipe("r1", "Bolo de cenoura", ["ovo"], ["asse"])
+
+    # ...e o commit a derruba
+    await unit_of_work.commit()
+    assert (await repo.get_by_id("r1")).title == "Bolo de cenoura"
+
+
+@pytest.mark.asyncio
+async def test_callers_get_copies_of_cached_recipes(repo):
+    await repo.get_by_id("r1")
+    await repo.get_all_public_recipes() # aquece o cache
+
+    (await repo.get_by_id("r1")).title = "Alterado pela requisição"
+    assert (await repo.get_by_id("r1")).title == "Bolo"
+    (await repo.get_all_public_recipes())[0].title = "Alterado"
+    assert (await repo.get_all_public_recipes())[0].title == "Bolo"
+
+
+@pytest.mark.asyncio
+async def test_reads_after_uncommitted_writes_are_not_cached(inner):
+    unit_of_work = FakeUnitOfWork()
+    unit_of_work.has_writes = True
+    repo = CachingRecipeRepository(inner, LRUTTLCache(max_size=100, ttl_seconds=60), unit_of_work)
+    await repo.get_by_id("r1")
+    await repo.get_many(["r2"])
+    await repo.get_all_public_recipes()
+    await repo.get_by_id("r1")
+    assert inner.reads == 4 # nada foi guardado: um rollback desfaria essas linhas
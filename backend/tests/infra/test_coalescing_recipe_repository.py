@@ -0,0 +1,101 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.services.unit_of_work import UnitOfWork
+from petfit.infra.cache.single_flight import SingleFlight
+from petfit.infra.repositories.cached.coalescing_recipe_repository import CoalescingRecipeRepository
+
+
+class SlowRecipeRepository:
+    """Repositório falso de uma sessão: lento, e falha se usado depois de fechado."""
+
+    def __init__(self, title="Bolo"):
+        self.title = title
+        self.closed = False
+        self.reads = 0
+
+    async def get_by_id(self, recipe_id):
+        self.reads += 1
+        await asyncio.sleep(0.02)
+        if self.closed:
+            raise RuntimeError("session is closed")
+        return Recipe(recipe_id, self.title, ["ovo"], ["asse"])
+
+
+class Flights:
+    """Abre um SlowRecipeRepository por consulta compartilhada e o fecha no fim."""
+
+    def __init__(self):
+        self.opened = []
+
+    @asynccontextmanager
+    async def open(self):
+        repository = SlowRecipeRepository()
+        self.opened.append(repository)
+        try:
+            yield repository
+        finally:
+            repository.closed = True
+
+
+class FakeUnitOfWork(UnitOfWork):
+    def __init__(self, has_writes):
+        self._has_writes = has_writes
+
+    @property
+    def has_writes(self):
+        return self._has_writes
+
+    def after_commit(self, callback):
+        pass
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_cancelled_first_caller_does_not_break_the_others():
+    flights = Flights()
+    single_flight = SingleFlight()
+    request_sessions = [SlowRecipeRepository(), SlowRecipeRepository()]
+    first_repo, second_repo = (
+        CoalescingRecipeRepository(inner, single_flight, flights.open) for inner in request_sessions
+    )
+
+    first = asyncio.ensure_future(first_repo.get_by_id("r1"))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(second_repo.get_by_id("r1"))
+    await asyncio.sleep(0)
+    first.cancel()
+    request_sessions[0].closed = True # a requisição cancelada fecha a sessão dela
+
+    assert (await second).title == "Bolo"
+    assert len(flights.opened) == 1 and flights.opened[0].closed
+    assert all(inner.reads == 0 for inner in request_sessions) # nenhuma sessão de requisição foi usada
+
+
+@pytest.mark.asyncio
+async def test_each_caller_gets_its_own_copy():
+    flights = Flights()
+    repo = CoalescingRecipeRepository(SlowRecipeRepository(), SingleFlight(), flights.open)
+
+    first, second = await asyncio.gather(repo.get_by_id("r1"), repo.get_by_id("r1"))
+    assert len(flights.opened) == 1
+    first.title = "Alterado"
+    assert second.title == "Bolo"
+
+
+@pytest.mark.asyncio
+async def test_reads_after_uncommitted_writes_use_the_request_session():
+    flights = Flights()
+    inner = SlowRecipeRepository(title="Escrito nesta transação")
+    repo = CoalescingRecipeRepository(inner, SingleFlight(), flights.open, FakeUnitOfWork(has_writes=True))
+
+    assert (await repo.get_by_id("r1")).title == "Escrito nesta transação"
+    assert inner.reads == 1 and flights.opened == []
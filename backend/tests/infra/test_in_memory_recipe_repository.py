@@ -0,0 +1,91 @@
+import pytest
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.infra.repositories.in_memory.in_memory_recipe_repository import InMemoryRecipeRepository
+
+
+class SearchOnlyRecipeRepository(InMemoryRecipeRepository):
+    """Só a busca é exercitada aqui: o resto do contrato falha se for chamado."""
+
+    async def create_many(self, recipes):
+        raise NotImplementedError
+
+    async def get_many(self, recipe_ids):
+        raise NotImplementedError
+
+    async def get_all_public_recipes(self):
+        raise NotImplementedError
+
+    async def get_public_recipes_page(self, limit, cursor=None, sort=None, title=None, ingredient=None, fields=None):
+        raise NotImplementedError
+
+    async def find_public_recipes_by_ingredients(self, ingredients, match_all, limit, cursor=None):
+        raise NotImplementedError
+
+    async def get_popular_recipes(self, limit):
+        raise NotImplementedError
+
+    async def get_trending_scores(self, limit):
+        raise NotImplementedError
+
+    def stream_public_recipes(self, sort=None, cursor=None, title=None, ingredient=None, batch_size=500, fields=None):
+        raise NotImplementedError
+
+    def stream_recipes(self, is_public=None, title=None, ingredient=None, batch_size=1000):
+        raise NotImplementedError
+
+    async def add_favorite(self, user, recipe_id):
+        raise NotImplementedError
+
+    async def remove_favorite(self, user, recipe_id):
+        raise NotImplementedError
+
+    async def update_favorites(self, user, add, remove):
+        raise NotImplementedError
+
+    async def get_user_favorite_recipes(self, user, fields=None):
+        raise NotImplementedError
+
+    async def get_user_favorite_recipes_page(self, user, limit, cursor=None, fields=None):
+        raise NotImplementedError
+
+    async def is_favorite(self, user, recipe):
+        raise NotImplementedError
+
+    async def get_favorite_recipe_ids(self, user, recipe_ids):
+        raise NotImplementedError
+
+    async def update(self, recipe):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def repo():
+    repo = SearchOnlyRecipeRepository()
+    repo.create(Recipe("r1", "Frango com arroz", ["frango", "arroz"], ["Cozinhe o frango"], True))
+    repo.create(Recipe("r2", "Arroz doce", ["arroz", "leite"], ["Cozinhe o arroz no leite"], True))
+    repo.create(Recipe("r3", "Frango secreto", ["frango"], ["Asse"], False))
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_public_recipes_and_highlights_matches(repo):
+    page = await repo.search_public_recipes("frango", 10)
+    assert [hit.recipe.id for hit in page.items] == ["r1"] # a privada fica de fora
+    assert page.items[0].rank == 3
+    assert page.items[0].snippet.startswith("«Frango» com arroz «frango»")
+
+    doce = (await repo.search_public_recipes("leite", 10)).items[0]
+    assert "«leite»" in doce.snippet # o trecho vem de onde o termo aparece, não só do título
+
+
+@pytest.mark.asyncio
+async def test_search_applies_fields_and_paginates(repo):
+    first = await repo.search_public_recipes("arroz", 1, fields=("title",))
+    recipe = first.items[0].recipe
+    assert (recipe.id, recipe.title, recipe.ingredients, recipe.instructions) == ("r2", "Arroz doce", None, None)
+
+    second = await repo.search_public_recipes("arroz", 1, cursor=Cursor.decode(first.next_cursor))
+    assert [hit.recipe.id for hit in second.items] == ["r1"]
+    assert second.next_cursor is None
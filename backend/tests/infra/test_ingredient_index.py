@@ -0,0 +1,114 @@
+import pytest
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.services.unit_of_work import UnitOfWork
+from petfit.infra.cache.ingredient_index import IngredientIndex
+from petfit.infra.repositories.cached.indexing_recipe_repository import IngredientIndexingRecipeRepository
+
+
+def test_suggest_ranks_by_frequency_then_name():
+    index = IngredientIndex()
+    index.put("r1", ["Arroz", " alho "])
+    index.put("r2", ["arroz", "azeite"])
+    index.put("r3", ["arroz", "alho", "batata"])
+
+    assert index.suggest("a") == [("arroz", 3), ("alho", 2), ("azeite", 1)]
+    assert index.suggest("A", limit=1) == [("arroz", 3)]
+    assert index.suggest("al") == [("alho", 2)]
+    assert index.suggest("x") == []
+
+
+def test_put_replaces_and_private_or_discard_removes():
+    index = IngredientIndex()
+    index.put("r1", ["ovo", "leite"])
+    index.put("r1", ["ovo", "trigo"])
+    assert index.suggest("l") == []
+    assert index.suggest("t") == [("trigo", 1)]
+
+    index.put("r1", ["ovo"], is_public=False)
+    assert len(index) == 0
+
+    index.put("r2", ["ovo"])
+    index.discard("r2")
+    index.discard("inexistente")
+    assert index.suggest("o") == []
+
+
+@pytest.mark.asyncio
+async def test_rebuild_replaces_state_and_keeps_concurrent_writes():
+    index = IngredientIndex()
+    index.put("old", ["sal"])
+
+    async def rows_with_write_during_rebuild():
+        yield [{"id": "r1", "ingredients": ["Ovo"]}]
+        index.put("r2", ["ovo"]) # escrita chegando no meio do rebuild
+        yield [{"id": "r3", "ingredients": ["leite"]}]
+
+    await index.rebuild(rows_with_write_during_rebuild())
+
+    assert index.suggest("s") == []
+    assert index.suggest("o") == [("ovo", 2)]
+    assert index.stats() == {"ingredients": 2, "recipes": 3, "rebuilds": 1}
+
+
+class FakeRecipeRepository:
+    async def create(self, recipe):
+        return recipe
+
+    async def update(self, recipe):
+        return recipe if recipe.id == "r1" else None
+
+    async def delete(self, recipe_id):
+        return recipe_id == "r1"
+
+
+@pytest.mark.asyncio
+async def test_repository_writes_update_the_index():
+    index = IngredientIndex()
+    repo = IngredientIndexingRecipeRepository(FakeRecipeRepository(), index)
+
+    await repo.create(Recipe("r1", "Bolo", ["ovo"], ["asse"]))
+    assert index.suggest("o") == [("ovo", 1)]
+
+    await repo.update(Recipe("r1", "Bolo", ["trigo"], ["asse"]))
+    await repo.update(Recipe("r9", "Pão", ["fermento"], ["asse"])) # não existe
+    assert index.suggest("o") == [] and index.suggest("f") == []
+    assert index.suggest("t") == [("trigo", 1)]
+
+    await repo.delete("r1")
+    assert len(index) == 0
+
+
+class FakeUnitOfWork(UnitOfWork):
+    has_writes = False
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after_commit(self, callback):
+        self.callbacks.append(callback)
+
+    async def commit(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+    async def rollback(self):
+        self.callbacks = []
+
+
+@pytest.mark.asyncio
+async def test_index_waits_for_the_commit():
+    index = IngredientIndex()
+    unit_of_work = FakeUnitOfWork()
+    repo = IngredientIndexingRecipeRepository(FakeRecipeRepository(), index, unit_of_work)
+
+    await repo.create(Recipe("r1", "Bolo", ["ovo"], ["asse"]))
+    assert len(index) == 0
+    await unit_of_work.commit()
+    assert index.suggest("o") == [("ovo", 1)]
+
+    await repo.create(Recipe("r2", "Pão", ["trigo"], ["asse"]))
+    await unit_of_work.rollback() # escrita desfeita: não entra no índice
+    await unit_of_work.commit()
+    assert index.suggest("t") == []
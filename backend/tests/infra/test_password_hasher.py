@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from petfit.domain.services.password_hasher import PasswordHasherBusyError
+from petfit.domain.value_objects.password import Password
+from petfit.infra.password_hasher import ThreadPoolPasswordHasher
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_off_the_event_loop():
+    hasher = ThreadPoolPasswordHasher(max_workers=2, max_pending=2)
+    password = await hasher.hash("SenhaSegura123")
+    assert isinstance(password, Password)
+    assert await hasher.verify(password, "SenhaSegura123") is True
+    assert await hasher.verify(password, "SenhaErrada123") is False
+    assert hasher.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_hash_validates_plain_password():
+    hasher = ThreadPoolPasswordHasher(max_workers=1, max_pending=0)
+    with pytest.raises(ValueError):
+        await hasher.hash("curta")
+    assert hasher.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_rejects_work_beyond_capacity():
+    """Acima de max_workers + max_pending operações, a chamada falha na hora."""
+    hasher = ThreadPoolPasswordHasher(max_workers=1, max_pending=1)
+    password = Password("SenhaSegura123")
+    running = [asyncio.ensure_future(hasher.verify(password, "SenhaSegura123")) for _ in range(2)]
+    await asyncio.sleep(0)
+    with pytest.raises(PasswordHasherBusyError):
+        await hasher.verify(password, "SenhaSegura123")
+    assert await asyncio.gather(*running) == [True, True]
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from petfit.infra.cache.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "receita"
+
+    results = await asyncio.gather(*(single_flight.do("r1", load) for _ in range(10)))
+    assert results == ["receita"] * 10
+    assert calls == 1
+    assert single_flight.stats() == {"in_flight": 0, "executions": 1, "coalesced": 9}
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_not_kept():
+    single_flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(*(single_flight.do("r1", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def ok():
+        return 1
+
+    assert await single_flight.do("r1", ok) == 1
+    assert single_flight.executions == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    single_flight = SingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.02)
+        return 42
+
+    first = asyncio.ensure_future(single_flight.do("k", load))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(single_flight.do("k", load))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == 42
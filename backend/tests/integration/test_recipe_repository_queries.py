@@ -0,0 +1,327 @@
+import math
+import uuid
+from contextlib import contextmanager
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.exc import IntegrityError
+
+from petfit.domain.entities.recipe import Recipe
+from petfit.domain.entities.user import User
+from petfit.domain.services.trending import TrendingDecay
+from petfit.domain.value_objects.cursor import Cursor
+from petfit.domain.value_objects.email_vo import Email
+from petfit.domain.value_objects.password import Password
+from petfit.infra.repositories.sqlalchemy.sqlachemy_user_repository import SQLAlchemyUserRepository
+from petfit.infra.repositories.sqlalchemy.sqlalchemy_recipe_repository import SQLAlchemyRecipeRepository
+from petfit.infra.unit_of_work import SQLAlchemyUnitOfWork
+from petfit.usecases.recipe.import_recipes import ImportRecipesUseCase
+
+
+@contextmanager
+def count_statements(engine):
+    """Coleta os comandos SQL emitidos pelo engine dentro do bloco."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+def new_recipe(title="Bolo de cenoura", is_public=True):
+    return Recipe(str(uuid.uuid4()), title, ["cenoura", "ovo"], ["Misture", "Asse"], is_public)
+
+
+@pytest.fixture
+def engine(setup_engine):
+    engine, _ = setup_engine
+    return engine
+
+
+@pytest_asyncio.fixture
+async def user(db_session):
+    user = User(str(uuid.uuid4()), "Test", Email("queries@example.com"), Password("Senha12345"))
+    return await SQLAlchemyUserRepository(db_session).register(user)
+
+
+@pytest_asyncio.fixture
+async def repo(db_session):
+    await db_session.execute(text("SELECT 1")) # aquece a conexão fora da contagem
+    return SQLAlchemyRecipeRepository(db_session)
+
+
+@pytest.mark.asyncio
+async def test_create_statement_count(engine, repo):
+    with count_statements(engine) as statements:
+        await repo.create(new_recipe())
+    assert len(statements) == 2 # INSERT + refresh
+
+
+@pytest.mark.asyncio
+async def test_reads_do_not_load_favorites(engine, repo, user):
+    recipe = await repo.create(new_recipe())
+    await repo.add_favorite(user, recipe.id)
+
+    with count_statements(engine) as statements:
+        await repo.get_by_id(recipe.id)
+    assert len(statements) == 1
+
+    with count_statements(engine) as statements:
+        await repo.get_all_public_recipes()
+    assert len(statements) == 1
+
+    with count_statements(engine) as statements:
+        recipes = await repo.get_many(["inexistente", recipe.id])
+    assert [r.id for r in recipes] == [recipe.id]
+    assert len(statements) == 1
+
+    with count_statements(engine) as statements:
+        await repo.get_public_recipes_page(10)
+    assert len(statements) == 1
+
+    page = await repo.get_public_recipes_page(10, fields=("id", "title"))
+    assert page.items[0].title == recipe.title
+    assert page.items[0].instructions is None
+
+
+@pytest.mark.asyncio
+async def test_favorite_statement_counts(engine, repo, user):
+    recipe = await repo.create(new_recipe())
+
+    with count_statements(engine) as statements:
+        assert await repo.add_favorite(user, recipe.id) is True
+    assert len(statements) == 1
+
+    with count_statements(engine) as statements:
+        favorites = await repo.get_user_favorite_recipes(user)
+    assert [r.id for r in favorites] == [recipe.id]
+    assert len(statements) == 1 # JOIN direto com a tabela de associação
+
+    summary = await repo.get_user_favorite_recipes(user, fields=("id", "title"))
+    assert [(r.id, r.title, r.ingredients) for r in summary] == [(recipe.id, recipe.title, None)]
+
+    with count_statements(engine) as statements:
+        assert await repo.remove_favorite(user, recipe.id) is True
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_statement_counts(engine, db_session, repo, user):
+    recipe = await repo.create(new_recipe())
+    await repo.add_favorite(user, recipe.id)
+    db_session.expunge_all() # força o SELECT do update (sem identity map)
+
+    recipe.title = "Bolo de laranja"
+    with count_statements(engine) as statements:
+        await repo.update(recipe)
+    assert len(statements) == 3 # SELECT + UPDATE + refresh
+
+    with count_statements(engine) as statements:
+        assert await repo.delete(recipe.id) is True
+    assert len(statements) == 2 # vínculos de favoritos + receita
+
+
+@pytest.mark.asyncio
+async def test_search_public_recipes(engine, repo):
+    frango = await repo.create(Recipe(str(uuid.uuid4()), "Frango com arroz", ["frango", "arroz"], ["Cozinhe o frango"], True))
+    arroz = await repo.create(Recipe(str(uuid.uuid4()), "Arroz doce", ["arroz", "leite"], ["Cozinhe o arroz"], True))
+    await repo.create(Recipe(str(uuid.uuid4()), "Frango privado", ["frango"], ["Asse"], False))
+
+    with count_statements(engine) as statements:
+        page = await repo.search_public_recipes("frango", 10)
+    assert len(statements) == 1 # rank + snippet na mesma consulta
+    assert [hit.recipe.id for hit in page.items] == [frango.id]
+    assert "«" in page.items[0].snippet
+
+    first = await repo.search_public_recipes("arroz", 1)
+    assert len(first.items) == 1 and first.next_cursor is not None
+    second = await repo.search_public_recipes("arroz", 1, cursor=Cursor.decode(first.next_cursor))
+    assert {first.items[0].recipe.id, second.items[0].recipe.id} == {frango.id, arroz.id}
+    assert first.items[0].rank >= second.items[0].rank
+    assert second.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_find_public_recipes_by_ingredients(engine, repo):
+    completa = await repo.create(Recipe(str(uuid.uuid4()), "Frango com arroz", [" Frango ", "ARROZ", "sal"], ["Cozinhe"], True))
+    parcial = await repo.create(Recipe(str(uuid.uuid4()), "Arroz branco", ["arroz", "sal"], ["Cozinhe"], True))
+    await repo.create(Recipe(str(uuid.uuid4()), "Frango privado", ["frango", "arroz"], ["Asse"], False))
+
+    with count_statements(engine) as statements:
+        page = await repo.find_public_recipes_by_ingredients(["frango", "arroz"], True, 10)
+    assert len(statements) == 1
+    assert [m.recipe.id for m in page.items] == [completa.id]
+    assert page.items[0].matched == 2
+
+    first = await repo.find_public_recipes_by_ingredients(["frango", "arroz"], False, 1)
+    assert [m.recipe.id for m in first.items] == [completa.id]
+    second = await repo.find_public_recipes_by_ingredients(
+        ["frango", "arroz"], False, 1, cursor=Cursor.decode(first.next_cursor)
+    )
+    assert [(m.recipe.id, m.matched) for m in second.items] == [(parcial.id, 1)]
+    assert second.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_favorite_count_is_sharded_and_folded(engine, db_session, repo, user):
+    other = await SQLAlchemyUserRepository(db_session).register(
+        User(str(uuid.uuid4()), "Outro", Email("outro@example.com"), Password("Senha12345"))
+    )
+    bolo = await repo.create(new_recipe("Bolo de cenoura"))
+    pudim = await repo.create(new_recipe("Pudim"))
+    await repo.add_favorite(user, bolo.id)
+    await repo.add_favorite(other, bolo.id)
+    await repo.add_favorite(user, pudim.id)
+    assert await repo.add_favorite(user, pudim.id) is False # repetido não conta de novo
+    await repo.remove_favorite(user, pudim.id)
+
+    # Antes da consolidação o ranking só vê o valor já consolidado
+    assert [item.favorite_count for item in await repo.get_popular_recipes(10)] == [0, 0]
+
+    assert await repo.fold_favorite_counts() == 1 # o pudim somou +1 -1
+    with count_statements(engine) as statements:
+        ranking = await repo.get_popular_recipes(10)
+    assert len(statements) == 1
+    assert [(item.recipe.id, item.favorite_count) for item in ranking] == [(bolo.id, 2), (pudim.id, 0)]
+    assert ranking[0].recipe.updated_at == bolo.updated_at # o contador não muda a versão da receita
+
+
+@pytest.mark.asyncio
+async def test_trending_scores_aggregate_favorite_events(db_session, repo, user):
+    other = await SQLAlchemyUserRepository(db_session).register(
+        User(str(uuid.uuid4()), "Outro", Email("tendencia@example.com"), Password("Senha12345"))
+    )
+    bolo = await repo.create(new_recipe("Bolo de cenoura"))
+    pudim = await repo.create(new_recipe("Pudim"))
+    await repo.add_favorite(user, bolo.id)
+    await repo.add_favorite(other, bolo.id)
+    await repo.add_favorite(user, pudim.id)
+
+    decay = TrendingDecay(half_life_seconds=3600)
+    assert await repo.aggregate_favorite_events(decay, batch_size=2) == 2
+    assert await repo.aggregate_favorite_events(decay, batch_size=2) == 1
+    assert await repo.aggregate_favorite_events(decay) == 0 # o log foi consumido
+
+    scores = await repo.get_trending_scores(10)
+    assert [recipe_id for recipe_id, _ in scores] == [bolo.id, pudim.id]
+    (_, bolo_score), (_, pudim_score) = scores
+    assert bolo_score - pudim_score == pytest.approx(math.log(2), abs=1e-3) # dois favoritos valem o dobro
+
+
+@pytest.mark.asyncio
+async def test_favorites_page_by_favorite_time(engine, repo, user):
+    recipes = [await repo.create(new_recipe(f"Receita {i}")) for i in range(3)]
+    for recipe in reversed(recipes): # a receita 0 é a favoritada por último
+        await repo.add_favorite(user, recipe.id)
+
+    with count_statements(engine) as statements:
+        first = await repo.get_user_favorite_recipes_page(user, 2)
+    assert len(statements) == 1 # sem carregar o usuário
+    assert "users." not in statements[0]
+    assert [r.id for r in first.items] == [recipes[0].id, recipes[1].id]
+
+    second = await repo.get_user_favorite_recipes_page(
+        user, 2, cursor=Cursor.decode(first.next_cursor), fields=("id", "title")
+    )
+    assert [(r.id, r.title, r.ingredients) for r in second.items] == [(recipes[2].id, recipes[2].title, None)]
+    assert second.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_favorite_flags_for_a_page(engine, repo, user):
+    recipes = [await repo.create(new_recipe(f"Receita {i}")) for i in range(3)]
+    await repo.add_favorite(user, recipes[1].id)
+
+    with count_statements(engine) as statements:
+        flags = await repo.get_favorite_recipe_ids(user, [r.id for r in recipes])
+    assert flags == {recipes[1].id}
+    assert len(statements) == 1
+
+    assert await repo.is_favorite(user, recipes[1]) is True
+    assert await repo.is_favorite(user, recipes[0]) is False
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_favorites_in_one_transaction(engine, repo, user):
+    recipes = [await repo.create(new_recipe(f"Receita {i}")) for i in range(3)]
+    await repo.add_favorite(user, recipes[0].id)
+    await repo.add_favorite(user, recipes[1].id)
+
+    with count_statements(engine) as statements:
+        changes = await repo.update_favorites(user, [recipes[2].id, "inexistente", recipes[1].id], [recipes[0].id])
+    assert len(statements) == 2 # INSERT multi-linhas + DELETE (o commit é da unidade de trabalho)
+    assert changes.added == [recipes[2].id] # a 1 já era favorita; a inexistente é ignorada
+    assert changes.removed == [recipes[0].id]
+    assert await repo.get_favorite_recipe_ids(user, [r.id for r in recipes]) == {recipes[1].id, recipes[2].id}
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commits_once_or_rolls_back(setup_engine, db_session, repo, user):
+    _, async_session = setup_engine
+    unit_of_work = SQLAlchemyUnitOfWork(db_session)
+    async with unit_of_work: # os repositórios só fazem flush; o commit é do bloco
+        recipe = await repo.create(new_recipe())
+        await repo.add_favorite(user, recipe.id)
+
+    with pytest.raises(RuntimeError):
+        async with unit_of_work:
+            await repo.delete(recipe.id)
+            raise RuntimeError("falhou no meio")
+
+    async with async_session() as other:
+        other_repo = SQLAlchemyRecipeRepository(other)
+        assert await other_repo.get_by_id(recipe.id) is not None # o delete foi desfeito
+        assert await other_repo.get_favorite_recipe_ids(user, [recipe.id]) == {recipe.id}
+
+
+@pytest.mark.asyncio
+async def test_import_reports_only_the_rows_that_fail(repo):
+    existing = await repo.create(new_recipe("Já existe"))
+    duplicate = new_recipe("Duplicada")
+    duplicate.id = existing.id
+    rows = [new_recipe("Boa 1"), duplicate, new_recipe("Boa 2")]
+
+    async def numbered():
+        for index, recipe in enumerate(rows):
+            yield index, recipe
+
+    result = await ImportRecipesUseCase(repo, chunk_size=10).execute(numbered())
+    assert result.imported == 2 # o lote falhou e foi refeito linha a linha
+    assert [index for index, _ in result.errors] == [1]
+    assert "duplicate key" in result.errors[0][1]
+    assert [r.title for r in await repo.get_many([rows[0].id, rows[2].id])] == ["Boa 1", "Boa 2"]
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_user_discounts_their_favorites(db_session, repo, user):
+    users = SQLAlchemyUserRepository(db_session)
+    other = await users.register(
+        User(str(uuid.uuid4()), "Outro", Email("removido@example.com"), Password("Senha12345"))
+    )
+    bolo = await repo.create(new_recipe("Bolo de cenoura"))
+    await repo.add_favorite(user, bolo.id)
+    await repo.add_favorite(other, bolo.id)
+    await repo.fold_favorite_counts()
+
+    assert await users.delete(other.id) is True
+    await repo.fold_favorite_counts()
+    assert [(item.recipe.id, item.favorite_count) for item in await repo.get_popular_recipes(10)] == [(bolo.id, 1)]
+
+
+@pytest.mark.asyncio
+async def test_add_favorite_reports_only_a_missing_recipe_as_not_found(db_session, repo, user):
+    with pytest.raises(ValueError, match="not found"):
+        async with db_session.begin_nested():
+            await repo.add_favorite(user, str(uuid.uuid4()))
+
+    recipe = await repo.create(new_recipe())
+    ghost = User(str(uuid.uuid4()), "Ghost", Email("ghost@example.com"), Password("Senha12345"))
+    with pytest.raises(IntegrityError): # FK do usuário: não é "receita não encontrada"
+        async with db_session.begin_nested():
+            await repo.add_favorite(ghost, recipe.id)